@@ -118,16 +118,47 @@ def load_bytes(paths):
             imgs.append(f.read())
     return imgs
 
-def get_frames_for_scoring(video_path: str, workdir: str, max_images: int = 8,
-                           scene_thresh: float = 0.4, fps: str = "1/4", scale_w: int = 640):
+def extract_media(video_path: str, workdir: str, audio_path: str = None, audio_args: list = None,
+                  frames: bool = True, scene_thresh: float = 0.4, fps: str = "1/4", scale_w: int = 640):
+    """
+    Decode the video once and write everything the analysis needs from it.
+
+    A single ffmpeg run with a split filter graph writes scene-change frames
+    to workdir/sc, uniformly sampled frames to workdir/uf and, if audio_path
+    is given, the audio track (encoded with audio_args, see
+    app.stt.audio_prep.plan_speech_audio), instead of decoding the video
+    once per output. Frames are downscaled before scene detection, which is what
+    makes the scene filter cheap.
+
+    Returns:
+        (scene frame paths, uniform frame paths, audio path or None)
+    """
+    if not frames and not audio_path:
+        return [], [], None
+    cmd = ["ffmpeg", "-y", "-i", video_path]
     sc_dir = os.path.join(workdir, "sc")
-    extract_scene_frames(video_path, sc_dir, scene_thresh, scale_w)
-    sc_frames = sorted(glob.glob(os.path.join(sc_dir, "*.jpg")))
+    uf_dir = os.path.join(workdir, "uf")
+    if frames:
+        os.makedirs(sc_dir, exist_ok=True)
+        os.makedirs(uf_dir, exist_ok=True)
+        graph = (f"[0:v]scale={scale_w}:-2,split=2[sc_in][uf_in];"
+                 f"[sc_in]select=gt(scene\\,{scene_thresh})[sc];"
+                 f"[uf_in]fps={fps}[uf]")
+        cmd += ["-filter_complex", graph,
+                "-map", "[sc]", "-vsync", "vfr", "-frame_pts", "1", os.path.join(sc_dir, "sc_%010d.jpg"),
+                "-map", "[uf]", "-vsync", "vfr", "-frame_pts", "1", os.path.join(uf_dir, "uf_%010d.jpg")]
+    if audio_path:
+        cmd += ["-map", "0:a:0"] + (audio_args or ["-vn"]) + [audio_path]
+    _run_ffmpeg(cmd)
+    sc_frames = sorted(glob.glob(os.path.join(sc_dir, "*.jpg"))) if frames else []
+    uf_frames = sorted(glob.glob(os.path.join(uf_dir, "*.jpg"))) if frames else []
+    return sc_frames, uf_frames, audio_path
+
+def select_frames_for_scoring(sc_frames, uf_frames, max_images: int = 8):
+    """Prefer scene-change frames; fall back to uniform samples when there are fewer than 4."""
     candidates = list(sc_frames)
     if len(candidates) < 4:
-        uf_dir = os.path.join(workdir, "uf")
-        extract_uniform_frames(video_path, uf_dir, fps, scale_w)
-        candidates.extend(sorted(glob.glob(os.path.join(uf_dir, "*.jpg"))))
+        candidates.extend(uf_frames)
     if not candidates:
         return [], []
     chosen_paths = pick_evenly_spaced(sorted(candidates), max_images)
@@ -135,3 +166,8 @@ def get_frames_for_scoring(video_path: str, workdir: str, max_images: int = 8,
     basenames = [os.path.basename(p) for p in chosen_paths]
     return images, basenames
 
+def get_frames_for_scoring(video_path: str, workdir: str, max_images: int = 8,
+                           scene_thresh: float = 0.4, fps: str = "1/4", scale_w: int = 640):
+    sc_frames, uf_frames, _ = extract_media(video_path, workdir, scene_thresh=scene_thresh,
+                                            fps=fps, scale_w=scale_w)
+    return select_frames_for_scoring(sc_frames, uf_frames, max_images)
@@ -25,3 +25,43 @@ class DBVideoInterview(Base):
 
     def __repr__(self):
         return f"<VideoInterview(session_id={self.session_id}, user_id={self.user_id}, status={self.status})>"
+
+
+class DBVideoJob(Base):
+    """Processing job for an uploaded video interview, claimed by video workers"""
+    __tablename__ = 'video_jobs'
+
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(String, unique=True, index=True)
+    priority = Column(Integer, default=0, index=True)  # Higher runs first
+    status = Column(String, default="queued", index=True)  # queued, running, done, failed
+    stage = Column(String, default="uploaded")  # Pipeline stage reported by the worker, see video_jobs.STAGE_PROGRESS
+    progress = Column(Integer, default=0)  # Percent
+    attempts = Column(Integer, default=0)
+    worker_id = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)  # Running jobs past this are reclaimed
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<VideoJob(session_id={self.session_id}, status={self.status}, attempts={self.attempts})>"
+
+
+class DBVideoUpload(Base):
+    """Resumable (chunked) upload of an interview video"""
+    __tablename__ = 'video_uploads'
+
+    id = Column(Integer, primary_key=True, index=True)
+    upload_id = Column(String, unique=True, index=True)
+    session_id = Column(String, index=True)
+    filename = Column(String)
+    content_type = Column(String)
+    length = Column(Integer)  # Total size in bytes, declared at creation
+    offset = Column(Integer, default=0)  # Bytes received so far
+    status = Column(String, default="uploading")  # uploading, writing (chunk in progress), complete
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<VideoUpload(upload_id={self.upload_id}, offset={self.offset}/{self.length}, status={self.status})>"
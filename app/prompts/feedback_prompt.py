@@ -1,12 +1,24 @@
+from typing import List, Optional, Tuple
+
+
 def generate_final_feedback_prompt_text(
     resume: str = "",
     job_description: str = "",
     past_conversations: str = "",
-    position: str = ""
+    position: str = "",
+    question_experiences: Optional[List[Tuple[str, List[str]]]] = None
 ) -> str:
     """
     Generates a final feedback interview prompt with JSON output format.
+
+    If question_experiences (each asked question with the resume experiences
+    retrieved for it) is given, sample answers are grounded on those instead
+    of asking the model to search the whole resume.
     """
+    if question_experiences is not None:
+        return _generate_retrieved_feedback_prompt_text(
+            resume, job_description, past_conversations, position, question_experiences
+        )
 
     prompt = f"""
 You are a professional interviewer. The candidate has the following resume:
@@ -77,3 +89,59 @@ Instructions:
 9. No extra text should be included in the output, only JSON.
 """
     return prompt
+
+
+def _generate_retrieved_feedback_prompt_text(
+    resume: str,
+    job_description: str,
+    past_conversations: str,
+    position: str,
+    question_experiences: List[Tuple[str, List[str]]]
+) -> str:
+    experiences = ""
+    for i, (question, chunks) in enumerate(question_experiences, 1):
+        experiences += f"Question {i}: {question}\n"
+        if chunks:
+            experiences += "".join(f"- {chunk}\n" for chunk in chunks)
+        else:
+            experiences += "- (no closely matching experience; use the most plausible one from the resume summary)\n"
+        experiences += "\n"
+
+    sample_keys = ",\n".join(
+        f'       "sample_answer_{i}": "STAR sample answer that directly answers Question {i}"'
+        for i in range(1, len(question_experiences) + 1)
+    )
+
+    prompt = f"""
+You are a professional interviewer. Resume summary of the candidate:
+
+{resume or "— No resume provided —"}
+
+The job description is:
+
+{job_description or "— No job description provided —"}
+
+Position: {position or "— Not specified —"}
+
+Past Conversations:
+
+{past_conversations or "— No previous conversation —"}
+
+Resume experience relevant to each question:
+
+{experiences or "— No questions —"}
+Instructions:
+1. Provide **final feedback** on the candidate's interview performance: strengths, areas for improvement and a summary of their suitability for the role.
+2. For EACH question, write a sample answer using the STAR method (Situation, Task, Action, Result) that directly answers that question, built on the experience listed under it and using the question's keywords. Do not reuse the same example for different questions.
+3. Sample answers are plain text: no labels like "Sample Answer:" and no markdown.
+4. Structure the output in a single JSON object with keys:
+   {{
+       "final_feedback": "Provide the final feedback based on the candidate's performance",
+       "strengths": "Highlight key strengths in interview",
+       "areas_for_improvement": "Mention areas where the candidate can improve on answering interview questions",
+       "overall_assessment": "Summarize critically the candidate's suitability for the role",
+{sample_keys}
+   }}
+5. No extra text should be included in the output, only JSON.
+"""
+    return prompt
@@ -27,6 +27,9 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # OAuth2 password bearer token scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/token")
 
+# Same scheme for endpoints that also work anonymously (no token -> None)
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/token", auto_error=False)
+
 
 # Utility function to hash passwords
 def get_password_hash(password: str) -> str:
@@ -86,6 +89,14 @@ async def get_current_active_user(current_user: dict = Depends(get_current_user)
     return User(username=user_record.username, full_name=user_record.full_name, email=user_record.email)
 
 
+# Get current active user if a token was sent, None for anonymous requests
+async def get_optional_user(token: Optional[str] = Depends(optional_oauth2_scheme),
+                            db: Session = Depends(get_db)) -> Optional[User]:
+    if not token:
+        return None
+    return await get_current_active_user(await get_current_user(token, db), db)
+
+
 # Register new user
 @router.post("/register")
 def register(username: str, password: str, db: Session = Depends(get_db)):
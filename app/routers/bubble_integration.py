@@ -7,6 +7,8 @@ from app.services.gpt_service import gpt_service
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.gpt_result import DBGPTResult
+from app.services.resume_context import RESUME_SUMMARY_TOKENS, encode_resume_context
+from app.services.experience_retriever import relevant_experiences
 import os
 import tempfile
 import shutil
@@ -269,11 +271,17 @@ async def bubble_submit_answer(
             from app.prompts.feedback_prompt import generate_final_feedback_prompt_text
             import json
 
+            # Ground each sample answer on the resume experiences that match
+            # its question rather than sending the whole resume
+            asked = [q for q in questions_list if q.strip()]
+            experiences = relevant_experiences(parsed_resume, asked)
+
             feedback_prompt = generate_final_feedback_prompt_text(
-                resume=json.dumps(parsed_resume, indent=2),
+                resume=encode_resume_context(parsed_resume, max_tokens=RESUME_SUMMARY_TOKENS),
                 job_description=job_description,
                 past_conversations=conversation_history,
-                position=position
+                position=position,
+                question_experiences=list(zip(asked, experiences))
             )
 
             feedback_result = gpt_service.call_gpt(feedback_prompt, temperature=0.6)
@@ -330,7 +338,7 @@ async def bubble_submit_answer(
             import json
 
             next_prompt = generate_interview_prompt_text(
-                resume=json.dumps(parsed_resume, indent=2),
+                resume=encode_resume_context(parsed_resume),
                 job_description=job_description,
                 past_conversations=conversation_history,
                 position=position,
@@ -1,9 +1,14 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, HTTPException, UploadFile, File, Depends
 from pydantic import BaseModel
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from sqlalchemy.orm import Session
+from ..database import get_db
+from ..routers.auth import get_optional_user
+from ..schemas.auth import User
 from ..services.gpt_service import gpt_service
+from ..services.resume_sections import review_resume_sections
 from ..utils.prompt_utils import fill_prompt
-import PyPDF2
+from ..utils.text_extraction import extract_text
 import io
 import chardet
 
@@ -13,6 +18,7 @@ class ResumeImprovementRequest(BaseModel):
     resume_text: str
     target_role: str = ""
     experience_level: str = "mid"
+    incremental: bool = False  # Review by section, reusing feedback for sections unchanged since the user's last analysis
 
 class ImprovementSuggestion(BaseModel):
     category: str
@@ -27,10 +33,17 @@ class ResumeImprovementResponse(BaseModel):
     strengths: List[str]
 
 @router.post("/analyze", response_model=ResumeImprovementResponse)
-async def analyze_resume_for_improvement(request: ResumeImprovementRequest):
+async def analyze_resume_for_improvement(
+    request: ResumeImprovementRequest,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_user)
+):
     """
     Analyze a resume and provide detailed improvement suggestions
     """
+    if request.incremental:
+        return _analyze_incrementally(request, db, current_user.username if current_user else None)
+
     try:
         # Use the resume improvement prompt template
         prompt = fill_prompt(
@@ -83,11 +96,60 @@ async def analyze_resume_for_improvement(request: ResumeImprovementRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to analyze resume: {str(e)}")
 
+def _analyze_incrementally(
+    request: ResumeImprovementRequest,
+    db: Session,
+    user_id: Optional[str]
+) -> ResumeImprovementResponse:
+    """Build the improvement response from section reviews, reusing the user's feedback for unchanged sections."""
+    review = review_resume_sections(
+        db,
+        request.resume_text,
+        user_id=user_id,
+        target_role=request.target_role or "software engineering position",
+        experience_level=request.experience_level
+    )
+
+    improvements, strengths, scores = [], [], []
+    for section in review["sections"]:
+        category = section["section"].title()
+        for imp in section.get("improvements") or []:
+            improvements.append(ImprovementSuggestion(
+                category=category,
+                current_issue=imp.get("issue", ""),
+                suggestion=imp.get("suggestion", ""),
+                priority=imp.get("priority", "medium")
+            ))
+        strengths.extend(s for s in section.get("strengths") or [] if s not in strengths)
+        if isinstance(section.get("score"), (int, float)):
+            scores.append(float(section["score"]))
+
+    if review["raw_output"] and not improvements:
+        # Unstructured response: surface it as a single general suggestion
+        improvements.append(ImprovementSuggestion(
+            category="General",
+            current_issue="Resume needs improvement",
+            suggestion=review["raw_output"],
+            priority="medium"
+        ))
+
+    return ResumeImprovementResponse(
+        overall_score=round(sum(scores) / len(scores), 1) if scores else 7.0,
+        improvements=improvements,
+        summary=(
+            f"Reviewed {len(review['sections'])} sections: {len(review['analyzed_sections'])} analyzed, "
+            f"{len(review['reused_sections'])} unchanged since the last analysis."
+        ),
+        strengths=strengths
+    )
+
 @router.post("/upload-analyze")
 async def upload_and_analyze_resume(
     file: UploadFile = File(...),
     target_role: str = "",
-    experience_level: str = "mid"
+    experience_level: str = "mid",
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_user)
 ):
     """
     Upload a resume file and get improvement suggestions
@@ -99,11 +161,10 @@ async def upload_and_analyze_resume(
         # Extract text based on file type
         if file.filename.lower().endswith('.pdf'):
             # Extract text from PDF
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-        elif file.filename.lower().endswith(('.txt', '.doc', '.docx')):
+            text = extract_text(io.BytesIO(content), "pdf")
+        elif file.filename.lower().endswith('.docx'):
+            text = extract_text(io.BytesIO(content), "docx")
+        elif file.filename.lower().endswith(('.txt', '.doc')):
         # Attempt to detect encoding of the file content using chardet
             detected_encoding = chardet.detect(content)['encoding']
             try:
@@ -124,7 +185,7 @@ async def upload_and_analyze_resume(
             experience_level=experience_level
         )
         
-        return await analyze_resume_for_improvement(request)
+        return await analyze_resume_for_improvement(request, db, current_user)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to process uploaded resume: {str(e)}")
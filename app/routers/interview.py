@@ -9,7 +9,7 @@ from app.services.interview_simulator import InterviewSimulator
 from app.schemas.interview import InterviewSession, InterviewQuestion, UserResponse, StartInterviewSession
 from app.models.interview import DBInterviewSession, DBInterviewQuestion, DBUserResponse, DBInterviewFeedback
 from app.schemas.auth import User
-from app.routers.auth import get_current_active_user
+from app.routers.auth import get_current_active_user, get_optional_user
 from typing import Optional
 from app.database import get_db
 from sqlalchemy.orm import Session
@@ -80,18 +80,15 @@ async def get_past_interview(session_id: str, current_user: User = Depends(get_c
 
 from fastapi import status
 
-# Optional auth dependency
-async def get_optional_user(current_user: Optional[User] = Depends(get_current_active_user)) -> Optional[User]:
-    return current_user
-
 
 @router.post("/start")
 async def start_interview(
         position: str = Form(...),
         job_description: Optional[str] = Form(None),
-        file: UploadFile = File(...),  # Resume is required
+        file: Optional[UploadFile] = File(None),  # Resume upload, or
+        file_id: Optional[str] = Form(None),  # a resume stored via /api/resume/upload
         db: Session = Depends(get_db),
-        current_user: Optional[User] = None
+        current_user: Optional[User] = Depends(get_optional_user)
 ):
     """Start a new interview with resume upload"""
 
@@ -99,9 +96,13 @@ async def start_interview(
     user_id = current_user.username if current_user else "anonymous"
 
     try:
-        # Parse the resume
-        from app.utils.file_utils import parser
-        parsed_resume = parser(file)
+        # Parse the resume (or reuse the stored parse) and encode it once for
+        # every turn of this session
+        from app.services.resume_analysis import resolve_resume
+        from app.services.resume_context import cache_session_context, encode_resume_context
+        resume_context = encode_resume_context(
+            resolve_resume(db, file=file, file_id=file_id, user_id=current_user.username if current_user else None)
+        )
 
         # Auto-set difficulty and question types (user doesn't choose)
         difficulty = "medium"
@@ -123,12 +124,13 @@ async def start_interview(
         db.add(session)
         db.commit()
         db.refresh(session)
+        cache_session_context(session_id, resume_context)
 
         # Generate first question using resume context
         from app.prompts.interview_prompt import generate_interview_prompt_text
 
         prompt_template = generate_interview_prompt_text(
-            resume=json.dumps(parsed_resume, indent=2),
+            resume=resume_context,
             job_description=job_description or "",
             past_conversations="",
             position=position,
@@ -165,6 +167,8 @@ async def start_interview(
             "status": session.status,
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         print("🔥 Interview start failed:", str(e))
         raise HTTPException(
@@ -177,9 +181,10 @@ async def start_interview(
 async def submit_answer(
         question_id: str = Form(...),
         response_text: str = Form(...),
-        file: UploadFile = File(...),  # Resume for context
+        file: Optional[UploadFile] = File(None),  # Resume for context, or
+        file_id: Optional[str] = Form(None),  # a resume stored via /api/resume/upload
         db: Session = Depends(get_db),
-        current_user: Optional[User] = None
+        current_user: Optional[User] = Depends(get_optional_user)
 ):
     """Submit answer to interview question"""
 
@@ -203,9 +208,16 @@ async def submit_answer(
     db.commit()
     db.refresh(db_response)
 
-    # 4. Parse resume for context
-    from app.utils.file_utils import parser
-    parsed_resume = parser(file)
+    # 4. Resume context: cached when the session started, otherwise (e.g. a
+    # different worker process) parse and encode it again
+    from app.services.resume_context import cache_session_context, encode_resume_context, get_session_context
+    resume_context = get_session_context(session.session_id)
+    if resume_context is None:
+        from app.services.resume_analysis import resolve_resume
+        resume_context = encode_resume_context(
+            resolve_resume(db, file=file, file_id=file_id, user_id=current_user.username if current_user else None)
+        )
+        cache_session_context(session.session_id, resume_context)
 
     # 5. Build conversation history
     previous_conversation = ""
@@ -224,7 +236,7 @@ async def submit_answer(
         from app.prompts.interview_prompt import generate_interview_prompt_text
 
         next_question_prompt = generate_interview_prompt_text(
-            resume=json.dumps(parsed_resume, indent=2),
+            resume=resume_context,
             job_description=session.job_description or "",
             past_conversations=previous_conversation,
             position=session.position,
@@ -338,11 +350,11 @@ async def websocket_interview(websocket: WebSocket, session_id: str):
                 session.end_time = datetime.utcnow()
                 
                 # Generate overall feedback
-                overall_feedback = simulator.generate_overall_feedback(session)
+                overall_feedback = simulator.generate_overall_feedback(include_details=True)
                 
                 await websocket.send_json({
                     "type": "interview_complete",
-                    "feedback": overall_feedback.dict(),
+                    "feedback": overall_feedback,
                     "session_summary": {
                         "total_questions": len(session.questions),
                         "duration": (session.end_time - session.start_time).total_seconds() / 60
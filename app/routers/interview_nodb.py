@@ -9,7 +9,13 @@ from app.services.gpt_service import gpt_service
 from app.prompts.interview_prompt import generate_interview_prompt_text
 from app.prompts.feedback_prompt import generate_final_feedback_prompt_text
 
-from app.utils.file_utils import parser
+from app.services.resume_analysis import resolve_resume
+from app.services.resume_context import RESUME_SUMMARY_TOKENS, encode_resume_context
+from app.services.experience_retriever import relevant_experiences
+from app.database import get_db
+from app.routers.auth import get_optional_user
+from app.schemas.auth import User
+from sqlalchemy.orm import Session
 
 router = APIRouter()
 
@@ -31,10 +37,16 @@ async def start_interview(
         position: str = Form(...),
         job_description: Optional[str] = Form(None),
         file: Optional[UploadFile] = File(None),
+        file_id: Optional[str] = Form(None),
+        db: Session = Depends(get_db),
+        current_user: Optional[User] = Depends(get_optional_user),
 ):
     try:
-        # Parse resume (optional)
-        parse_resume = parser(file) if file else ""
+        # Parse resume (optional), or reuse one stored via /api/resume/upload
+        parse_resume = resolve_resume(
+            db, file=file, file_id=file_id, required=False,
+            user_id=current_user.username if current_user else None
+        )
 
         # Use job description from form data
         job_desc_text = job_description or ""
@@ -48,6 +60,8 @@ async def start_interview(
             "sample_answer": f"I am a professional with experience relevant to {position}. I'm interested in this position because..."
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         print("🔥 Interview start failed:", str(e))
         raise HTTPException(
@@ -64,9 +78,15 @@ async def submit_answer(
         past_answers: str = Form(""),
         answer: str = Form(...),
         file: Optional[UploadFile] = File(None),
+        file_id: Optional[str] = Form(None),
+        db: Session = Depends(get_db),
+        current_user: Optional[User] = Depends(get_optional_user),
 ):
-    # Parse resume (optional)
-    parse_resume = parser(file) if file else ""
+    # Parse resume (optional), or reuse one stored via /api/resume/upload
+    parse_resume = resolve_resume(
+        db, file=file, file_id=file_id, required=False,
+        user_id=current_user.username if current_user else None
+    )
 
     # Use job description from form data
     job_desc_text = job_description or ""
@@ -81,7 +101,7 @@ async def submit_answer(
     if len(past_answers.split("||,")) + 1 < MAX_QUESTIONS:
         # Compose prompt with parsed job description
         prompt_template = generate_interview_prompt_text(
-            json.dumps(parse_resume, indent=2),
+            encode_resume_context(parse_resume),
             job_desc_text,  # Use parsed job description
             previous_conversation,
             position,
@@ -106,13 +126,18 @@ async def get_interview_feedback(
         job_description: Optional[str] = Form(None),
         past_questions: str = Form(...),
         past_answers: str = Form(...),
-        file: UploadFile = File(...),
+        file: Optional[UploadFile] = File(None),
+        file_id: Optional[str] = Form(None),
+        db: Session = Depends(get_db),
+        current_user: Optional[User] = Depends(get_optional_user),
 ):
     """
     Get feedback for a completed interview session
     """
-    # Parse resume
-    parse_resume = parser(file)
+    # Parse resume, or reuse one stored via /api/resume/upload
+    parse_resume = resolve_resume(
+        db, file=file, file_id=file_id, user_id=current_user.username if current_user else None
+    )
 
     # Use job description from form data
     job_desc_text = job_description or ""
@@ -122,11 +147,17 @@ async def get_interview_feedback(
         previous_conversation += f"Question: {question}\nAnswer: {ans}\n"
     print(previous_conversation)
 
+    # Ground each sample answer on the resume experiences that match its
+    # question rather than sending the whole resume
+    questions = [q for q in past_questions.split("||,") if q.strip()]
+    experiences = relevant_experiences(parse_resume, questions)
+
     prompt_template = generate_final_feedback_prompt_text(
-        json.dumps(parse_resume, indent=2),
+        encode_resume_context(parse_resume, max_tokens=RESUME_SUMMARY_TOKENS),
         job_desc_text,  # Use parsed job description
         previous_conversation,
-        position
+        position,
+        question_experiences=list(zip(questions, experiences))
     )
 
     result = gpt_service.call_gpt(prompt_template, temperature=0.6)
@@ -187,11 +218,11 @@ async def websocket_interview(websocket: WebSocket, session_id: str):
                 session.end_time = datetime.utcnow()
 
                 # Generate overall feedback
-                overall_feedback = simulator.generate_overall_feedback(session)
+                overall_feedback = simulator.generate_overall_feedback(include_details=True)
 
                 await websocket.send_json({
                     "type": "interview_complete",
-                    "feedback": overall_feedback.dict(),
+                    "feedback": overall_feedback,
                     "session_summary": {
                         "total_questions": len(session.questions),
                         "duration": (session.end_time - session.start_time).total_seconds() / 60
@@ -1,8 +1,15 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 from ..services.gpt_service import gpt_service
 from ..utils.prompt_utils import fill_prompt
+from ..services.resume_analysis import get_stored_resume
+from ..services.resume_context import encode_resume_context
+from ..database import get_db
+from ..routers.auth import get_optional_user
+from ..schemas.auth import User
+from sqlalchemy.orm import Session
+import json
 import uuid
 from datetime import datetime
 
@@ -12,7 +19,8 @@ router = APIRouter()
 mock_sessions: Dict[str, Dict] = {}
 
 class MockInterviewRequest(BaseModel):
-    resume_text: str
+    resume_text: str = ""
+    file_id: Optional[str] = None  # Resume stored via /api/resume/upload, used instead of resume_text
     job_description: str = ""
     difficulty: str = "medium"
     question_count: int = 5
@@ -41,17 +49,31 @@ class MockAnswerResponse(BaseModel):
     next_question: Optional[MockQuestion] = None
 
 @router.post("/start", response_model=MockInterviewResponse)
-async def start_mock_interview(request: MockInterviewRequest):
+async def start_mock_interview(
+    request: MockInterviewRequest,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_optional_user)
+):
     """
     Start a mock interview session with AI-generated questions
     """
+    # A stored resume may be the GPT-structured dict, which the encoder
+    # condenses field by field
+    resume = request.resume_text
+    if request.file_id:
+        resume = get_stored_resume(db, request.file_id, current_user.username if current_user else None)
+        request.resume_text = resume if isinstance(resume, str) else json.dumps(resume)
+    elif not request.resume_text:
+        raise HTTPException(status_code=400, detail="Provide resume_text or a file_id from /api/resume/upload.")
+
     try:
         session_id = str(uuid.uuid4())
+        resume_context = encode_resume_context(resume)
         
         # Generate interview questions using the template
         prompt = fill_prompt(
             "interview_questions",
-            resume_json=request.resume_text,
+            resume_json=resume_context,
             job_description_text=request.job_description or "General software engineering position"
         )
         
@@ -97,6 +119,7 @@ async def start_mock_interview(request: MockInterviewRequest):
             "answers": [],
             "created_at": datetime.utcnow(),
             "resume_text": request.resume_text,
+            "resume_context": resume_context,
             "job_description": request.job_description
         }
         
@@ -1,6 +1,6 @@
 from click import prompt
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form
-from typing import List
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form, BackgroundTasks
+from typing import List, Optional
 import os
 import uuid
 import json
@@ -12,13 +12,15 @@ from app.utils.file_utils import parser
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.routers.auth import get_current_active_user
+from app.routers.auth import get_current_active_user, get_optional_user
 
 from app.schemas.auth import User
 from app.schemas.resume import ResumeAnalysisResponse
 from app.models.resume import DBResume
 
 from app.services.resume_parser import parse_resume
+from app.services.resume_analysis import get_match_index, parse_uploaded_resume, pending_analysis, resolve_resume
+from app.services.resume_sections import review_resume_sections
 from app.services.gpt_service import gpt_service
 
 router = APIRouter()
@@ -76,10 +78,18 @@ def clean_review_output(text):
 
 @router.post("/upload")
 async def upload_resume(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
+    structure_with_gpt: bool = Form(False),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
+    """
+    Store a resume and parse it in the background.
+
+    The structured result is saved in analysis_result, so other endpoints can
+    take the returned file_id instead of a new upload.
+    """
     try:
         file_extension = os.path.splitext(file.filename)[1].lower()
         if file_extension not in ['.pdf', '.docx']:
@@ -97,14 +107,18 @@ async def upload_resume(
             file_name=file.filename,
             file_path=file_path,
             user_id=current_user.username,
+            analysis_result=pending_analysis(structure_with_gpt),
         )
         db.add(resume_record)
         db.commit()
 
+        background_tasks.add_task(parse_uploaded_resume, file_id, structure_with_gpt)
+
         return {
             "file_id": file_id,
             "file_name": file.filename,
             "status": "success",
+            "analysis_status": "pending",
         }
 
     except Exception as e:
@@ -112,9 +126,14 @@ async def upload_resume(
 
 @router.post("/analyze")
 def analyze_resume(
-    file: UploadFile = File(...),
+    file: Optional[UploadFile] = File(None),
+    file_id: Optional[str] = Form(None),
+    current_user: Optional[User] = Depends(get_optional_user),
+    db: Session = Depends(get_db)
 ):
-    parsed_text = parser(file)
+    parsed_text = resolve_resume(
+        db, file=file, file_id=file_id, user_id=current_user.username if current_user else None
+    )
 
     with open("app/prompts/resume_parsing.txt", "r") as f:
         prompt_template = f.read()
@@ -123,7 +142,7 @@ def analyze_resume(
     prompt_result = gpt_service.call_gpt(prompt_template, temperature=0.3)
 
     return {
-        "file_name": file.filename,
+        "file_name": file.filename if file else file_id,
         "analysis": prompt_result
     }
 
@@ -150,13 +169,67 @@ def get_past_analysis(
         for r in resumes
     ]
 
+@router.post("/match")
+def match_resumes(
+    job_description: str = Form(...),
+    top_k: int = Form(20),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Rank the user's stored resumes against a job description locally (no GPT call).
+
+    Scores combine TF-IDF similarity with coverage of the skills the job
+    description asks for, and list matched and missing skills per resume.
+    """
+    if not job_description.strip():
+        raise HTTPException(status_code=400, detail="Job description is required.")
+
+    index = get_match_index(db, current_user.username)
+    results = index.rank(job_description, top_k=max(1, top_k))
+
+    names = dict(
+        db.query(DBResume.file_id, DBResume.file_name)
+        .filter(
+            DBResume.user_id == current_user.username,
+            DBResume.file_id.in_([r["resume_id"] for r in results])
+        )
+        .all()
+    ) if results else {}
+    for result in results:
+        result["file_name"] = names.get(result["resume_id"], "")
+
+    return {"total_resumes": len(index), "results": results}
+
+
 @router.post("/review")
 def get_resume_review(
     job_description: str = Form(""),
-    file: UploadFile = File(...),
+    file: Optional[UploadFile] = File(None),
+    file_id: Optional[str] = Form(None),
+    incremental: bool = Form(False),
+    current_user: Optional[User] = Depends(get_optional_user),
+    db: Session = Depends(get_db)
 ):
-    parsed_text = parser(file)
-    
+    parsed_text = resolve_resume(
+        db, file=file, file_id=file_id, user_id=current_user.username if current_user else None
+    )
+
+    if incremental:
+        # Section-by-section review; sections unchanged since the user's last
+        # review reuse its feedback instead of going back to GPT
+        stored = db.query(DBResume).filter(DBResume.file_id == file_id).first() if file_id else None
+        review = review_resume_sections(
+            db,
+            parsed_text,
+            user_id=current_user.username if current_user else None,
+            job_description=job_description
+        )
+        if stored:
+            stored.review = json.dumps(review)
+            db.commit()
+        return review
+
     # Compose prompt with optional job description
     with open("app/prompts/resume_improvement.txt", "r") as f:
         prompt_template = f.read()
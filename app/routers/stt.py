@@ -7,6 +7,8 @@ from fastapi import status
 from fastapi import Body
 from typing import Optional
 
+from app.stt.transcript_cache import cached_transcript
+
 router = APIRouter()
 
 @router.get("/health")
@@ -47,16 +49,19 @@ async def transcribe_audio_file(file: UploadFile):
         with open(temp_path, "wb") as out_file:
             shutil.copyfileobj(file.file, out_file)
         
-        # Transcribe using OpenAI Whisper API
-        with open(temp_path, "rb") as audio_file:
-            result = client.audio.transcriptions.create(
-                model="whisper-1",
-                file=audio_file,
-                response_format="json",
-                language="en"  # Force English language
-            )
+        # Transcribe using OpenAI Whisper API (cached by audio fingerprint)
+        def transcribe(path):
+            with open(path, "rb") as audio_file:
+                result = client.audio.transcriptions.create(
+                    model="whisper-1",
+                    file=audio_file,
+                    response_format="json",
+                    language="en"  # Force English language
+                )
+            return result.text
         
-        return {"text": result.text, "engine": "whisper-1"}
+        text = cached_transcript(temp_path, "whisper-1", transcribe, language="en")
+        return {"text": text, "engine": "whisper-1"}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
@@ -104,15 +109,19 @@ async def stt(file: UploadFile = File(...)):
             shutil.copyfileobj(file.file, out)
         await file.close()
 
-        with open(temp_path, "rb") as fh:
-            # Use OpenAI Whisper for transcription
-            result = client.audio.transcriptions.create(
-                model=MODEL,
-                file=fh,
-                response_format="json",
-                language="en"  # Force English language
-            )
-        return JSONResponse({"text": result.text, "engine": "whisper-1"})
+        def transcribe(path):
+            with open(path, "rb") as fh:
+                # Use OpenAI Whisper for transcription
+                result = client.audio.transcriptions.create(
+                    model=MODEL,
+                    file=fh,
+                    response_format="json",
+                    language="en"  # Force English language
+                )
+            return result.text
+        
+        text = cached_transcript(temp_path, MODEL, transcribe, language="en")
+        return JSONResponse({"text": text, "engine": "whisper-1"})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
     finally:
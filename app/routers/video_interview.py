@@ -1,25 +1,48 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi import (
+    APIRouter, UploadFile, File, HTTPException, Depends, Header, Query, Request, Response,
+    WebSocket, WebSocketDisconnect, status
+)
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
 import uuid
 import os
-import shutil
+import json
+import hashlib
+import asyncio
 from datetime import datetime
 
-from app.database import get_db
-from app.models.video_interview import DBVideoInterview
+from app.database import SessionLocal, get_db
+from app.models.video_interview import DBVideoInterview, DBVideoJob, DBVideoUpload
 from app.schemas.video_interview import (
     VideoInterviewCreate,
     VideoInterviewResponse,
     VideoAnalysisResult
 )
 from app.schemas.auth import User
-from app.routers.auth import get_current_active_user
-from app.services.video_analysis_service import video_analysis_service
+from app.routers.auth import get_current_active_user, get_current_user
+from app.services.video_events import (
+    TERMINAL_STATUSES, interview_result, load_session_events, video_event_broker
+)
+from app.services.video_jobs import VIDEO_WORKERS_EMBEDDED, enqueue_video_job, video_worker_pool
+from app.services.video_storage import store_stream
+from app.services.video_uploads import ALLOWED_VIDEO_TYPES, complete_upload, create_upload, write_chunk
 
 router = APIRouter()
 
+
+@router.on_event("startup")
+def start_video_workers():
+    # Analysis runs in worker processes; set VIDEO_WORKERS_EMBEDDED=false to
+    # run them separately with `python -m app.services.video_jobs`
+    if VIDEO_WORKERS_EMBEDDED:
+        video_worker_pool.start()
+
+
+@router.on_event("shutdown")
+def stop_video_workers():
+    video_worker_pool.stop()
+
 # Directory for storing uploaded videos
 UPLOAD_DIR = "static/video_interviews"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
@@ -222,7 +245,6 @@ async def start_video_interview(
 async def upload_video(
     session_id: str,
     video: UploadFile = File(...),
-    background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_active_user)
 ):
@@ -242,92 +264,169 @@ async def upload_video(
         raise HTTPException(status_code=403, detail="Not authorized to upload to this session")
     
     # Validate file type
-    allowed_types = ["video/mp4", "video/webm", "video/quicktime", "video/x-msvideo"]
-    if video.content_type not in allowed_types:
+    if video.content_type not in ALLOWED_VIDEO_TYPES:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file type. Allowed types: {', '.join(allowed_types)}"
+            detail=f"Invalid file type. Allowed types: {', '.join(ALLOWED_VIDEO_TYPES)}"
         )
     
-    # Save video file
+    # Save video file (stored by content, so identical uploads are kept once);
+    # copying and hashing it runs in a thread, off the event loop
     file_extension = video.filename.split('.')[-1]
-    filename = f"{session_id}.{file_extension}"
-    file_path = os.path.join(UPLOAD_DIR, filename)
     
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(video.file, buffer)
+        file_path = await asyncio.to_thread(store_stream, video.file, file_extension)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to save video: {str(e)}")
     
-    # Update database
+    _start_processing(db, video_interview, file_path)
+    
+    return {
+        "message": "Video uploaded successfully",
+        "session_id": session_id,
+        "status": "processing"
+    }
+
+
+def _start_processing(db: Session, video_interview: DBVideoInterview, file_path: str):
+    """Attach the uploaded video to its session and queue it for the video workers."""
     video_interview.video_path = file_path
     video_interview.status = "processing"
     db.commit()
     
-    # Process video in background
-    if background_tasks:
-        background_tasks.add_task(
-            process_video_interview,
-            session_id=session_id,
-            video_path=file_path,
-            question=video_interview.question_text,
-            position=video_interview.position,
-            db=db
-        )
+    # Analysis happens in the worker processes, not the web process
+    enqueue_video_job(db, video_interview.session_id)
+
+
+def _get_upload(db: Session, upload_id: str, current_user: Optional[User]) -> DBVideoUpload:
+    upload = db.query(DBVideoUpload).filter(DBVideoUpload.upload_id == upload_id).first()
+    if not upload:
+        raise HTTPException(status_code=404, detail="Upload not found")
     
+    # Verify user ownership if authenticated
+    if current_user:
+        video_interview = db.query(DBVideoInterview).filter(
+            DBVideoInterview.session_id == upload.session_id
+        ).first()
+        if not video_interview or video_interview.user_id != current_user.username:
+            raise HTTPException(status_code=403, detail="Not authorized to access this upload")
+    return upload
+
+
+def _upload_headers(upload: DBVideoUpload) -> dict:
     return {
-        "message": "Video uploaded successfully",
-        "session_id": session_id,
-        "status": "processing"
+        "Upload-Offset": str(upload.offset),
+        "Upload-Length": str(upload.length),
+        "Cache-Control": "no-store"
     }
 
 
-async def process_video_interview(
+@router.post("/upload/{session_id}/resumable", status_code=201)
+async def create_resumable_upload(
     session_id: str,
-    video_path: str,
-    question: str,
-    position: str,
-    db: Session
+    request: Request,
+    response: Response,
+    filename: str,
+    content_type: str,
+    upload_length: int = Header(...),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_active_user)
 ):
     """
-    Background task to process video interview
+    Start a resumable upload for a session's video.
+    
+    Use this instead of /upload/{session_id} for large recordings or
+    unreliable connections:
+    
+    1. POST /upload/{session_id}/resumable?filename=answer.mp4&content_type=video/mp4
+       with header Upload-Length: <total bytes>; returns the upload_id and
+       its URL (also in the Location header)
+    2. PATCH /uploads/{upload_id} with the next chunk as the raw body and
+       header Upload-Offset: <offset the chunk starts at>, optionally
+       Upload-Checksum: "sha256 <base64 digest of the chunk>"
+    3. After an error, HEAD /uploads/{upload_id} returns the Upload-Offset
+       to resume from
+    
+    Processing starts automatically when the last chunk arrives.
     """
-    try:
-        # Analyze the video
-        analysis_result = video_analysis_service.analyze_video_interview(
-            video_path=video_path,
-            question=question,
-            position=position
-        )
-        
-        # Update database with results
+    video_interview = db.query(DBVideoInterview).filter(
+        DBVideoInterview.session_id == session_id
+    ).first()
+    
+    if not video_interview:
+        raise HTTPException(status_code=404, detail="Video interview session not found")
+    
+    # Verify user ownership if authenticated
+    if current_user and video_interview.user_id != current_user.username:
+        raise HTTPException(status_code=403, detail="Not authorized to upload to this session")
+    
+    upload = create_upload(db, session_id, filename, content_type, upload_length)
+    location = str(request.url_for("upload_video_chunk", upload_id=upload.upload_id))
+    response.headers.update(_upload_headers(upload))
+    response.headers["Location"] = location
+    
+    return {
+        "upload_id": upload.upload_id,
+        "session_id": session_id,
+        "upload_url": location,
+        "offset": upload.offset,
+        "length": upload.length
+    }
+
+
+@router.head("/uploads/{upload_id}")
+async def get_upload_offset(
+    upload_id: str,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_active_user)
+):
+    """
+    Return how much of a resumable upload has been received (Upload-Offset header).
+    """
+    upload = _get_upload(db, upload_id, current_user)
+    return Response(status_code=200, headers=_upload_headers(upload))
+
+
+@router.patch("/uploads/{upload_id}", name="upload_video_chunk")
+async def upload_video_chunk(
+    upload_id: str,
+    request: Request,
+    response: Response,
+    upload_offset: int = Header(...),
+    upload_checksum: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_active_user)
+):
+    """
+    Append the next chunk (raw request body) to a resumable upload.
+    
+    Returns 409 with the current offset if Upload-Offset is stale and 460
+    if the chunk's checksum doesn't match; in both cases nothing is stored
+    and the chunk can be resent. The last chunk starts processing.
+    """
+    upload = _get_upload(db, upload_id, current_user)
+    upload = await write_chunk(db, upload, upload_offset, request.stream(), upload_checksum)
+    
+    complete = upload.offset == upload.length
+    if complete:
         video_interview = db.query(DBVideoInterview).filter(
-            DBVideoInterview.session_id == session_id
+            DBVideoInterview.session_id == upload.session_id
         ).first()
+        if not video_interview:
+            raise HTTPException(status_code=404, detail="Video interview session not found")
         
-        if video_interview:
-            if analysis_result.get("success"):
-                video_interview.transcript = analysis_result.get("transcript", "")
-                video_interview.feedback = analysis_result.get("feedback", "")
-                video_interview.scores = analysis_result.get("scores", {})
-                video_interview.analysis = analysis_result.get("analysis", {})
-                video_interview.status = "completed"
-            else:
-                video_interview.status = "failed"
-                video_interview.feedback = analysis_result.get("error", "Analysis failed")
-            
-            db.commit()
+        file_path = await complete_upload(db, upload)
+        _start_processing(db, video_interview, file_path)
     
-    except Exception as e:
-        print(f"Error processing video interview: {e}")
-        video_interview = db.query(DBVideoInterview).filter(
-            DBVideoInterview.session_id == session_id
-        ).first()
-        if video_interview:
-            video_interview.status = "failed"
-            video_interview.feedback = f"Processing error: {str(e)}"
-            db.commit()
+    response.headers.update(_upload_headers(upload))
+    return {
+        "upload_id": upload.upload_id,
+        "session_id": upload.session_id,
+        "offset": upload.offset,
+        "length": upload.length,
+        "complete": complete,
+        "status": "processing" if complete else "uploading"
+    }
 
 
 @router.get("/status/{session_id}")
@@ -404,17 +503,7 @@ async def get_video_interview_results(
         raise HTTPException(status_code=403, detail="Not authorized to view this session")
     
     # Return results regardless of status
-    result = {
-        "session_id": video_interview.session_id,
-        "question": video_interview.question_text,
-        "position": video_interview.position,
-        "status": video_interview.status,
-        "transcript": video_interview.transcript or "",
-        "feedback": video_interview.feedback or "",
-        "scores": video_interview.scores or {},
-        "analysis": video_interview.analysis or {},
-        "created_at": video_interview.created_at
-    }
+    result = interview_result(video_interview)
     
     # Add status-specific messages
     if video_interview.status == "processing":
@@ -457,52 +546,82 @@ async def get_user_video_interview_history(
     }
 
 
-@router.post("/results/batch")
-async def get_batch_video_interview_results(
-    session_ids: List[str],
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_current_active_user)
-):
-    """
-    Get results for multiple video interview sessions at once.
-    
-    Useful for fetching all 5 question results together.
-    
-    Bubble.io Usage:
-    - API Call: POST /api/video-interview/results/batch
-    - Content-Type: application/json
-    - Body: {"session_ids": ["id1", "id2", "id3", "id4", "id5"]}
+# Longest wait_until_complete long-poll, in seconds
+MAX_BATCH_WAIT_SECONDS = 60
+
+
+async def _wait_for_status_change(statuses: dict, timeout: float) -> None:
+    """Return once any of the sessions changes status, or after timeout seconds."""
+    session_ids = list(statuses)
+    queue = video_event_broker.subscribe(session_ids, {})
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return
+            if event["status"] != statuses.get(event["session_id"]):
+                return
+    finally:
+        video_event_broker.unsubscribe(queue, session_ids)
+
+
+def _load_batch_states(db: Session, session_ids: List[str]) -> dict:
+    # Cheap per-session state: status plus the job's stage and last update.
+    # Results are written together with the completed status, so this
+    # changes whenever the full batch response would.
+    rows = db.query(
+        DBVideoInterview.session_id,
+        DBVideoInterview.user_id,
+        DBVideoInterview.status,
+        DBVideoJob.stage,
+        DBVideoJob.updated_at
+    ).outerjoin(
+        DBVideoJob, DBVideoJob.session_id == DBVideoInterview.session_id
+    ).filter(DBVideoInterview.session_id.in_(session_ids)).all()
+    return {row.session_id: row for row in rows}
+
+
+def _batch_etag(states: dict, session_ids: List[str], current_user: Optional[User]) -> str:
+    fingerprint = [current_user.username if current_user else None]
+    for session_id in session_ids:
+        state = states.get(session_id)
+        fingerprint.append(
+            [session_id, state.user_id, state.status, state.stage, state.updated_at]
+            if state else [session_id, None]
+        )
+    digest = hashlib.sha256(json.dumps(fingerprint, default=str).encode()).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def _load_batch_results(db: Session, session_ids: List[str], current_user: Optional[User]) -> dict:
+    # One IN (...) query for all sessions, loading only the columns returned
+    rows = db.query(
+        DBVideoInterview.session_id,
+        DBVideoInterview.user_id,
+        DBVideoInterview.question_text,
+        DBVideoInterview.position,
+        DBVideoInterview.status,
+        DBVideoInterview.transcript,
+        DBVideoInterview.feedback,
+        DBVideoInterview.scores,
+        DBVideoInterview.analysis,
+        DBVideoInterview.created_at
+    ).filter(DBVideoInterview.session_id.in_(session_ids)).all()
+    by_id = {row.session_id: row for row in rows}
     
-    Returns:
-    {
-      "total": 5,
-      "completed": 3,
-      "processing": 2,
-      "failed": 0,
-      "all_completed": false,
-      "results": [
-        {
-          "session_id": "...",
-          "question_number": 1,
-          "question": "...",
-          "status": "completed",
-          "transcript": "...",
-          "feedback": "...",
-          "scores": {...}
-        },
-        ...
-      ]
-    }
-    """
     results = []
     completed_count = 0
     processing_count = 0
     failed_count = 0
     
     for session_id in session_ids:
-        video_interview = db.query(DBVideoInterview).filter(
-            DBVideoInterview.session_id == session_id
-        ).first()
+        video_interview = by_id.get(session_id)
         
         if not video_interview:
             results.append({
@@ -523,19 +642,6 @@ async def get_batch_video_interview_results(
             failed_count += 1
             continue
         
-        # Add result
-        result = {
-            "session_id": video_interview.session_id,
-            "question": video_interview.question_text,
-            "position": video_interview.position,
-            "status": video_interview.status,
-            "transcript": video_interview.transcript or "",
-            "feedback": video_interview.feedback or "",
-            "scores": video_interview.scores or {},
-            "analysis": video_interview.analysis or {},
-            "created_at": video_interview.created_at
-        }
-        
         # Count statuses
         if video_interview.status == "completed":
             completed_count += 1
@@ -544,7 +650,7 @@ async def get_batch_video_interview_results(
         elif video_interview.status == "failed":
             failed_count += 1
         
-        results.append(result)
+        results.append(interview_result(video_interview))
     
     return {
         "total": len(session_ids),
@@ -556,6 +662,242 @@ async def get_batch_video_interview_results(
     }
 
 
+@router.post("/results/batch")
+async def get_batch_video_interview_results(
+    session_ids: List[str],
+    request: Request,
+    wait_until_complete: bool = False,
+    timeout: float = Query(25.0, ge=0, le=MAX_BATCH_WAIT_SECONDS),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_active_user)
+):
+    """
+    Get results for multiple video interview sessions at once.
+    
+    Useful for fetching all 5 question results together. All sessions are
+    loaded with a single query.
+    
+    Long-poll: with ?wait_until_complete=true the request is held while
+    sessions are still pending or processing, and returns as soon as any
+    of them changes status (or after ?timeout= seconds, default 25).
+    
+    Responses carry an ETag, derived from each session's status and job
+    progress; send it back as If-None-Match and an unchanged batch
+    returns 304 with no body, without loading the results.
+    
+    Bubble.io Usage:
+    - API Call: POST /api/video-interview/results/batch?wait_until_complete=true
+    - Content-Type: application/json
+    - Body: {"session_ids": ["id1", "id2", "id3", "id4", "id5"]}
+    
+    Returns:
+    {
+      "total": 5,
+      "completed": 3,
+      "processing": 2,
+      "failed": 0,
+      "all_completed": false,
+      "results": [
+        {
+          "session_id": "...",
+          "question_number": 1,
+          "question": "...",
+          "status": "completed",
+          "transcript": "...",
+          "feedback": "...",
+          "scores": {...}
+        },
+        ...
+      ]
+    }
+    """
+    states = _load_batch_states(db, session_ids)
+    
+    if wait_until_complete:
+        waiting = {
+            session_id: state.status for session_id, state in states.items()
+            if state.status in ("pending", "processing")
+            and not (current_user and state.user_id != current_user.username)
+        }
+        if waiting:
+            # Release the pooled connection while the request is held
+            db.close()
+            await _wait_for_status_change(waiting, timeout)
+            states = _load_batch_states(db, session_ids)
+    
+    # Answer a matching If-None-Match before loading the full results
+    etag = _batch_etag(states, session_ids, current_user)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    body = json.dumps(_load_batch_results(db, session_ids, current_user), default=str)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+# Seconds between SSE keep-alive comments while nothing changes
+EVENTS_KEEPALIVE_SECONDS = 15
+WS_AUTH_TIMEOUT_SECONDS = 10
+
+
+def _initial_events(db: Session, session_ids: List[str], current_user: Optional[User]) -> dict:
+    """Current events for a subscription; sessions that don't exist get a not_found event."""
+    if current_user:
+        owners = db.query(DBVideoInterview.session_id, DBVideoInterview.user_id).filter(
+            DBVideoInterview.session_id.in_(session_ids)
+        ).all()
+        if any(user_id != current_user.username for _, user_id in owners):
+            raise HTTPException(status_code=403, detail="Not authorized to view these sessions")
+    
+    events = load_session_events(db, session_ids)
+    for session_id in session_ids:
+        if session_id not in events:
+            events[session_id] = {"session_id": session_id, "status": "not_found", "stage": "not_found", "progress": 0}
+    return events
+
+
+async def _session_events(session_ids: List[str], initial: dict, is_disconnected=None):
+    """
+    Yield the current event of every session, then each change until all
+    sessions have completed or failed (None is yielded as a keep-alive).
+    """
+    queue = video_event_broker.subscribe(session_ids, initial)
+    waiting = {
+        session_id for session_id, event in initial.items()
+        if event["status"] not in TERMINAL_STATUSES and event["status"] != "not_found"
+    }
+    try:
+        for event in initial.values():
+            yield event
+        while waiting:
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout=EVENTS_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                if is_disconnected and await is_disconnected():
+                    return
+                yield None
+                continue
+            yield event
+            if event["status"] in TERMINAL_STATUSES:
+                waiting.discard(event["session_id"])
+    finally:
+        video_event_broker.unsubscribe(queue, session_ids)
+
+
+def _event_stream_response(request: Request, session_ids: List[str], initial: dict) -> StreamingResponse:
+    async def stream():
+        async for event in _session_events(session_ids, initial, request.is_disconnected):
+            if event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"data: {json.dumps(event, default=str)}\n\n"
+        yield "event: done\ndata: {}\n\n"
+    
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/events")
+async def stream_video_interview_events(
+    request: Request,
+    session_ids: List[str] = Query(...),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_active_user)
+):
+    """
+    Server-Sent Events stream of processing updates for several sessions.
+    
+    Replaces polling /status and /results/batch: one subscription receives
+    every stage change of every session.
+    
+    Bubble.io Usage:
+    - GET /api/video-interview/events?session_ids=id1&session_ids=id2
+    - Each message is JSON: {"session_id", "status", "stage", "progress"}
+      where stage is uploaded, started, audio_extracted, transcribed,
+      analysed, completed or failed and progress is a percentage.
+      Completed sessions include "result" (same fields as /results),
+      failed ones "error".
+    - A final "done" event is sent once every session has completed or
+      failed, and the stream closes.
+    """
+    initial = _initial_events(db, session_ids, current_user)
+    return _event_stream_response(request, session_ids, initial)
+
+
+@router.get("/events/{session_id}")
+async def stream_video_interview_session_events(
+    session_id: str,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_active_user)
+):
+    """
+    Server-Sent Events stream of processing updates for one session (see /events).
+    """
+    initial = _initial_events(db, [session_id], current_user)
+    if initial[session_id]["status"] == "not_found":
+        raise HTTPException(status_code=404, detail="Video interview session not found")
+    return _event_stream_response(request, [session_id], initial)
+
+
+async def _websocket_user(websocket: WebSocket, token: Optional[str], db: Session) -> User:
+    """
+    User of an accepted socket, from the ?token= query parameter or a first
+    {"token": "..."} message (browsers can't send an Authorization header).
+    """
+    if not token:
+        try:
+            message = await asyncio.wait_for(websocket.receive_json(), timeout=WS_AUTH_TIMEOUT_SECONDS)
+        except (asyncio.TimeoutError, ValueError):
+            message = None
+        token = message.get("token") if isinstance(message, dict) else None
+        if not token:
+            raise HTTPException(status_code=401, detail="Not authenticated")
+    return await get_current_active_user(await get_current_user(token, db), db)
+
+
+@router.websocket("/ws/events")
+async def video_interview_events_websocket(
+    websocket: WebSocket,
+    session_ids: List[str] = Query(...),
+    token: Optional[str] = Query(None)
+):
+    """
+    WebSocket alternative to /events: sends the same JSON events, then
+    {"type": "done"} once every session has completed or failed, and closes.
+    
+    Authenticate with the access token as ?token=... or as a first
+    {"token": "..."} message; the socket is closed with code 1008 if the
+    token is missing or invalid, or a session belongs to another user.
+    """
+    await websocket.accept()
+    db = SessionLocal()
+    try:
+        current_user = await _websocket_user(websocket, token, db)
+        initial = _initial_events(db, session_ids, current_user)
+    except HTTPException as e:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(e.detail))
+        return
+    except WebSocketDisconnect:
+        return
+    finally:
+        db.close()
+    
+    try:
+        async for event in _session_events(session_ids, initial):
+            if event is None:
+                # Also notices clients that went away
+                await websocket.send_json({"type": "keep-alive"})
+            else:
+                await websocket.send_text(json.dumps(event, default=str))
+        await websocket.send_json({"type": "done"})
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+
+
 @router.delete("/delete/{session_id}")
 async def delete_video_interview(
     session_id: str,
@@ -576,14 +918,8 @@ async def delete_video_interview(
     if video_interview.user_id != current_user.username:
         raise HTTPException(status_code=403, detail="Not authorized to delete this session")
     
-    # Delete video file if exists
-    if video_interview.video_path and os.path.exists(video_interview.video_path):
-        try:
-            os.remove(video_interview.video_path)
-        except Exception as e:
-            print(f"Error deleting video file: {e}")
-    
-    # Delete database record
+    # Delete database record; the video file may be shared with other
+    # sessions, so video storage GC removes it once nothing refers to it
     db.delete(video_interview)
     db.commit()
     
@@ -0,0 +1,238 @@
+"""
+Local retrieval of resume experiences relevant to interview questions.
+
+The resume is split into experience chunks (one role, project or activity
+each) and every question is scored against them with BM25, so the final
+feedback prompt only needs the few chunks that match each question instead
+of the whole resume.
+"""
+import math
+import logging
+from collections import Counter
+from typing import Any, Dict, List, Union
+
+from app.services.resume_matcher import TOKEN_PATTERN
+from app.services.resume_parser import (
+    BULLET_PATTERN, DATE_PATTERN, EDUCATION_HEADERS, SKILL_HEADERS, SUMMARY_HEADERS
+)
+from app.services.resume_sections import HEADER_SECTION, split_resume_sections
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# BM25 parameters
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Chunks per question passed to the prompt
+TOP_EXPERIENCES = 2
+
+# Score multiplier for a chunk already used as the best match of an earlier
+# question, so different questions tend to get different examples
+REUSE_PENALTY = 0.5
+
+MAX_CHUNK_CHARS = 600
+
+# A line this short right before a dated line is taken as that entry's title
+MAX_TITLE_CHARS = 100
+
+# Sections that describe the candidate rather than things they did
+NON_EXPERIENCE_SECTIONS = set(SUMMARY_HEADERS + SKILL_HEADERS + EDUCATION_HEADERS + [HEADER_SECTION])
+
+# Only function words: unlike the job-description matcher's list, words like
+# "team", "work", "experience" and "years" are what behavioural questions
+# and the stories answering them share
+STOP_WORDS = frozenset("""
+a an and are as at be been by for from has have had in into is it its of on or our that the their this
+to was were will with we you your i my me he she they them who what which while about than then also
+can could would should may might do did does how when where why tell describe give example time
+""".split())
+
+
+def _stem(token: str) -> str:
+    # Crude suffix folding; enough to match "learned"/"learning" with "learn"
+    # and "projects" with "project"
+    for suffix in ("ing", "ed"):
+        if len(token) > len(suffix) + 3 and token.endswith(suffix):
+            return token[:-len(suffix)]
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def _terms(text: str) -> List[str]:
+    return [_stem(t) for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOP_WORDS]
+
+
+def _pack(lines: List[str]) -> List[str]:
+    """Join an entry's lines, splitting it at line boundaries if it exceeds MAX_CHUNK_CHARS."""
+    chunks, current = [], ""
+    for line in lines:
+        line = line[:MAX_CHUNK_CHARS]
+        if current and len(current) + 1 + len(line) > MAX_CHUNK_CHARS:
+            chunks.append(current)
+            current = ""
+        current = f"{current} {line}" if current else line
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _chunk_lines(lines: List[str]) -> List[str]:
+    """
+    Group section lines into entries.
+
+    An entry is a heading line followed by its bullets. Without bullets (or
+    blank lines) between entries, a second line carrying a date range starts
+    the next entry, taking the short title line right before it along.
+    Entries too long for one chunk are split rather than truncated.
+    """
+    entries, current = [], []
+    has_bullets = has_date = last_is_title = False
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            if has_bullets:
+                entries.append(current)
+                current, has_bullets, has_date = [], False, False
+            continue
+        is_bullet = bool(BULLET_PATTERN.match(stripped))
+        is_dated = not is_bullet and bool(DATE_PATTERN.search(stripped))
+        if not is_bullet and has_bullets:
+            # A new heading after bullets starts the next entry
+            entries.append(current)
+            current, has_bullets, has_date = [], False, False
+        elif is_dated and has_date:
+            # A second dated heading starts the next entry
+            title = []
+            if len(current) > 1 and last_is_title and len(current[-1]) <= MAX_TITLE_CHARS:
+                title = [current.pop()]
+            entries.append(current)
+            current, has_bullets, has_date = title, False, False
+        current.append(BULLET_PATTERN.sub("", stripped))
+        last_is_title = not is_bullet and not is_dated
+        has_bullets = has_bullets or is_bullet
+        has_date = has_date or is_dated
+    if current:
+        entries.append(current)
+    return [chunk for entry in entries if entry for chunk in _pack(entry)]
+
+
+def split_experience_chunks(resume: Union[str, Dict[str, Any], None]) -> List[str]:
+    """
+    Split a resume into experience chunks.
+
+    Args:
+        resume: Resume text, ResumeParser output or a structured resume dict
+
+    Returns:
+        One string per role, project or activity, in document order
+    """
+    if not resume:
+        return []
+
+    if isinstance(resume, dict):
+        if "raw_text" in resume:
+            resume = resume.get("raw_text") or ""
+        else:
+            # Structured resume: every object inside a list is one entry
+            chunks = []
+            for key, value in resume.items():
+                if str(key).lower() in NON_EXPERIENCE_SECTIONS or not isinstance(value, list):
+                    continue
+                for item in value:
+                    if isinstance(item, dict):
+                        text = " ".join(
+                            " ".join(map(str, v)) if isinstance(v, list) else str(v)
+                            for v in item.values() if v
+                        )
+                    else:
+                        text = str(item)
+                    if text.strip():
+                        chunks.append(text[:MAX_CHUNK_CHARS])
+            return chunks
+
+    sections = split_resume_sections(resume)
+    chunks = []
+    for name, content in sections:
+        if name.split(" #")[0] not in NON_EXPERIENCE_SECTIONS:
+            chunks.extend(_chunk_lines(content.split("\n")))
+    if not chunks:
+        # No recognised experience section: fall back to paragraphs
+        chunks = _chunk_lines(resume.split("\n"))
+    return chunks
+
+
+class ExperienceRetriever:
+    """BM25 index over a resume's experience chunks."""
+
+    def __init__(self, chunks: List[str]):
+        self.chunks = chunks
+        self.chunk_terms = [Counter(_terms(chunk)) for chunk in chunks]
+        self.lengths = [sum(terms.values()) for terms in self.chunk_terms]
+        self.avg_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+
+        document_frequency: Counter = Counter()
+        for terms in self.chunk_terms:
+            document_frequency.update(terms.keys())
+        n = len(chunks)
+        self.idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+
+    def score(self, query: str) -> List[float]:
+        """BM25 score of every chunk for the query."""
+        query_terms = set(_terms(query))
+        scores = []
+        for terms, length in zip(self.chunk_terms, self.lengths):
+            score = 0.0
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / self.avg_length) if self.avg_length else BM25_K1
+            for term in query_terms:
+                tf = terms.get(term)
+                if tf:
+                    score += self.idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+            scores.append(score)
+        return scores
+
+    def top_for_questions(self, questions: List[str], k: int = TOP_EXPERIENCES) -> List[List[str]]:
+        """
+        Return the k most relevant chunks for each question.
+
+        Chunks that were the best match of an earlier question are scored
+        down, so the same story isn't suggested for every answer. Chunks
+        that share no terms with a question are never returned.
+        """
+        used = set()
+        results = []
+        for question in questions:
+            scores = self.score(question)
+            adjusted = [s * REUSE_PENALTY if i in used else s for i, s in enumerate(scores)]
+            ranked = [i for i in sorted(range(len(scores)), key=lambda i: -adjusted[i]) if scores[i] > 0][:k]
+            if ranked:
+                used.add(ranked[0])
+            results.append([self.chunks[i] for i in ranked])
+        return results
+
+
+def relevant_experiences(
+    resume: Union[str, Dict[str, Any], None],
+    questions: List[str],
+    k: int = TOP_EXPERIENCES
+) -> List[List[str]]:
+    """
+    Find the resume experiences most relevant to each interview question.
+
+    Args:
+        resume: Resume text, ResumeParser output or a structured resume dict
+        questions: Questions asked in the interview, in order
+        k: Chunks to return per question
+
+    Returns:
+        One list of experience chunks per question (possibly empty)
+    """
+    chunks = split_experience_chunks(resume)
+    if not chunks:
+        return [[] for _ in questions]
+    return ExperienceRetriever(chunks).top_for_questions(questions, k)
@@ -1,10 +1,12 @@
 import random
 import json
+import zlib
 import logging
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from enum import Enum
 import os
+from collections import Counter
 from dotenv import load_dotenv
 from .gpt_service import gpt_service
 
@@ -29,6 +31,104 @@ class DifficultyLevel(str, Enum):
     HARD = "hard"
     EXPERT = "expert"
 
+# Answers scoring below this are counted towards a weak area
+WEAK_SCORE_THRESHOLD = 0.5
+
+# Free-text feedback fields at least this long are kept zlib-compressed
+COMPRESS_MIN_CHARS = 256
+
+
+def _pack_text(value: Any) -> Any:
+    if isinstance(value, str) and len(value) >= COMPRESS_MIN_CHARS:
+        return zlib.compress(value.encode("utf-8"))
+    return value
+
+
+def _unpack_text(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+class FeedbackRecord:
+    """
+    Compact per-answer feedback entry kept by the simulator.
+
+    Only the fields needed for summaries and the detailed feedback listing
+    are stored, long answer and feedback texts compressed (they are only
+    read back for the detailed listing); use ``to_dict`` to get the
+    original dictionary shape back.
+    """
+
+    __slots__ = (
+        "question_id",
+        "question_text",
+        "question_type",
+        "_user_response",
+        "score",
+        "strengths",
+        "areas_for_improvement",
+        "_detailed_feedback",
+        "_suggested_response",
+        "time_taken",
+        "confidence_level",
+        "timestamp",
+    )
+
+    def __init__(
+        self,
+        question: Dict[str, Any],
+        feedback_data: Dict[str, Any],
+        user_response: str,
+        time_taken: Optional[float] = None,
+        confidence_level: Optional[float] = None
+    ):
+        self.question_id = question.get("question_id")
+        self.question_text = question.get("text")
+        self.question_type = question.get("question_type") or "general"
+        self._user_response = _pack_text(user_response)
+        try:
+            self.score = float(feedback_data.get("score", 0) or 0)
+        except (TypeError, ValueError):
+            self.score = 0.0
+        self.strengths = tuple(feedback_data.get("strengths") or ())
+        self.areas_for_improvement = tuple(feedback_data.get("areas_for_improvement") or ())
+        self._detailed_feedback = _pack_text(feedback_data.get("detailed_feedback", ""))
+        self._suggested_response = _pack_text(feedback_data.get("suggested_response", ""))
+        self.time_taken = time_taken
+        self.confidence_level = confidence_level
+        self.timestamp = datetime.utcnow().isoformat()
+
+    @property
+    def user_response(self) -> str:
+        return _unpack_text(self._user_response)
+
+    @property
+    def detailed_feedback(self) -> Any:
+        return _unpack_text(self._detailed_feedback)
+
+    @property
+    def suggested_response(self) -> Any:
+        return _unpack_text(self._suggested_response)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the feedback in the dictionary format used by the API."""
+        return {
+            "strengths": list(self.strengths),
+            "areas_for_improvement": list(self.areas_for_improvement),
+            "score": self.score,
+            "detailed_feedback": self.detailed_feedback,
+            "suggested_response": self.suggested_response,
+            "question_id": self.question_id,
+            "question_text": self.question_text,
+            "question_type": self.question_type,
+            "user_response": self.user_response,
+            "time_taken": self.time_taken,
+            "confidence_level": self.confidence_level,
+            "timestamp": self.timestamp
+        }
+
+
 class InterviewSimulator:
     """
     A class to simulate interviews and provide feedback.
@@ -90,7 +190,15 @@ class InterviewSimulator:
         self.resume_data = resume_data or {}
         self.questions_asked = []
         self.responses = []
-        self.feedback = []
+        self.feedback: List[FeedbackRecord] = []
+
+        # Running aggregates, updated once per answer so summaries never
+        # have to walk the stored feedback again
+        self._score_sum = 0.0
+        self._score_count = 0
+        self._strength_counts: Counter = Counter()
+        self._improvement_counts: Counter = Counter()
+        self._weak_areas = set()
         
         # Load question bank
         self.question_bank = self._load_question_bank()
@@ -316,19 +424,26 @@ class InterviewSimulator:
                 # Fallback to string parsing
                 feedback_data = self._parse_feedback(str(result))
             
+            # Store the feedback and fold it into the running aggregates
+            record = FeedbackRecord(
+                question,
+                feedback_data,
+                user_response,
+                time_taken=time_taken,
+                confidence_level=confidence_level
+            )
+            self._record_feedback(record)
+
             # Add metadata
             feedback_data.update({
-                "question_id": question["question_id"],
-                "question_text": question["text"],
+                "question_id": record.question_id,
+                "question_text": record.question_text,
                 "user_response": user_response,
                 "time_taken": time_taken,
                 "confidence_level": confidence_level,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": record.timestamp
             })
             
-            # Store the feedback
-            self.feedback.append(feedback_data)
-            
             return feedback_data
             
         except Exception as e:
@@ -339,6 +454,16 @@ class InterviewSimulator:
                 "user_response": user_response
             }
     
+    def _record_feedback(self, record: FeedbackRecord) -> None:
+        """Store a feedback record and update the running aggregates."""
+        self.feedback.append(record)
+        self._score_sum += record.score
+        self._score_count += 1
+        self._strength_counts.update(record.strengths)
+        self._improvement_counts.update(record.areas_for_improvement)
+        if record.score < WEAK_SCORE_THRESHOLD:
+            self._weak_areas.add(record.question_type)
+
     def _create_analysis_prompt(self, question: Dict[str, Any], user_response: str) -> str:
         """Create a prompt for analyzing the user's response."""
         prompt = f"""
@@ -402,31 +527,27 @@ class InterviewSimulator:
                 "suggested_response": ""
             }
     
-    def generate_overall_feedback(self) -> Dict[str, Any]:
-        """Generate overall feedback for the entire interview."""
-        if not self.feedback:
+    def generate_overall_feedback(self, include_details: bool = False) -> Dict[str, Any]:
+        """
+        Generate overall feedback for the entire interview.
+
+        Args:
+            include_details: Also include the per-answer feedback list (walks
+                every answer; the aggregates alone are constant-time)
+
+        Returns:
+            Dictionary containing the overall score, top strengths and
+            improvements, and a text summary
+        """
+        if not self._score_count:
             return {"error": "No feedback available"}
         
         # Calculate average score
-        total_score = sum(f.get('score', 0) for f in self.feedback)
-        avg_score = total_score / len(self.feedback) if self.feedback else 0
-        
-        # Aggregate strengths and areas for improvement
-        all_strengths = []
-        all_improvements = []
-        
-        for fb in self.feedback:
-            all_strengths.extend(fb.get('strengths', []))
-            all_improvements.extend(fb.get('areas_for_improvement', []))
-        
-        # Count occurrences of each strength/improvement
-        from collections import Counter
-        strength_counts = Counter(all_strengths)
-        improvement_counts = Counter(all_improvements)
+        avg_score = self._score_sum / self._score_count
         
         # Get most common items
-        top_strengths = [item[0] for item in strength_counts.most_common(3)]
-        top_improvements = [item[0] for item in improvement_counts.most_common(3)]
+        top_strengths = [item[0] for item in self._strength_counts.most_common(3)]
+        top_improvements = [item[0] for item in self._improvement_counts.most_common(3)]
         
         # Generate summary
         summary = f"""
@@ -439,28 +560,24 @@ class InterviewSimulator:
         Your overall score is {avg_score:.1f}/1.0.
         """
         
-        return {
+        overall = {
             "overall_score": avg_score,
             "strengths": top_strengths,
             "areas_for_improvement": top_improvements,
-            "summary": summary.strip(),
-            "detailed_feedback": self.feedback
+            "summary": summary.strip()
         }
+        if include_details:
+            overall["detailed_feedback"] = [record.to_dict() for record in self.feedback]
+        return overall
     
     def get_question_recommendations(self) -> List[Dict[str, Any]]:
         """Get recommended questions based on performance."""
-        if not self.feedback:
+        if not self._weak_areas:
             return []
         
-        # Identify weak areas
-        weak_areas = []
-        for fb in self.feedback:
-            if fb.get('score', 0) < 0.5:  # Threshold for weak areas
-                weak_areas.append(fb.get('question_type', 'general'))
-        
         # Generate recommendations
         recommendations = []
-        for area in set(weak_areas):
+        for area in self._weak_areas:
             # Get questions targeting weak areas
             questions = self.question_bank.get(area, [])
             if questions:
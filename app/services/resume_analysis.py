@@ -0,0 +1,241 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple, Union
+
+from fastapi import HTTPException, UploadFile
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.resume import DBResume
+from app.services.gpt_service import gpt_service
+from app.services.resume_parser import parse_resume
+from app.services.resume_matcher import ResumeMatchIndex, resume_features
+from app.utils.file_utils import parser
+from app.utils.prompt_utils import fill_prompt
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bump when the shape of DBResume.analysis_result changes so stale rows can
+# be detected and re-parsed
+ANALYSIS_VERSION = 1
+
+# A parse still pending or processing after this long is taken to have died
+# with its process, and the next request for the resume parses it again
+RESUME_PARSE_TIMEOUT_SECONDS = int(os.getenv("RESUME_PARSE_TIMEOUT_SECONDS", "600"))
+
+# Match index per user over their completed resumes, rebuilt only when one of
+# them is added, removed or re-parsed: user_id -> (signature, index,
+# features). Features are kept per (file_id, parsed_at) so a rebuild only
+# re-tokenizes the resumes that changed. Least recently used users are
+# dropped beyond MATCH_INDEX_CACHE_SIZE.
+MATCH_INDEX_CACHE_SIZE = 256
+_match_indexes: "OrderedDict[str, Tuple[Tuple, ResumeMatchIndex, Dict[Tuple[str, Optional[str]], Any]]]" = OrderedDict()
+_match_lock = threading.Lock()
+
+
+def pending_analysis(structure_with_gpt: bool = False) -> Dict[str, Any]:
+    """Placeholder analysis stored on upload until the background parse finishes."""
+    return _in_progress("pending", structure_with_gpt)
+
+
+def _in_progress(status: str, structure_with_gpt: bool) -> Dict[str, Any]:
+    return {
+        "version": ANALYSIS_VERSION,
+        "status": status,
+        "started_at": datetime.utcnow().isoformat(),
+        "structure_with_gpt": structure_with_gpt,
+    }
+
+
+def _parse_abandoned(analysis: Dict[str, Any]) -> bool:
+    """Whether an unfinished parse has been running for longer than RESUME_PARSE_TIMEOUT_SECONDS."""
+    try:
+        started_at = datetime.fromisoformat(analysis["started_at"])
+    except (KeyError, TypeError, ValueError):
+        return True
+    return datetime.utcnow() - started_at > timedelta(seconds=RESUME_PARSE_TIMEOUT_SECONDS)
+
+
+def parse_uploaded_resume(file_id: str, structure_with_gpt: bool = False) -> None:
+    """
+    Parse a stored resume and save the structured result on its DBResume row.
+
+    Runs as a background task after upload, so it opens its own DB session
+    instead of reusing the (already closed) request session.
+
+    Args:
+        file_id: The uploaded resume's file_id
+        structure_with_gpt: Also ask GPT for a structured extraction
+    """
+    db = SessionLocal()
+    try:
+        resume = db.query(DBResume).filter(DBResume.file_id == file_id).first()
+        if not resume:
+            logger.warning(f"Resume {file_id} not found for background parse")
+            return
+
+        resume.analysis_result = _in_progress("processing", structure_with_gpt)
+        db.commit()
+
+        parsed = parse_resume(resume.file_path)
+        if "error" in parsed:
+            resume.analysis_result = {
+                "version": ANALYSIS_VERSION,
+                "status": "failed",
+                "error": parsed["error"],
+            }
+            db.commit()
+            return
+
+        structured = None
+        if structure_with_gpt and parsed.get("raw_text"):
+            result = gpt_service.call_gpt(
+                fill_prompt("resume_parsing", resume_text=parsed["raw_text"]),
+                temperature=0.3
+            )
+            if "error" not in result:
+                structured = result
+            else:
+                logger.warning(f"GPT structuring failed for resume {file_id}: {result['error']}")
+
+        resume.analysis_result = {
+            "version": ANALYSIS_VERSION,
+            "status": "completed",
+            "parsed": parsed,
+            "structured": structured,
+            "parsed_at": datetime.utcnow().isoformat(),
+        }
+        db.commit()
+
+    except Exception as e:
+        logger.error(f"Background parse failed for resume {file_id}: {str(e)}")
+        db.rollback()
+        resume = db.query(DBResume).filter(DBResume.file_id == file_id).first()
+        if resume:
+            resume.analysis_result = {"version": ANALYSIS_VERSION, "status": "failed", "error": str(e)}
+            db.commit()
+    finally:
+        db.close()
+
+
+def get_stored_resume(db: Session, file_id: str, user_id: Optional[str]) -> Union[str, Dict[str, Any]]:
+    """
+    Return the stored resume content for prompts instead of re-parsing an upload.
+
+    Args:
+        db: Database session
+        file_id: The uploaded resume's file_id
+        user_id: Username of the authenticated user; the resume must be theirs
+
+    Returns:
+        The GPT-structured resume if it was uploaded with structure_with_gpt,
+        otherwise the resume text (as parsing a new upload would return; the
+        parser's fields stay in analysis_result["parsed"])
+
+    Raises:
+        HTTPException: 401 without a user, 404 if the user has no such resume,
+            409 while it is still being parsed, 422 if parsing failed
+    """
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Sign in to use a stored resume.")
+    resume = db.query(DBResume).filter(DBResume.file_id == file_id, DBResume.user_id == user_id).first()
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found.")
+
+    analysis = resume.analysis_result or {}
+    if analysis.get("version") != ANALYSIS_VERSION:
+        # Uploaded before background parsing existed (or with an older
+        # format): parse once now and keep the result
+        parse_uploaded_resume(file_id)
+        db.refresh(resume)
+        analysis = resume.analysis_result or {}
+
+    status = analysis.get("status")
+    if status in ("pending", "processing") and _parse_abandoned(analysis):
+        # The background parse never finished (e.g. the worker restarted)
+        logger.warning(f"Resume {file_id} stuck in {status}; parsing it again")
+        parse_uploaded_resume(file_id, bool(analysis.get("structure_with_gpt")))
+        db.refresh(resume)
+        analysis = resume.analysis_result or {}
+        status = analysis.get("status")
+    if status in ("pending", "processing"):
+        raise HTTPException(status_code=409, detail="Resume is still being processed. Try again shortly.")
+    if status == "failed":
+        raise HTTPException(status_code=422, detail=f"Resume could not be parsed: {analysis.get('error', '')}")
+
+    return analysis.get("structured") or analysis["parsed"].get("raw_text", "")
+
+
+def resolve_resume(
+    db: Session,
+    file: Optional[UploadFile] = None,
+    file_id: Optional[str] = None,
+    required: bool = True,
+    user_id: Optional[str] = None
+) -> Union[str, Dict[str, Any]]:
+    """
+    Return resume content from a stored file_id, falling back to parsing an upload.
+
+    Args:
+        db: Database session
+        file: Uploaded resume file
+        file_id: file_id of a resume uploaded through /api/resume/upload
+        required: Raise 400 if neither is provided (otherwise return "")
+        user_id: Username of the authenticated user (needed for file_id)
+
+    Returns:
+        Resume content suitable for prompts
+    """
+    if file_id:
+        return get_stored_resume(db, file_id, user_id)
+    if file:
+        return parser(file)
+    if required:
+        raise HTTPException(status_code=400, detail="Provide a resume file or a file_id from /api/resume/upload.")
+    return ""
+
+
+def get_match_index(db: Session, user_id: str) -> ResumeMatchIndex:
+    """
+    Return the match index over a user's successfully parsed stored resumes.
+
+    The index is kept per process and rebuilt only when the user's set of
+    parsed resumes changes. Checking for changes is a single aggregate query,
+    so ranking requests don't load or tokenize every resume again.
+    """
+    parsed_at = DBResume.analysis_result["parsed_at"].as_string()
+    signature = tuple(
+        db.query(func.count(DBResume.id), func.max(DBResume.id), func.count(parsed_at), func.max(parsed_at))
+        .filter(DBResume.user_id == user_id)
+        .one()
+    )
+
+    with _match_lock:
+        cached = _match_indexes.get(user_id)
+        if cached is not None and cached[0] == signature:
+            _match_indexes.move_to_end(user_id)
+            return cached[1]
+        previous_features = cached[2] if cached is not None else {}
+
+    rows = db.query(DBResume.file_id, DBResume.analysis_result).filter(
+        DBResume.user_id == user_id
+    ).order_by(DBResume.id)
+    features: Dict[Tuple[str, Optional[str]], Any] = {}
+    for file_id, analysis in rows:
+        if analysis and analysis.get("version") == ANALYSIS_VERSION and analysis.get("status") == "completed":
+            key = (file_id, analysis.get("parsed_at"))
+            features[key] = previous_features.get(key) or resume_features(analysis["parsed"])
+    index = ResumeMatchIndex((key[0], resume) for key, resume in features.items())
+
+    with _match_lock:
+        _match_indexes[user_id] = (signature, index, features)
+        _match_indexes.move_to_end(user_id)
+        while len(_match_indexes) > MATCH_INDEX_CACHE_SIZE:
+            _match_indexes.popitem(last=False)
+    return index
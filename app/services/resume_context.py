@@ -0,0 +1,258 @@
+"""
+Compact resume context for interview prompts.
+
+Instead of inlining the whole resume (often a JSON-quoted raw text blob) in
+every interview turn, prompts get a short, deduplicated summary: name,
+headline, skills, education, condensed experience bullets and any other
+sections, trimmed to a token budget. The encoded context is cached per
+interview session so later turns don't parse or encode the resume again.
+"""
+import os
+import re
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from app.services.resume_parser import (
+    BULLET_PATTERN, EDUCATION_HEADERS, EXPERIENCE_HEADERS, PROJECT_HEADERS,
+    SKILL_DELIMITER_PATTERN, SKILL_HEADERS, SUMMARY_HEADERS
+)
+from app.services.resume_sections import HEADER_SECTION, split_resume_sections
+from app.services.skill_matcher import get_skill_matcher
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Token budget for the encoded resume, estimated at ~4 characters per token
+RESUME_CONTEXT_TOKENS = int(os.getenv("RESUME_CONTEXT_TOKENS", "600"))
+CHARS_PER_TOKEN = 4
+
+# Smaller budget for prompts that also get the relevant experience
+# separately (see experience_retriever)
+RESUME_SUMMARY_TOKENS = int(os.getenv("RESUME_SUMMARY_TOKENS", "200"))
+
+# Encoded contexts kept in memory, keyed by interview session id
+SESSION_CONTEXT_LIMIT = 1024
+
+MAX_SKILLS = 40
+MAX_EDUCATION_LINES = 3
+MAX_HEADLINE_CHARS = 200
+MAX_BULLET_CHARS = 240
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?])\s")
+
+# Headers the parser doesn't know ("INTERNSHIPS", "Research Experience",
+# "Leadership:"). A short line without digits or punctuation counts as one
+# if it contains one of these words or ends with a colon. Their content is
+# kept in the context under its own heading, or as experience when the
+# header mentions it.
+EXTRA_HEADER_WORDS = (
+    "experience", "internship", "leadership", "research", "volunteer", "activities", "involvement",
+    "extracurricular", "awards", "honors", "achievements", "certifications", "publications",
+    "languages", "interests", "employment"
+)
+EXTRA_EXPERIENCE_WORDS = ("experience", "internship", "employment")
+EXTRA_HEADER_PATTERN = re.compile(r"^([A-Za-z][A-Za-z&/' -]{2,48}?)\s*(:?)$")
+MAX_HEADER_WORDS = 4
+
+_session_contexts: "OrderedDict[str, str]" = OrderedDict()
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budget checks (no tokenizer dependency)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _condense(line: str) -> str:
+    return WHITESPACE_PATTERN.sub(" ", BULLET_PATTERN.sub("", line.strip())).strip()
+
+
+def _unique_lines(text: str, min_length: int = 3) -> List[str]:
+    """Condensed, non-trivial lines of a section with duplicates removed."""
+    seen, lines = set(), []
+    for line in text.split("\n"):
+        line = _condense(line)
+        key = line.lower()
+        if len(line) >= min_length and key not in seen:
+            seen.add(key)
+            lines.append(line[:MAX_BULLET_CHARS])
+    return lines
+
+
+def _extra_header(line: str) -> Optional[str]:
+    """Name of a header line the parser doesn't recognise, or None."""
+    match = EXTRA_HEADER_PATTERN.match(line.strip())
+    if not match or len(match.group(1).split()) > MAX_HEADER_WORDS:
+        return None
+    name = match.group(1).lower()
+    if match.group(2) or any(word in name for word in EXTRA_HEADER_WORDS):
+        return name
+    return None
+
+
+def _context_sections(text: str) -> List[Tuple[str, str]]:
+    """The parser's sections, each split further on headers it doesn't recognise."""
+    sections: List[Tuple[str, str]] = []
+    for name, content in split_resume_sections(text):
+        lines: List[str] = []
+        for line in content.split("\n"):
+            header = _extra_header(line)
+            if header is None:
+                lines.append(line)
+                continue
+            if any(line.strip() for line in lines):
+                sections.append((name, "\n".join(lines)))
+            name, lines = header, []
+        if any(line.strip() for line in lines):
+            sections.append((name, "\n".join(lines)))
+    return sections
+
+
+def _flatten(value: Any, prefix: str = "") -> List[str]:
+    """Flatten a structured (GPT-parsed) resume into short "key: value" lines."""
+    if isinstance(value, dict):
+        lines = []
+        for key, item in value.items():
+            lines.extend(_flatten(item, f"{prefix}{key}: " if not isinstance(item, (dict, list)) else ""))
+        return lines
+    if isinstance(value, list):
+        if all(isinstance(item, str) for item in value):
+            items = dict.fromkeys(_condense(item) for item in value if item.strip())
+            return [prefix + ", ".join(items)] if items else []
+        lines = []
+        for item in value:
+            lines.extend(_flatten(item, prefix))
+        return lines
+    text = _condense(str(value)) if value not in (None, "") else ""
+    return [prefix + text] if text else []
+
+
+def _fit(lines: List[str], max_chars: int) -> str:
+    """Keep lines in order until the character budget is used up."""
+    kept, used = [], 0
+    for line in lines:
+        if used + len(line) + 1 > max_chars:
+            break
+        kept.append(line)
+        used += len(line) + 1
+    if kept and kept[-1].endswith(":"):
+        # Don't end on a heading whose bullets didn't fit
+        kept.pop()
+    return "\n".join(kept)
+
+
+def encode_resume_context(
+    resume: Union[str, Dict[str, Any], None],
+    max_tokens: int = RESUME_CONTEXT_TOKENS
+) -> str:
+    """
+    Encode a resume as compact prompt context within a token budget.
+
+    Args:
+        resume: Resume text, ResumeParser output or a structured resume dict
+        max_tokens: Approximate token budget for the result
+
+    Returns:
+        Compact plain-text summary of the resume ("" if there is none)
+    """
+    if not resume:
+        return ""
+    max_chars = max_tokens * CHARS_PER_TOKEN
+
+    if isinstance(resume, dict):
+        if "raw_text" not in resume:
+            seen, lines = set(), []
+            for line in _flatten(resume):
+                if line.lower() not in seen:
+                    seen.add(line.lower())
+                    lines.append(line[:MAX_BULLET_CHARS])
+            return _fit(lines, max_chars)
+        resume = resume.get("raw_text") or ""
+
+    sections = _context_sections(resume)
+    if not sections:
+        return ""
+
+    # Group section contents by kind; extra headers mentioning experience
+    # ("Research Experience", "Internships") count as experience, the rest
+    # keep their own heading
+    kinds = {
+        header: kind for kind, headers in (
+            ("summary", SUMMARY_HEADERS), ("skills", SKILL_HEADERS), ("education", EDUCATION_HEADERS),
+            ("experience", EXPERIENCE_HEADERS), ("projects", PROJECT_HEADERS)
+        ) for header in headers
+    }
+    grouped: Dict[str, List[str]] = {}
+    other: "OrderedDict[str, List[str]]" = OrderedDict()
+    for name, content in sections:
+        base = name.split(" #")[0]
+        if base == HEADER_SECTION:
+            continue
+        kind = kinds.get(base)
+        if kind is None and any(word in base for word in EXTRA_EXPERIENCE_WORDS):
+            kind = "experience"
+        if kind is None:
+            other.setdefault(base.title(), []).extend(_unique_lines(content))
+        else:
+            grouped.setdefault(kind, []).extend(_unique_lines(content))
+
+    def section_lines(kind: str) -> List[str]:
+        return grouped.get(kind, [])
+
+    lines: List[str] = []
+
+    contact = dict(sections).get(HEADER_SECTION, "")
+    name = next((line for line in _unique_lines(contact) if not any(ch.isdigit() or ch == "@" for ch in line)), "")
+    if name:
+        lines.append(f"Name: {name[:80]}")
+
+    summary = " ".join(section_lines("summary"))
+    if summary:
+        lines.append(f"Headline: {SENTENCE_END_PATTERN.split(summary, 1)[0][:MAX_HEADLINE_CHARS]}")
+
+    # Listed skills first, then taxonomy skills mentioned anywhere else
+    skills, seen = [], set()
+    listed = [item.strip() for line in section_lines("skills") for item in SKILL_DELIMITER_PATTERN.split(line)]
+    for skill in listed + sorted(get_skill_matcher().find_skills(resume)):
+        if len(skill) > 1 and skill.lower() not in seen:
+            seen.add(skill.lower())
+            skills.append(skill)
+    if skills:
+        lines.append(f"Skills: {', '.join(skills[:MAX_SKILLS])}")
+
+    education = section_lines("education")[:MAX_EDUCATION_LINES]
+    if education:
+        lines.append(f"Education: {'; '.join(education)}")
+
+    experience = section_lines("experience")
+    projects = section_lines("projects")
+    if not experience and not projects and not skills and not other:
+        # Headers not recognised at all: fall back to the condensed text
+        experience = _unique_lines(resume)
+
+    # Sections the encoder has no slot for are kept (last, so the budget
+    # trims them first) rather than dropped
+    for title, bullets in [("Experience", experience), ("Projects", projects)] + list(other.items()):
+        if bullets:
+            lines.append(f"{title}:")
+            lines.extend(f"- {bullet}" for bullet in bullets)
+
+    return _fit(lines, max_chars)
+
+
+def cache_session_context(session_id: str, context: str) -> None:
+    """Remember a session's encoded resume context (least recently used sessions are dropped)."""
+    _session_contexts[session_id] = context
+    _session_contexts.move_to_end(session_id)
+    while len(_session_contexts) > SESSION_CONTEXT_LIMIT:
+        _session_contexts.popitem(last=False)
+
+
+def get_session_context(session_id: str) -> Optional[str]:
+    """Return a session's cached resume context, or None if it isn't cached in this process."""
+    context = _session_contexts.get(session_id)
+    if context is not None:
+        _session_contexts.move_to_end(session_id)
+    return context
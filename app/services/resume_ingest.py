@@ -0,0 +1,299 @@
+"""
+Bulk resume ingestion.
+
+Parses every resume under a directory or glob with ``ResumeParser`` in a
+process pool and streams one JSON line per resume to an output file as
+batches finish. Each batch goes through spaCy with a single ``nlp.pipe``
+call. Files already present in the output are skipped, so an interrupted
+run can simply be started again. If a file crashes its worker process, the
+files that were in flight are retried one at a time and the culprit is
+recorded as failed.
+
+Usage:
+    python -m app.services.resume_ingest <dir-or-glob> [...] -o results.jsonl
+"""
+import os
+import sys
+import json
+import glob
+import time
+import logging
+import argparse
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Iterator, List, Optional, Set
+
+from app.services import resume_parser
+from app.services.resume_parser import ResumeParser
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = {'.pdf', '.docx', '.txt'}
+STAGES = ("extract", "segment", "nlp", "fields")
+
+
+def find_resumes(inputs: List[str]) -> List[str]:
+    """
+    Expand directories and glob patterns into a sorted list of resume files.
+
+    Args:
+        inputs: Directories (searched recursively), glob patterns or file paths
+
+    Returns:
+        Absolute paths of supported resume files, without duplicates
+    """
+    files: Set[str] = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = glob.iglob(os.path.join(item, "**", "*"), recursive=True)
+        else:
+            candidates = glob.iglob(item, recursive=True)
+        for path in candidates:
+            if os.path.isfile(path) and os.path.splitext(path)[1].lower() in SUPPORTED_EXTENSIONS:
+                files.add(os.path.abspath(path))
+    return sorted(files)
+
+
+def load_checkpoint(output_path: str) -> Set[str]:
+    """
+    Return the files already recorded in an existing output file.
+
+    A truncated last line (from a crash mid-write) is ignored and terminated
+    so new records start on a fresh line.
+    """
+    done: Set[str] = set()
+    if not os.path.exists(output_path):
+        return done
+
+    with open(output_path, "rb+") as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)["file"])
+            except (ValueError, KeyError):
+                continue
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+    return done
+
+
+def _init_worker() -> None:
+    # Each ingest worker parses its pages inline rather than nesting pools,
+    # and loads the spaCy model once up front
+    resume_parser.PDF_WORKERS = 1
+    resume_parser.warm_nlp()
+
+
+def _error_record(file_path: str, error: str, parser: Optional[ResumeParser] = None) -> Dict[str, Any]:
+    timings = parser.timings if parser is not None else {}
+    return {"file": file_path, "status": "error", "error": error, "timings": timings}
+
+
+def ingest_batch(file_paths: List[str]) -> List[Dict[str, Any]]:
+    """
+    Parse a batch of resumes, keeping each parser's per-stage timings.
+
+    The texts of the batch are run through spaCy together (see
+    ``resume_parser.pipe_docs``).
+
+    Returns:
+        One output record per file (file path, status, parsed result and
+        timings), in input order
+    """
+    parsers: Dict[str, ResumeParser] = {}
+    records: Dict[str, Dict[str, Any]] = {}
+    for file_path in file_paths:
+        try:
+            parsers[file_path] = ResumeParser(file_path)
+        except Exception as e:
+            records[file_path] = _error_record(file_path, str(e))
+
+    try:
+        resume_parser.pipe_docs(list(parsers.values()))
+    except Exception as e:
+        # Parsers without a document fall back to processing their own text
+        logger.warning(f"Batched NLP failed, processing resumes one at a time: {e}")
+
+    for file_path, parser in parsers.items():
+        try:
+            result = parser.parse()
+            records[file_path] = {"file": file_path, "status": "ok", "result": result, "timings": parser.timings}
+        except Exception as e:
+            records[file_path] = _error_record(file_path, str(e), parser)
+    return [records[file_path] for file_path in file_paths]
+
+
+class ThroughputReport:
+    """Running totals for resumes/sec and per-stage timings."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.count = 0
+        self.errors = 0
+        self.stage_totals = {stage: 0.0 for stage in STAGES}
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.count += 1
+        if record["status"] != "ok":
+            self.errors += 1
+        for stage, seconds in record.get("timings", {}).items():
+            self.stage_totals[stage] = self.stage_totals.get(stage, 0.0) + seconds
+
+    def summary(self) -> str:
+        elapsed = time.perf_counter() - self.started
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        stages = ", ".join(
+            f"{stage} {1000 * total / self.count:.1f}ms" for stage, total in self.stage_totals.items()
+        ) if self.count else "n/a"
+        return (
+            f"{self.count} resumes ({self.errors} errors) in {elapsed:.1f}s, "
+            f"{rate:.2f} resumes/sec; avg per stage: {stages}"
+        )
+
+
+class PoolCrashed(Exception):
+    """A worker process died; ``suspects`` are the files that were in flight."""
+
+    def __init__(self, suspects: List[str]):
+        super().__init__(f"Worker pool crashed with {len(suspects)} resumes in flight")
+        self.suspects = suspects
+
+
+def _run_pool(files: List[str], workers: int, chunksize: int) -> Iterator[Dict[str, Any]]:
+    """
+    Parse files in batches of chunksize, yielding records as batches finish.
+
+    Only one batch per worker (plus one) is submitted at a time, so a slow
+    file holds up nothing but its own batch and a crash can be narrowed
+    down to the batches in flight.
+
+    Raises:
+        PoolCrashed: If a worker process died
+    """
+    batches = iter([files[i:i + chunksize] for i in range(0, len(files), chunksize)])
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        in_flight: Dict[Future, List[str]] = {}
+
+        def submit_next() -> None:
+            batch = next(batches, None)
+            if batch:
+                in_flight[pool.submit(ingest_batch, batch)] = batch
+
+        for _ in range(workers + 1):
+            submit_next()
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                batch = in_flight.pop(future)
+                try:
+                    records = future.result()
+                except BrokenProcessPool:
+                    raise PoolCrashed(batch + [f for other in in_flight.values() for f in other])
+                submit_next()
+                yield from records
+
+
+def _run_isolated(files: List[str]) -> Iterator[Dict[str, Any]]:
+    """Parse files one at a time in a single worker; a file that kills it is recorded as failed."""
+    pool: Optional[ProcessPoolExecutor] = None
+    try:
+        for file_path in files:
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=1, initializer=_init_worker)
+            try:
+                yield from pool.submit(ingest_batch, [file_path]).result()
+            except BrokenProcessPool:
+                logger.error(f"Worker process crashed parsing {file_path}, marking it failed")
+                pool.shutdown()
+                pool = None
+                yield _error_record(file_path, "Worker process crashed")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def ingest(
+    inputs: List[str],
+    output_path: str,
+    workers: int = None,
+    chunksize: int = 8,
+    report_every: int = 100,
+    restart: bool = False
+) -> ThroughputReport:
+    """
+    Parse all resumes matched by the inputs and append the results to a JSONL file.
+
+    Args:
+        inputs: Directories, glob patterns or file paths
+        output_path: JSONL output file, also used as the checkpoint
+        workers: Number of worker processes (defaults to the CPU count)
+        chunksize: Number of files handed to a worker (and spaCy) at a time
+        report_every: Log throughput every this many resumes
+        restart: Ignore and overwrite any existing output instead of resuming
+
+    Returns:
+        The final throughput report
+    """
+    workers = workers or os.cpu_count() or 1
+    if restart and os.path.exists(output_path):
+        os.remove(output_path)
+
+    files = find_resumes(inputs)
+    done = load_checkpoint(output_path)
+    pending = [f for f in files if f not in done]
+    logger.info(f"Found {len(files)} resumes, {len(done)} already done, {len(pending)} to process")
+
+    report = ThroughputReport()
+    with open(output_path, "a", encoding="utf-8") as out:
+        def write(record: Dict[str, Any]) -> None:
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            done.add(record["file"])
+            report.add(record)
+            if report_every and report.count % report_every == 0:
+                logger.info(report.summary())
+
+        while pending:
+            try:
+                for record in _run_pool(pending, workers, chunksize):
+                    write(record)
+                pending = []
+            except PoolCrashed as crash:
+                # A worker died (e.g. a crashing native library). Find the file
+                # responsible among those in flight, then carry on with the rest
+                suspects = [f for f in crash.suspects if f not in done]
+                logger.warning(f"Worker pool crashed, retrying {len(suspects)} in-flight resumes one at a time")
+                for record in _run_isolated(suspects):
+                    write(record)
+                pending = [f for f in pending if f not in done]
+
+    logger.info(report.summary())
+    return report
+
+
+def main(argv: List[str] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Bulk-parse resumes into a JSONL file.")
+    arg_parser.add_argument("inputs", nargs="+", help="Directories, glob patterns or resume files")
+    arg_parser.add_argument("-o", "--output", required=True, help="JSONL output file (also the checkpoint)")
+    arg_parser.add_argument("-w", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    arg_parser.add_argument("--chunksize", type=int, default=8, help="Files per worker task and spaCy batch")
+    arg_parser.add_argument("--report-every", type=int, default=100, help="Log throughput every N resumes")
+    arg_parser.add_argument("--restart", action="store_true", help="Discard existing output instead of resuming")
+    args = arg_parser.parse_args(argv)
+
+    ingest(
+        args.inputs,
+        args.output,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        report_every=args.report_every,
+        restart=args.restart
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+"""
+Local resume-to-job-description matching.
+
+Builds sparse TF-IDF and skill matrices from ``ResumeParser`` output once,
+then scores every resume against a job description with a couple of
+sparse matrix-vector products, so ranking thousands of resumes needs no
+LLM call.
+"""
+import re
+import logging
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from app.services.skill_matcher import get_skill_matcher
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Final score = TEXT_WEIGHT * TF-IDF cosine + SKILL_WEIGHT * JD skill coverage
+TEXT_WEIGHT = 0.4
+SKILL_WEIGHT = 0.6
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOP_WORDS = frozenset("""
+a an and are as at be been by for from has have in into is it its of on or our that the their this to
+was were will with within we you your i my me he she they them who what which while about over under
+than then also etc using use used via per across all any each more most other some such can may must
+should would could able strong experience years year work working team teams including include
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into word tokens, dropping stop words."""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if t not in STOP_WORDS]
+
+
+def _resume_text(parsed: Dict[str, Any]) -> str:
+    """Text used for TF-IDF: experience, summary and skills, or the raw text if those are empty."""
+    parts = [parsed.get("summary") or ""]
+    for entry in parsed.get("experience") or []:
+        parts.extend(str(entry.get(key) or "") for key in ("title", "company", "description"))
+    parts.extend(parsed.get("skills") or [])
+    text = "\n".join(p for p in parts if p)
+    return text if text.strip() else parsed.get("raw_text") or ""
+
+
+def _resume_skills(parsed: Dict[str, Any]) -> Set[str]:
+    """Canonical skills found in the parsed skills list and the resume text."""
+    text = "\n".join(parsed.get("skills") or []) + "\n" + (parsed.get("raw_text") or _resume_text(parsed))
+    return get_skill_matcher().find_skills(text)
+
+
+def resume_features(parsed: Dict[str, Any]) -> Tuple[Dict[str, int], Set[str]]:
+    """
+    Extract the matching features of one parsed resume.
+
+    This is the expensive part of building an index, so callers that rebuild
+    indexes over mostly unchanged resumes can cache the result.
+
+    Returns:
+        (term counts, canonical skills)
+    """
+    return Counter(tokenize(_resume_text(parsed))), _resume_skills(parsed)
+
+
+class ResumeMatchIndex:
+    """
+    TF-IDF and skill matrices for a fixed set of parsed resumes.
+
+    Rows of the TF-IDF matrix are L2-normalised, so cosine similarity with a
+    job description is one sparse matrix-vector product. Skill coverage is a
+    product of the binary resume x skill matrix with the JD's skill vector.
+    """
+
+    def __init__(self, resumes: Iterable[Tuple[str, Tuple[Dict[str, int], Set[str]]]]):
+        """
+        Build the index.
+
+        Args:
+            resumes: (resume_id, features) pairs, where features come from
+                ``resume_features``
+        """
+        self.ids: List[str] = []
+        self.vocabulary: Dict[str, int] = {}
+        self.skills: Dict[str, int] = {}
+
+        rows, cols, counts = [], [], []
+        skill_rows, skill_cols = [], []
+        for row, (resume_id, (term_counts, resume_skills)) in enumerate(resumes):
+            self.ids.append(resume_id)
+
+            rows.extend([row] * len(term_counts))
+            cols.extend(self.vocabulary.setdefault(term, len(self.vocabulary)) for term in term_counts)
+            counts.extend(term_counts.values())
+
+            for skill in resume_skills:
+                skill_rows.append(row)
+                skill_cols.append(self.skills.setdefault(skill, len(self.skills)))
+
+        n = len(self.ids)
+        tf = sparse.csr_matrix(
+            (np.asarray(counts, dtype=np.float32), (rows, cols)),
+            shape=(n, len(self.vocabulary))
+        )
+        # Sublinear TF and smoothed IDF, as in the usual TF-IDF formulation
+        tf.data = 1.0 + np.log(tf.data)
+        document_frequency = np.bincount(tf.indices, minlength=len(self.vocabulary))
+        self.idf = (np.log((1 + n) / (1 + document_frequency)) + 1.0).astype(np.float32)
+        tfidf = tf.multiply(self.idf).tocsr()
+        norms = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        self.tfidf = sparse.csr_matrix(sparse.diags(1.0 / norms).dot(tfidf), dtype=np.float32)
+
+        self.skill_matrix = sparse.csr_matrix(
+            (np.ones(len(skill_rows), dtype=np.float32), (skill_rows, skill_cols)),
+            shape=(n, len(self.skills))
+        )
+        self.skill_names = sorted(self.skills, key=self.skills.get)
+
+    @classmethod
+    def from_parsed(cls, resumes: Iterable[Tuple[str, Dict[str, Any]]]) -> "ResumeMatchIndex":
+        """Build an index from (resume_id, ``ResumeParser.parse()`` output) pairs."""
+        return cls((resume_id, resume_features(parsed)) for resume_id, parsed in resumes)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _query_vector(self, text: str) -> np.ndarray:
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for token in tokenize(text):
+            col = self.vocabulary.get(token)
+            if col is not None:
+                vector[col] += 1.0
+        nonzero = vector > 0
+        vector[nonzero] = (1.0 + np.log(vector[nonzero])) * self.idf[nonzero]
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def rank(self, job_description: str, top_k: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """
+        Rank the indexed resumes against a job description.
+
+        Args:
+            job_description: Job description text
+            top_k: Number of results to return (None for all)
+
+        Returns:
+            Results sorted by score, each with the resume id, overall score,
+            text similarity, skill coverage and matched/missing skills
+        """
+        if not self.ids:
+            return []
+
+        text_scores = self.tfidf.dot(self._query_vector(job_description))
+
+        jd_skills = sorted(get_skill_matcher().find_skills(job_description))
+        known = [self.skills[s] for s in jd_skills if s in self.skills]
+        if jd_skills:
+            coverage = np.asarray(self.skill_matrix[:, known].sum(axis=1)).ravel() / len(jd_skills)
+            scores = TEXT_WEIGHT * text_scores + SKILL_WEIGHT * coverage
+        else:
+            # Nothing to cover: rank on text alone
+            coverage = np.zeros(len(self.ids), dtype=np.float32)
+            scores = text_scores
+
+        if top_k is None or top_k >= len(scores):
+            order = np.argsort(-scores, kind="stable")
+        else:
+            top = np.argpartition(-scores, top_k)[:top_k]
+            order = top[np.argsort(-scores[top], kind="stable")]
+
+        results = []
+        for row in order:
+            start, end = self.skill_matrix.indptr[row], self.skill_matrix.indptr[row + 1]
+            has = {self.skill_names[c] for c in self.skill_matrix.indices[start:end]}
+            results.append({
+                "resume_id": self.ids[row],
+                "score": round(float(scores[row]), 4),
+                "text_similarity": round(float(text_scores[row]), 4),
+                "skill_coverage": round(float(coverage[row]), 4),
+                "matched_skills": [s for s in jd_skills if s in has],
+                "missing_skills": [s for s in jd_skills if s not in has],
+            })
+        return results
+
+
+def rank_resumes(
+    resumes: Iterable[Tuple[str, Dict[str, Any]]],
+    job_description: str,
+    top_k: Optional[int] = 20
+) -> List[Dict[str, Any]]:
+    """
+    Build an index over the resumes and rank them against a job description.
+
+    Args:
+        resumes: (resume_id, parsed resume) pairs
+        job_description: Job description text
+        top_k: Number of results to return (None for all)
+
+    Returns:
+        Ranked results, see ``ResumeMatchIndex.rank``
+    """
+    return ResumeMatchIndex.from_parsed(resumes).rank(job_description, top_k)
@@ -5,25 +5,182 @@ import pdfplumber
 from docx import Document
 from typing import Dict, Any, Optional, List
 from datetime import datetime
-import io
 import tempfile
+import time
 import logging
+from concurrent.futures import ProcessPoolExecutor, wait
+from functools import lru_cache
+from .skill_matcher import get_skill_matcher
+from app.utils.disk_cache import DiskCache, hash_bytes, hash_file
+from app.utils.text_extraction import (
+    DEFAULT_PDF_BACKEND,
+    FALLBACK_PDF_BACKEND,
+    MIN_TEXT_QUALITY,
+    get_backend,
+    text_quality,
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load English language model for NLP (optional)
-# Spacy is optional - only loaded if installed
-nlp = None
-try:
-    import spacy
-    nlp = spacy.load("en_core_web_sm")
-except ImportError:
-    logger.warning("spaCy not installed. Resume parsing will use basic text extraction only.")
-except Exception as e:
-    logger.warning(f"spaCy model 'en_core_web_sm' not found: {e}. Resume parsing will be basic. To enable NLP features, install: pip install spacy && python -m spacy download en_core_web_sm")
-    nlp = None
+# spaCy is optional and loaded lazily on first use, so workers that never
+# parse a resume don't pay for the model. Pipes the extractors don't need
+# are disabled to keep per-resume NLP cost down.
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+SPACY_DISABLED_PIPES = [
+    pipe.strip() for pipe in os.getenv("SPACY_DISABLED_PIPES", "parser,lemmatizer").split(",") if pipe.strip()
+]
+SPACY_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "16"))
+
+
+@lru_cache(maxsize=1)
+def get_nlp():
+    """
+    Return the per-process spaCy pipeline, loading it on first call.
+    
+    Returns:
+        The loaded pipeline, or None if spaCy or the model is unavailable
+    """
+    try:
+        import spacy
+    except ImportError:
+        logger.warning("spaCy not installed. Resume parsing will use basic text extraction only.")
+        return None
+    try:
+        return spacy.load(SPACY_MODEL, disable=SPACY_DISABLED_PIPES)
+    except Exception as e:
+        logger.warning(f"spaCy model '{SPACY_MODEL}' not found: {e}. Resume parsing will be basic. To enable NLP features, install: pip install spacy && python -m spacy download {SPACY_MODEL}")
+        return None
+
+
+def warm_nlp() -> bool:
+    """Load the spaCy pipeline ahead of time (e.g. in a worker initializer)."""
+    return get_nlp() is not None
+
+# Slow PDF page work (layout-aware extraction and OCR) runs in a shared
+# process pool; only pages without a text layer are rendered and sent to OCR.
+# Every web worker has its own pool, so keep it small by default.
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(min(2, os.cpu_count() or 1))))
+OCR_RESOLUTION = int(os.getenv("OCR_RESOLUTION", "200"))
+OCR_LANGUAGE = os.getenv("OCR_LANGUAGE", "eng")
+OCR_PAGE_TIMEOUT = float(os.getenv("OCR_PAGE_TIMEOUT", "30"))
+# Deadline for all page work of one document; pages still queued then are
+# cancelled, and a pool with pages still running is recycled
+PDF_PAGES_TIMEOUT = float(os.getenv("PDF_PAGES_TIMEOUT", "60"))
+
+# OCR results are cached on disk by file hash, page, resolution and language,
+# so repeat uploads of the same scanned resume skip rendering and tesseract
+OCR_CACHE_DIR = os.getenv("OCR_CACHE_DIR", os.path.join(tempfile.gettempdir(), "interviewbot_ocr_cache"))
+OCR_CACHE_MAX_MB = int(os.getenv("OCR_CACHE_MAX_MB", "100"))
+
+_page_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """Return the per-process pool used for PDF page work, creating it on first use."""
+    global _page_pool
+    if _page_pool is None:
+        _page_pool = ProcessPoolExecutor(max_workers=max(1, PDF_WORKERS))
+    return _page_pool
+
+
+def _reset_page_pool() -> None:
+    """
+    Retire the page pool so the next request starts a fresh one.
+    
+    Pages already submitted to the old pool (by any request) still run to
+    completion; its workers exit once they are done.
+    """
+    global _page_pool
+    if _page_pool is not None:
+        pool, _page_pool = _page_pool, None
+        pool.shutdown(wait=False)
+
+
+def _extract_page_text(file_path: str, page_number: int, backend: str) -> str:
+    """Extract the text layer of a single PDF page (runs in a pool worker)."""
+    return get_backend(backend).extract_pages(file_path, [page_number])[0]
+
+
+@lru_cache(maxsize=1)
+def get_ocr_cache() -> DiskCache:
+    """Return the per-process OCR result cache."""
+    return DiskCache(OCR_CACHE_DIR, OCR_CACHE_MAX_MB * 1024 * 1024)
+
+
+def _ocr_page(
+    file_path: str, page_number: int, resolution: int, language: str, timeout: float, file_hash: str
+) -> str:
+    """OCR a single PDF page, rendering it only on an OCR cache miss (runs in a pool worker)."""
+    import pytesseract  # type: ignore
+    
+    cache = get_ocr_cache()
+    key = hash_bytes(f"{file_hash}:{page_number}:{resolution}:{language}".encode())
+    cached = cache.get(key)
+    if cached is not None:
+        return cached.decode("utf-8")
+    
+    with pdfplumber.open(file_path) as pdf:
+        image = pdf.pages[page_number].to_image(resolution=resolution).original
+    
+    page_text = pytesseract.image_to_string(image, lang=language, timeout=timeout)
+    cache.set(key, page_text.encode("utf-8"))
+    return page_text
+
+
+def _ocr_available() -> bool:
+    try:
+        import pytesseract  # type: ignore  # noqa: F401
+        from PIL import Image  # type: ignore  # noqa: F401
+        return True
+    except Exception:
+        return False
+
+# Section headers recognised by the parser, grouped by the extractor that uses them
+EDUCATION_HEADERS = [
+    'education', 'academic background', 'educational background',
+    'academic qualifications', 'academics', 'degrees'
+]
+EXPERIENCE_HEADERS = [
+    'experience', 'work experience', 'professional experience',
+    'employment history', 'work history', 'professional background'
+]
+SKILL_HEADERS = [
+    'skills', 'technical skills', 'key skills', 'core competencies',
+    'technical expertise', 'technologies', 'programming languages'
+]
+PROJECT_HEADERS = ['projects', 'personal projects', 'academic projects']
+SUMMARY_HEADERS = [
+    'summary', 'professional summary', 'career objective',
+    'objective', 'about me', 'profile'
+]
+SECTION_HEADERS = sorted(set(
+    EDUCATION_HEADERS + EXPERIENCE_HEADERS + SKILL_HEADERS + PROJECT_HEADERS + SUMMARY_HEADERS
+))
+
+# Precompiled patterns shared by all parser instances
+KNOWN_HEADER_PATTERN = re.compile(
+    r'^\s*(' + '|'.join(map(re.escape, SECTION_HEADERS)) + r')\s*[\s:]*$', re.IGNORECASE
+)
+SECTION_HEADER_PATTERN = re.compile(r'^\s*([A-Z][A-Za-z ]+)\s*[\s:]*$')
+ENTRY_SPLIT_PATTERN = re.compile(r'\n\s*\n')
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERNS = [
+    re.compile(r'\+?[\d\s-]{10,}'),  # Matches +1 234 567 8901, 123-456-7890, etc.
+    re.compile(r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}')  # Matches (123) 456-7890
+]
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[a-zA-Z0-9-]+')
+GITHUB_PATTERN = re.compile(r'github\.com/[a-zA-Z0-9-]+')
+URL_PATTERN = re.compile(r'https?://(?:[\w-]+\.)+[a-z]{2,}(?:/[^\s]*)?')
+DATE_PATTERN = re.compile(
+    r'(\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)[a-z]*[\s,.-]*(?:19|20)\d{2}[\s]*[-–—]?[\s]*(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)[a-z]*[\s,.-]*(?:19|20)\d{2}|Present|Current|Now)\b|\b(?:19|20)\d{2}[\s]*[-–—][\s]*(?:19|20)?\d{2}\b)',
+    re.IGNORECASE
+)
+GPA_PATTERN = re.compile(r'\bGPA[:\s]*([0-4]\.\d{1,2})\b|\b([0-4]\.\d{1,2})\s*GPA\b', re.IGNORECASE)
+SKILL_DELIMITER_PATTERN = re.compile(r'[,;•\-*|]')
+# Bullet glyphs, including the ones PDF text layers commonly produce
+BULLET_PATTERN = re.compile(r'^[•●○◦▪▫■□◆♦►▸‣⁃∙·\-–*]\s*')
 
 class ResumeParser:
     """
@@ -34,13 +191,43 @@ class ResumeParser:
         """
         Initialize the ResumeParser with the path to the resume file.
         
+        The spaCy document is only built when first needed; see ``doc``.
+        Seconds spent per stage are recorded in ``timings``.
+        
         Args:
             file_path: Path to the resume file (PDF, DOCX, or TXT)
         """
         self.file_path = file_path
         self.file_extension = os.path.splitext(file_path)[1].lower()
+        self.timings: Dict[str, float] = {}
+        
+        start = time.perf_counter()
         self.text = self._extract_text()
-        self.doc = nlp(self.text) if (self.text and nlp is not None) else None
+        self.timings["extract"] = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        self.lines = self.text.split('\n')
+        self._section_index = self._build_section_index()
+        self.timings["segment"] = time.perf_counter() - start
+        self._section_cache: Dict[int, Optional[str]] = {}
+        self._doc = None
+        self._doc_ready = False
+    
+    @property
+    def doc(self):
+        """The spaCy document for the resume text, processed on first access."""
+        if not self._doc_ready:
+            start = time.perf_counter()
+            nlp = get_nlp()
+            self._doc = nlp(self.text) if (self.text and nlp is not None) else None
+            self._doc_ready = True
+            self.timings["nlp"] = time.perf_counter() - start
+        return self._doc
+    
+    def set_doc(self, doc) -> None:
+        """Use an already processed spaCy document (e.g. from ``nlp.pipe``)."""
+        self._doc = doc
+        self._doc_ready = True
         
     def _extract_text(self) -> str:
         """Extract text from the resume file based on its format."""
@@ -59,39 +246,103 @@ class ResumeParser:
             return ""
     
     def _extract_text_from_pdf(self) -> str:
-        """Extract text from a PDF file."""
-        text = ""
+        """
+        Extract text from a PDF file.
+        
+        The text layer is read with the fast default backend; if that output
+        looks broken, the layout-aware fallback re-extracts the pages in
+        parallel in the shared page pool. Only pages without any text are sent
+        to OCR, and results are reassembled in page order.
+        """
         try:
-            with pdfplumber.open(self.file_path) as pdf:
-                for page in pdf.pages:
-                    # Try to extract text directly first
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-                    else:
-                        # Fallback to OCR if no text is found
-                        try:
-                            # Lazy import OCR dependencies
-                            try:
-                                import pytesseract  # type: ignore
-                                from PIL import Image  # type: ignore
-                            except Exception as ie:
-                                logger.warning("OCR dependencies not available (pytesseract/Pillow). Skipping OCR.")
-                                raise ie
-
-                            img = page.to_image()
-                            img_bytes = io.BytesIO()
-                            img.save(img_bytes, format='PNG')
-                            img_bytes.seek(0)
-                            page_text = pytesseract.image_to_string(Image.open(img_bytes))
-                            text += page_text + "\n"
-                        except Exception as e:
-                            logger.warning(f"OCR failed or unavailable for page: {str(e)}")
+            page_texts: List[Optional[str]] = get_backend(DEFAULT_PDF_BACKEND).extract_pages(self.file_path)
+            page_count = len(page_texts)
+            
+            if text_quality(page_texts) < MIN_TEXT_QUALITY and FALLBACK_PDF_BACKEND != DEFAULT_PDF_BACKEND:
+                layout_texts = self._map_pages(_extract_page_text, range(page_count), FALLBACK_PDF_BACKEND)
+                if text_quality([t or "" for t in layout_texts]) > text_quality(page_texts):
+                    page_texts = layout_texts
+            
+            blank_pages = [i for i, page_text in enumerate(page_texts) if not page_text]
+            ocr_texts: Dict[int, str] = {}
+            if blank_pages:
+                # Fallback to OCR if no text is found
+                if _ocr_available():
+                    ocr_texts = dict(zip(blank_pages, self._map_pages(
+                        _ocr_page, blank_pages, OCR_RESOLUTION, OCR_LANGUAGE, OCR_PAGE_TIMEOUT,
+                        hash_file(self.file_path)
+                    )))
+                else:
+                    logger.warning("OCR dependencies not available (pytesseract/Pillow). Skipping OCR.")
         except Exception as e:
             logger.error(f"Error reading PDF: {str(e)}")
             raise
+        
+        text = ""
+        for i, page_text in enumerate(page_texts):
+            if page_text:
+                text += page_text + "\n"
+            elif ocr_texts.get(i) is not None:
+                text += ocr_texts[i] + "\n"
         return text
     
+    def _map_pages(self, func, page_numbers, *args) -> List[Optional[str]]:
+        """
+        Run a page function over the given pages in the page pool.
+        
+        Args:
+            func: Module-level worker taking (file_path, page_number, *args)
+            page_numbers: Pages to process
+            *args: Extra arguments passed to every call
+            
+        Returns:
+            Results in the same order as page_numbers; None for pages that
+            failed or weren't done within PDF_PAGES_TIMEOUT
+        """
+        if PDF_WORKERS <= 1:
+            # Pages run inline (e.g. when the caller is already a pool worker)
+            results: List[Optional[str]] = []
+            for n in page_numbers:
+                try:
+                    results.append(func(self.file_path, n, *args))
+                except Exception as e:
+                    logger.warning(f"Processing failed for page {n + 1}: {str(e)}")
+                    results.append(None)
+            return results
+        
+        pool = _get_page_pool()
+        try:
+            futures = [pool.submit(func, self.file_path, n, *args) for n in page_numbers]
+        except Exception:
+            # The pool can break if a worker died; retry once with a fresh one
+            _reset_page_pool()
+            pool = _get_page_pool()
+            futures = [pool.submit(func, self.file_path, n, *args) for n in page_numbers]
+        
+        _, not_done = wait(futures, timeout=PDF_PAGES_TIMEOUT)
+        if not_done:
+            logger.warning(
+                f"{len(not_done)} page(s) of {self.file_path} not done after {PDF_PAGES_TIMEOUT}s, skipping"
+            )
+            # Only this document's pages are given up. Queued ones are
+            # cancelled; running ones can't be, and would hold their workers,
+            # so new work goes to a fresh pool while the old one drains
+            running = [future for future in not_done if not future.cancel()]
+            if running and pool is _page_pool:
+                _reset_page_pool()
+        
+        results = []
+        for page_number, future in zip(page_numbers, futures):
+            if future in not_done:
+                results.append(None)
+                continue
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.warning(f"Processing failed for page {page_number + 1}: {str(e)}")
+                results.append(None)
+        return results
+    
     def _extract_text_from_docx(self) -> str:
         """Extract text from a DOCX file."""
         try:
@@ -119,7 +370,8 @@ class ResumeParser:
         """
         if not self.doc:
             # Basic fallback parsing without spaCy model
-            return {
+            start = time.perf_counter()
+            result = {
                 "name": "",
                 "contact_info": self._extract_contact_info(),
                 "education": [],
@@ -128,8 +380,11 @@ class ResumeParser:
                 "summary": "",
                 "raw_text": self.text
             }
-            
-        return {
+            self.timings["fields"] = time.perf_counter() - start
+            return result
+        
+        start = time.perf_counter()
+        result = {
             "name": self._extract_name(),
             "contact_info": self._extract_contact_info(),
             "education": self._extract_education(),
@@ -138,6 +393,8 @@ class ResumeParser:
             "summary": self._extract_summary(),
             "raw_text": self.text
         }
+        self.timings["fields"] = time.perf_counter() - start
+        return result
     
     def _extract_name(self) -> str:
         """Extract the candidate's name from the resume."""
@@ -161,39 +418,31 @@ class ResumeParser:
             "portfolio": ""
         }
         
+        text_lower = self.text.lower()
+
         # Extract email
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        email_match = re.search(email_pattern, self.text)
+        email_match = EMAIL_PATTERN.search(self.text)
         if email_match:
             contact_info["email"] = email_match.group(0)
         
         # Extract phone number (various formats)
-        phone_patterns = [
-            r'\+?[\d\s-]{10,}',  # Matches +1 234 567 8901, 123-456-7890, etc.
-            r'\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}'  # Matches (123) 456-7890
-        ]
-        
-        for pattern in phone_patterns:
-            phone_match = re.search(pattern, self.text)
+        for pattern in PHONE_PATTERNS:
+            phone_match = pattern.search(self.text)
             if phone_match:
                 contact_info["phone"] = phone_match.group(0)
                 break
         
         # Extract LinkedIn and GitHub profiles
-        linkedin_pattern = r'linkedin\.com/in/[a-zA-Z0-9-]+'
-        github_pattern = r'github\.com/[a-zA-Z0-9-]+'
-        
-        linkedin_match = re.search(linkedin_pattern, self.text.lower())
+        linkedin_match = LINKEDIN_PATTERN.search(text_lower)
         if linkedin_match:
             contact_info["linkedin"] = f"https://{linkedin_match.group(0)}"
         
-        github_match = re.search(github_pattern, self.text.lower())
+        github_match = GITHUB_PATTERN.search(text_lower)
         if github_match:
             contact_info["github"] = f"https://{github_match.group(0)}"
         
         # Extract portfolio website
-        url_pattern = r'https?://(?:[\w-]+\.)+[a-z]{2,}(?:/[^\s]*)?'
-        url_matches = re.finditer(url_pattern, self.text.lower())
+        url_matches = URL_PATTERN.finditer(text_lower)
         
         for match in url_matches:
             url = match.group(0)
@@ -206,19 +455,13 @@ class ResumeParser:
         """Extract education information from the resume."""
         education = []
         
-        # Common education section headers
-        edu_headers = [
-            'education', 'academic background', 'educational background',
-            'academic qualifications', 'academics', 'degrees'
-        ]
-        
         # Find the education section
-        edu_section = self._find_section(edu_headers)
+        edu_section = self._find_section(EDUCATION_HEADERS)
         if not edu_section:
             return education
         
         # Split into individual education entries
-        entries = re.split(r'\n\s*\n', edu_section)
+        entries = ENTRY_SPLIT_PATTERN.split(edu_section)
         
         for entry in entries:
             # Skip empty entries
@@ -251,17 +494,15 @@ class ResumeParser:
                     break
             
             # Look for dates (e.g., 2015 - 2019, Sep 2018 - May 2022)
-            date_pattern = r'(\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)[a-z]*[\s,.-]*(?:19|20)\d{2}[\s]*[-–—]?[\s]*(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)[a-z]*[\s,.-]*(?:19|20)\d{2}|Present|Current|Now)\b|\b(?:19|20)\d{2}[\s]*[-–—][\s]*(?:19|20)?\d{2}\b)'
             for line in lines:
-                date_match = re.search(date_pattern, line, re.IGNORECASE)
+                date_match = DATE_PATTERN.search(line)
                 if date_match:
                     edu_entry['dates'] = date_match.group(0)
                     break
             
             # Look for GPA
-            gpa_pattern = r'\bGPA[:\s]*([0-4]\.\d{1,2})\b|\b([0-4]\.\d{1,2})\s*GPA\b'
             for line in lines:
-                gpa_match = re.search(gpa_pattern, line, re.IGNORECASE)
+                gpa_match = GPA_PATTERN.search(line)
                 if gpa_match:
                     edu_entry['gpa'] = gpa_match.group(1) or gpa_match.group(2)
                     break
@@ -288,19 +529,13 @@ class ResumeParser:
         """Extract work experience from the resume."""
         experience = []
         
-        # Common experience section headers
-        exp_headers = [
-            'experience', 'work experience', 'professional experience',
-            'employment history', 'work history', 'professional background'
-        ]
-        
         # Find the experience section
-        exp_section = self._find_section(exp_headers)
+        exp_section = self._find_section(EXPERIENCE_HEADERS)
         if not exp_section:
             return experience
         
         # Split into individual experience entries
-        entries = re.split(r'\n\s*\n', exp_section)
+        entries = ENTRY_SPLIT_PATTERN.split(exp_section)
         
         for entry in entries:
             # Skip empty entries
@@ -330,8 +565,7 @@ class ResumeParser:
                 second_line = lines[1]
                 
                 # Check if this line contains dates
-                date_pattern = r'(\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)[a-z]*[\s,.-]*(?:19|20)\d{2}[\s]*[-–—]?[\s]*(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)[a-z]*[\s,.-]*(?:19|20)\d{2}|Present|Current|Now)\b|\b(?:19|20)\d{2}[\s]*[-–—][\s]*(?:19|20)?\d{2}\b)'
-                date_match = re.search(date_pattern, second_line, re.IGNORECASE)
+                date_match = DATE_PATTERN.search(second_line)
                 
                 if date_match:
                     exp_entry['dates'] = date_match.group(0)
@@ -378,7 +612,7 @@ class ResumeParser:
                     line == exp_entry['location']
                 ]):
                     # Clean up bullet points
-                    line = re.sub(r'^[•\-*]\s*', '', line)
+                    line = BULLET_PATTERN.sub('', line)
                     description_lines.append(line)
             
             if description_lines:
@@ -392,21 +626,15 @@ class ResumeParser:
         """Extract skills from the resume."""
         skills = set()
         
-        # Common skills section headers
-        skill_headers = [
-            'skills', 'technical skills', 'key skills', 'core competencies',
-            'technical expertise', 'technologies', 'programming languages'
-        ]
-        
         # Find the skills section
-        skill_section = self._find_section(skill_headers)
+        skill_section = self._find_section(SKILL_HEADERS)
         if skill_section:
             # Extract skills from the skills section
             lines = [line.strip() for line in skill_section.split('\n') if line.strip()]
             
             for line in lines:
                 # Split by common delimiters
-                for item in re.split(r'[,;•\-*|]', line):
+                for item in SKILL_DELIMITER_PATTERN.split(line):
                     skill = item.strip()
                     if skill and len(skill) > 1:  # Skip empty or single-character items
                         skills.add(skill)
@@ -415,44 +643,26 @@ class ResumeParser:
         sections_to_search = []
         
         # Experience section
-        exp_headers = ['experience', 'work experience', 'professional experience']
-        exp_section = self._find_section(exp_headers)
+        exp_section = self._find_section(['experience', 'work experience', 'professional experience'])
         if exp_section:
             sections_to_search.append(exp_section)
         
         # Projects section
-        project_headers = ['projects', 'personal projects', 'academic projects']
-        project_section = self._find_section(project_headers)
+        project_section = self._find_section(PROJECT_HEADERS)
         if project_section:
             sections_to_search.append(project_section)
         
-        # Common tech skills to look for
-        common_tech_skills = [
-            'python', 'javascript', 'java', 'c++', 'c#', 'ruby', 'php', 'swift', 'kotlin', 'go', 'rust',
-            'html', 'css', 'sass', 'less', 'typescript', 'react', 'angular', 'vue', 'node.js', 'django',
-            'flask', 'spring', 'rails', 'laravel', 'asp.net', 'sql', 'mysql', 'postgresql', 'mongodb',
-            'redis', 'docker', 'kubernetes', 'aws', 'azure', 'gcp', 'git', 'jenkins', 'ansible', 'terraform',
-            'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas', 'numpy',
-            'data analysis', 'data visualization', 'tableau', 'power bi', 'big data', 'hadoop', 'spark'
-        ]
-        
+        # Match taxonomy skills (and their aliases) in a single pass per section
+        matcher = get_skill_matcher()
         for section in sections_to_search:
-            for skill in common_tech_skills:
-                if re.search(r'\b' + re.escape(skill) + r'\b', section.lower()):
-                    skills.add(skill)
+            skills.update(matcher.find_skills(section))
         
         return sorted(list(skills))
     
     def _extract_summary(self) -> str:
         """Extract a summary/objective section from the resume."""
-        # Common summary section headers
-        summary_headers = [
-            'summary', 'professional summary', 'career objective',
-            'objective', 'about me', 'profile'
-        ]
-        
         # Find the summary section
-        summary_section = self._find_section(summary_headers)
+        summary_section = self._find_section(SUMMARY_HEADERS)
         if summary_section:
             return summary_section.strip()
         
@@ -463,49 +673,69 @@ class ResumeParser:
         
         return ""
     
+    def _build_section_index(self) -> Dict[str, tuple]:
+        """
+        Scan the resume once and map each known section header to its line span.
+        
+        Returns:
+            Dictionary of lowercased header -> (header line, start line, end line),
+            keeping only the first occurrence of each header
+        """
+        index: Dict[str, tuple] = {}
+        open_spans: List[str] = []
+        
+        for i, line in enumerate(self.lines):
+            if open_spans:
+                if SECTION_HEADER_PATTERN.match(line):
+                    # Any header-looking line ends the sections still open
+                    for header in open_spans:
+                        header_idx, start_idx, _ = index[header]
+                        index[header] = (header_idx, i if start_idx is None else start_idx, i)
+                    open_spans = []
+                elif line.strip():
+                    # A section body starts at its first non-empty line
+                    for header in open_spans:
+                        header_idx, start_idx, end_idx = index[header]
+                        if start_idx is None:
+                            index[header] = (header_idx, i, end_idx)
+            
+            match = KNOWN_HEADER_PATTERN.match(line.strip())
+            if match:
+                header = match.group(1).lower()
+                if header not in index:
+                    index[header] = (i, None, None)
+                    open_spans.append(header)
+        
+        # Sections still open run to the end of the document
+        for header in open_spans:
+            header_idx, start_idx, _ = index[header]
+            index[header] = (header_idx, start_idx, len(self.lines))
+        
+        return index
+    
     def _find_section(self, possible_headers: List[str]) -> Optional[str]:
         """
         Find a section in the resume based on possible header names.
         
         Args:
-            possible_headers: List of possible section header names
+            possible_headers: List of possible section header names (must be in SECTION_HEADERS)
             
         Returns:
             The section content as a string, or None if not found
         """
-        # Create a case-insensitive pattern for the headers
-        pattern = r'(?i)^\s*(' + '|'.join(map(re.escape, possible_headers)) + r')\s*[\s:]*$'
-        
-        # Split the text into lines for processing
-        lines = self.text.split('\n')
-        
-        # Find the start of the section
-        start_idx = -1
-        for i, line in enumerate(lines):
-            if re.match(pattern, line.strip()):
-                start_idx = i + 1
-                break
-        
-        if start_idx == -1:
+        # Use the earliest header in the document, as a top-down scan would
+        spans = [self._section_index[h] for h in possible_headers if h in self._section_index]
+        if not spans:
             return None
+        header_idx, start_idx, end_idx = min(spans)
         
-        # Find the end of the section (next section header or end of document)
-        section_lines = []
-        section_header_pattern = r'^\s*([A-Z][A-Za-z ]+)\s*[\s:]*$'
-        
-        for line in lines[start_idx:]:
-            # Skip empty lines at the beginning
-            if not section_lines and not line.strip():
-                continue
-                
-            # Check if we've reached the next section
-            if re.match(section_header_pattern, line):
-                break
-                
-            section_lines.append(line)
-        
-        # Clean up the section text
-        section_text = '\n'.join(section_lines).strip()
+        if header_idx not in self._section_cache:
+            if start_idx is None:
+                section_text = ""
+            else:
+                section_text = '\n'.join(self.lines[start_idx:end_idx]).strip()
+            self._section_cache[header_idx] = section_text
+        section_text = self._section_cache[header_idx]
         
         # Remove any trailing section headers that might have been included
         for header in possible_headers:
@@ -531,6 +761,59 @@ def parse_resume(file_path: str) -> Dict[str, Any]:
         logger.error(f"Error parsing resume: {str(e)}")
         return {"error": f"Failed to parse resume: {str(e)}"}
 
+def pipe_docs(parsers: List[ResumeParser], batch_size: int = SPACY_BATCH_SIZE) -> None:
+    """
+    Build the spaCy documents of several parsers with one ``nlp.pipe`` call.
+    
+    Each parser's ``nlp`` timing gets an equal share of the batch time.
+    """
+    nlp = get_nlp()
+    if nlp is None:
+        return
+    pending = [p for p in parsers if p.text]
+    if not pending:
+        return
+    start = time.perf_counter()
+    for parser, doc in zip(pending, nlp.pipe((p.text for p in pending), batch_size=batch_size)):
+        parser.set_doc(doc)
+    share = (time.perf_counter() - start) / len(pending)
+    for parser in pending:
+        parser.timings["nlp"] = share
+
+def parse_resumes(file_paths: List[str], batch_size: int = SPACY_BATCH_SIZE) -> List[Dict[str, Any]]:
+    """
+    Parse several resume files, running spaCy over them in batches.
+    
+    Args:
+        file_paths: Paths to the resume files (PDF, DOCX, or TXT)
+        batch_size: Number of texts per ``nlp.pipe`` batch
+        
+    Returns:
+        List of structured resume data (or error dicts), in input order
+    """
+    parsers: List[Optional[ResumeParser]] = []
+    results: List[Dict[str, Any]] = []
+    for file_path in file_paths:
+        try:
+            parsers.append(ResumeParser(file_path))
+            results.append({})
+        except Exception as e:
+            logger.error(f"Error parsing resume: {str(e)}")
+            parsers.append(None)
+            results.append({"error": f"Failed to parse resume: {str(e)}"})
+    
+    pipe_docs([p for p in parsers if p is not None], batch_size)
+    
+    for i, parser in enumerate(parsers):
+        if parser is None:
+            continue
+        try:
+            results[i] = parser.parse()
+        except Exception as e:
+            logger.error(f"Error parsing resume: {str(e)}")
+            results[i] = {"error": f"Failed to parse resume: {str(e)}"}
+    return results
+
 # Example usage
 if __name__ == "__main__":
     import sys
@@ -0,0 +1,192 @@
+"""
+Section-level resume review with reuse of unchanged sections.
+
+Resumes are split into sections and each section is hashed together with
+the review context (target role, experience level, job description). For
+signed-in users the feedback for a section is stored in DBGPTResult, so when
+they re-run a review after a small edit only the sections whose hash
+changed go back to GPT.
+"""
+import re
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.models.gpt_result import DBGPTResult
+from app.services.gpt_service import gpt_service
+from app.services.resume_parser import KNOWN_HEADER_PATTERN
+from app.utils.disk_cache import hash_bytes
+from app.utils.prompt_utils import fill_prompt
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SECTION_REVIEW_CATEGORY = "resume_section_review"
+SECTION_REVIEW_PROMPT = "resume_section_review"
+
+# Bump when the section prompt or feedback format changes, so old feedback
+# is no longer reused
+SECTION_REVIEW_VERSION = "1"
+
+# Text before the first recognised header (name, contact details)
+HEADER_SECTION = "contact"
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def split_resume_sections(resume: Union[str, Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """
+    Split a resume into named sections, in document order.
+
+    Plain text is split on the section headers the parser recognises; a
+    structured (GPT-parsed) resume is split on its top-level keys. Repeated
+    section names get a numeric suffix so every name is unique.
+
+    Args:
+        resume: Resume text or structured resume dict
+
+    Returns:
+        List of (section name, section content) pairs, skipping empty sections
+    """
+    if isinstance(resume, dict):
+        raw = [
+            (str(key), value if isinstance(value, str) else json.dumps(value, indent=2))
+            for key, value in resume.items()
+        ]
+    else:
+        raw = []
+        name, lines = HEADER_SECTION, []
+        for line in resume.split("\n"):
+            match = KNOWN_HEADER_PATTERN.match(line.strip())
+            if match:
+                raw.append((name, "\n".join(lines)))
+                name, lines = match.group(1).lower(), []
+            else:
+                lines.append(line)
+        raw.append((name, "\n".join(lines)))
+
+    sections: List[Tuple[str, str]] = []
+    seen: Dict[str, int] = {}
+    for name, content in raw:
+        if not content.strip():
+            continue
+        seen[name] = seen.get(name, 0) + 1
+        sections.append((name if seen[name] == 1 else f"{name} #{seen[name]}", content.strip()))
+    return sections
+
+
+def section_key(name: str, content: str, context: Dict[str, str]) -> str:
+    """Hash identifying a section's review: its name, whitespace-normalised content and the review context."""
+    normalized = WHITESPACE_PATTERN.sub(" ", content).strip()
+    parts = [SECTION_REVIEW_VERSION, json.dumps(context, sort_keys=True), name, normalized]
+    return hash_bytes("\0".join(parts).encode())
+
+
+def _load_previous_reviews(db: Session, user_id: str, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Return the user's latest stored section feedback for any of the given keys."""
+    if not keys:
+        return {}
+    key_column = DBGPTResult.input_data["key"].as_string()
+    rows = db.query(key_column, DBGPTResult.output_text).filter(
+        DBGPTResult.category == SECTION_REVIEW_CATEGORY,
+        DBGPTResult.user_id == user_id,
+        key_column.in_(keys)
+    ).order_by(DBGPTResult.created_at.desc())
+
+    previous: Dict[str, Dict[str, Any]] = {}
+    for key, output_text in rows:
+        if key not in previous:
+            try:
+                previous[key] = json.loads(output_text)
+            except ValueError:
+                continue
+    return previous
+
+
+def review_resume_sections(
+    db: Session,
+    resume: Union[str, Dict[str, Any]],
+    user_id: Optional[str] = None,
+    target_role: str = "",
+    experience_level: str = "",
+    job_description: str = ""
+) -> Dict[str, Any]:
+    """
+    Review a resume section by section, reusing feedback for unchanged sections.
+
+    Changed sections are reviewed together in a single GPT call and their
+    feedback is stored for the next run.
+
+    Args:
+        db: Database session
+        resume: Resume text or structured resume dict
+        user_id: Authenticated owner of the resume; feedback is only stored
+            and reused per user, anonymous reviews analyze every section
+        target_role: Target role for the review
+        experience_level: Candidate experience level
+        job_description: Target job description
+
+    Returns:
+        Dictionary with per-section feedback (in document order), the names
+        of the sections that were reused and re-analyzed, and any raw GPT
+        output that could not be split by section
+
+    Raises:
+        HTTPException: 500 if the GPT call fails
+    """
+    context = {
+        "target_role": target_role or "",
+        "experience_level": experience_level or "",
+        "job_description": job_description or "",
+    }
+    sections = split_resume_sections(resume)
+    keys = {name: section_key(name, content, context) for name, content in sections}
+    feedback = _load_previous_reviews(db, user_id, list(keys.values())) if user_id else {}
+
+    changed = {name: content for name, content in sections if keys[name] not in feedback}
+    raw_output = None
+    if changed:
+        prompt = fill_prompt(
+            SECTION_REVIEW_PROMPT,
+            sections=json.dumps(changed, indent=2),
+            target_role=context["target_role"] or "not specified",
+            experience_level=context["experience_level"] or "not specified",
+            job_description=context["job_description"] or "not provided"
+        )
+        result = gpt_service.call_gpt(prompt, temperature=0.3)
+        if "error" in result:
+            raise HTTPException(status_code=500, detail=f"AI service error: {result['error']}")
+        raw_output = result.get("raw_output")
+
+        for name in changed:
+            section_feedback = result.get(name)
+            if not isinstance(section_feedback, dict):
+                # Not stored, so the section is retried on the next run
+                logger.warning(f"No feedback returned for resume section '{name}'")
+                feedback[keys[name]] = {"score": None, "feedback": "", "strengths": [], "improvements": []}
+                continue
+            feedback[keys[name]] = section_feedback
+            if not user_id:
+                continue
+            db.add(DBGPTResult(
+                user_id=user_id,
+                category=SECTION_REVIEW_CATEGORY,
+                input_data={"key": keys[name], "section": name, **context},
+                output_text=json.dumps(section_feedback),
+            ))
+        db.commit()
+
+    return {
+        "sections": [
+            {**feedback[keys[name]], "section": name, "reused": name not in changed}
+            for name, _ in sections
+        ],
+        "reused_sections": [name for name, _ in sections if name not in changed],
+        "analyzed_sections": list(changed),
+        # Unstructured GPT output, if the response could not be split by section
+        "raw_output": raw_output,
+    }
@@ -0,0 +1,165 @@
+import os
+import logging
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bundled taxonomy; extra files can be added with SKILL_TAXONOMY_PATHS
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "skill_taxonomy.txt")
+
+
+def load_skill_taxonomy(paths: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    Load skill taxonomy files into an alias -> canonical skill mapping.
+
+    Each non-comment line has the form ``canonical: alias, alias``. Canonical
+    names map to themselves, and the first definition of a term wins. Terms
+    prefixed with ``=`` keep their capitalisation and only match in exactly
+    that case.
+
+    Args:
+        paths: Taxonomy files to read, defaults to the bundled taxonomy plus
+            any files listed in the SKILL_TAXONOMY_PATHS environment variable
+
+    Returns:
+        Dictionary mapping every term (lowercased unless case-sensitive) to
+        its canonical skill name
+    """
+    if paths is None:
+        paths = [DEFAULT_TAXONOMY_PATH]
+        extra = os.getenv("SKILL_TAXONOMY_PATHS", "")
+        paths.extend(p for p in extra.split(os.pathsep) if p.strip())
+
+    terms: Dict[str, str] = {}
+    for path in paths:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    canonical, _, aliases = line.partition(":")
+                    canonical = canonical.strip()
+                    if not canonical.lstrip("="):
+                        continue
+                    for term in [canonical] + aliases.split(","):
+                        term = term.strip()
+                        term = term[1:].strip() if term.startswith("=") else term.lower()
+                        if term and term not in terms:
+                            terms[term] = canonical.lstrip("=").strip().lower()
+        except FileNotFoundError:
+            logger.warning(f"Skill taxonomy file not found: {path}")
+    return terms
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick multi-pattern matcher for skill terms.
+
+    The automaton is built once from the taxonomy, so matching a section
+    is a single pass over its text regardless of how many skills are known.
+    """
+
+    def __init__(self, terms: Dict[str, str]):
+        """
+        Build the automaton.
+
+        Args:
+            terms: Mapping of term -> canonical skill name; terms that aren't
+                all lowercase only match in exactly their case
+        """
+        self.terms = terms
+        # Trie transitions, failure links and (term length, canonical,
+        # case-sensitive term or None) outputs per state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, str, Optional[str]]]] = [[]]
+
+        for term, canonical in terms.items():
+            self._add_term(term, canonical)
+        self._build_failure_links()
+
+    def _add_term(self, term: str, canonical: str) -> None:
+        exact = term if term != term.lower() else None
+        term = term.lower()
+        state = 0
+        for ch in term:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._output[state].append((len(term), canonical, exact))
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                # Inherit the matches ending at the failure state
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find_skills(self, text: str) -> Set[str]:
+        """
+        Find all taxonomy skills mentioned in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of canonical skill names whose terms appear on word boundaries
+        """
+        found: Set[str] = set()
+        if not text:
+            return found
+
+        original = text
+        text = text.lower()
+        goto, fail, output = self._goto, self._fail, self._output
+        length = len(text)
+        state = 0
+
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not output[state]:
+                continue
+
+            # Word boundaries only apply at term edges that are word characters,
+            # so terms like "c++" and ".net" still match next to punctuation
+            if _is_word_char(ch) and i + 1 < length and _is_word_char(text[i + 1]):
+                continue
+            for term_len, canonical, exact in output[state]:
+                start = i - term_len + 1
+                if start > 0 and _is_word_char(text[start]) and _is_word_char(text[start - 1]):
+                    continue
+                if exact is not None and original[start:i + 1] != exact:
+                    continue
+                found.add(canonical)
+
+        return found
+
+
+@lru_cache(maxsize=1)
+def get_skill_matcher() -> SkillMatcher:
+    """Return the per-process skill matcher, building it on first use."""
+    terms = load_skill_taxonomy()
+    logger.info(f"Built skill matcher with {len(terms)} terms")
+    return SkillMatcher(terms)
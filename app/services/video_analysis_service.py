@@ -1,14 +1,23 @@
 import os
 import base64
 import json
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from openai import OpenAI
 from dotenv import load_dotenv
-import tempfile
-import subprocess
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from app.stt.audio_prep import make_scratch_dir, plan_speech_audio
+from app.stt.transcript_cache import cached_transcript
+from app.stt.transcription import transcribe_long_audio
+from app.utils.rate_limiter import get_rate_limiter
 
 load_dotenv()
 
+# Score visual professionalism from frames alongside the transcript analysis
+VIDEO_VISUAL_SCORING = os.getenv("VIDEO_VISUAL_SCORING", "true").lower() in ("1", "true", "yes", "on")
+VISION_MAX_IMAGES = int(os.getenv("MAX_IMAGES", "8"))
+
 
 class VideoAnalysisService:
     """Service for analyzing video interview recordings using OpenAI"""
@@ -32,38 +41,74 @@ class VideoAnalysisService:
             return False
     
     def extract_audio_from_video(self, video_path: str) -> Optional[str]:
-        """Extract audio from video file using ffmpeg"""
+        """Extract speech-optimized audio (16 kHz mono, silence trimmed) into a scratch dir"""
+        media = self.extract_media(video_path, with_frames=False)
+        return media["audio_path"] if media else None
+    
+    def extract_media(
+        self,
+        video_path: str,
+        workdir: Optional[str] = None,
+        with_frames: bool = True,
+        max_images: int = 8,
+        with_audio: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extract the speech audio track and the frames for professionalism
+        scoring in a single ffmpeg decode of the video.
+        
+        Args:
+            video_path: Uploaded video
+            workdir: Output directory; a new scratch directory by default
+                (remove it with discard_scratch(audio_path))
+            with_frames: Extract frames
+            max_images: Maximum number of frames to choose
+            with_audio: Extract the audio track
+        
+        Returns:
+            Dictionary with audio_path (None without audio) and the chosen
+            frames (images, frame_names), or None if ffmpeg fails
+        """
+        from app.cv.emotion_recognition import extract_media, select_frames_for_scoring
+        own_workdir = workdir is None
+        workdir = workdir or make_scratch_dir()
         try:
-            audio_path = video_path.rsplit('.', 1)[0] + '.mp3'
-            
-            # Use ffmpeg to extract audio
-            command = [
-                'ffmpeg', '-i', video_path,
-                '-vn',  # No video
-                '-acodec', 'libmp3lame',
-                '-q:a', '2',  # Quality
-                audio_path,
-                '-y'  # Overwrite if exists
-            ]
-            
-            subprocess.run(command, check=True, capture_output=True)
-            return audio_path
+            audio_path, audio_args = plan_speech_audio(video_path, workdir) if with_audio else (None, None)
+            sc_frames, uf_frames, audio_path = extract_media(
+                video_path, workdir, audio_path=audio_path, audio_args=audio_args, frames=with_frames
+            )
+            images, frame_names = select_frames_for_scoring(sc_frames, uf_frames, max_images)
+            return {
+                "audio_path": audio_path,
+                "images": images,
+                "frame_names": frame_names
+            }
         except Exception as e:
-            print(f"Error extracting audio: {e}")
+            print(f"Error extracting media: {e}")
+            if own_workdir:
+                shutil.rmtree(workdir, ignore_errors=True)
             return None
     
+    def _transcribe_file(self, audio_path: str) -> str:
+        """Transcribe a single audio file (within the API upload limit)"""
+        with open(audio_path, 'rb') as audio_file:
+            return self.client.audio.transcriptions.create(
+                model="whisper-1",
+                file=audio_file,
+                response_format="text"
+            )
+    
     def transcribe_audio(self, audio_path: str) -> Dict[str, Any]:
-        """Transcribe audio using OpenAI Whisper API"""
+        """Transcribe audio using OpenAI Whisper API, in parallel chunks for long recordings"""
         if not self._ensure_client():
             return {"error": "OpenAI client not initialized"}
         
         try:
-            with open(audio_path, 'rb') as audio_file:
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    response_format="text"
-                )
+            # Retries and re-uploads of the same recording reuse the transcript
+            transcript = cached_transcript(
+                audio_path, "whisper-1",
+                lambda path: transcribe_long_audio(path, self._transcribe_file)
+            )
             
             return {
                 "transcript": transcript,
@@ -113,15 +158,16 @@ Candidate's Response (transcribed from video):
 
 Please analyze this interview response and provide detailed feedback."""
 
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.7,
-                response_format={"type": "json_object"}
-            )
+            with get_rate_limiter("openai").acquire():
+                response = self.client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    temperature=0.7,
+                    response_format={"type": "json_object"}
+                )
             
             content = response.choices[0].message.content
             analysis = json.loads(content)
@@ -137,13 +183,75 @@ Please analyze this interview response and provide detailed feedback."""
                 "success": False
             }
     
+    def score_visual_professionalism(self, media: Dict[str, Any]) -> Dict[str, Any]:
+        """Score visual professionalism of extracted frames with the vision model"""
+        from app.prompts.emotion_prompt import score_professionalism_from_images
+        try:
+            if not media["images"]:
+                return {"error": "No frames extracted from video", "success": False}
+            with get_rate_limiter("openai").acquire():
+                score, details = score_professionalism_from_images(media["images"])
+            return {
+                "score": score,
+                "details": details,
+                "frames": media["frame_names"],
+                "success": True
+            }
+        except Exception as e:
+            return {"error": f"Visual scoring failed: {str(e)}", "success": False}
+    
+    def _analyze_speech(
+        self,
+        audio_path: str,
+        question: str,
+        position: str,
+        progress: Callable[[str], None]
+    ) -> Dict[str, Any]:
+        """Audio branch: transcribe the extracted speech audio, then analyze the transcript"""
+        transcription_result = self.transcribe_audio(audio_path)
+        if not transcription_result.get("success"):
+            return {"error": transcription_result.get("error", "Transcription failed"), "success": False}
+        transcript = transcription_result["transcript"]
+        progress("transcribed")
+        
+        # Starts as soon as the transcript is ready, while frames may still be scored
+        analysis_result = self.analyze_interview_response(
+            transcript=transcript,
+            question=question,
+            position=position
+        )
+        if not analysis_result.get("success"):
+            return {
+                "transcript": transcript,
+                "error": analysis_result.get("error", "Analysis failed"),
+                "success": False
+            }
+        progress("analysed")
+        return {"transcript": transcript, "analysis": analysis_result["analysis"], "success": True}
+    
     def analyze_video_interview(
         self,
         video_path: str,
         question: str,
-        position: str
+        position: str,
+        progress: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
-        """Complete video interview analysis pipeline"""
+        """
+        Complete video interview analysis pipeline.
+        
+        The speech audio and (if VIDEO_VISUAL_SCORING is on) the scoring
+        frames are extracted in a single ffmpeg decode. Then two branches run
+        concurrently: speech (transcription -> transcript analysis) and
+        visuals (vision scoring), so the total time is extraction plus the
+        longer branch. Results are merged into one analysis/scores; a failed
+        visual branch is reported in the analysis but doesn't fail the
+        interview.
+        
+        progress, if given, is called with each stage the speech branch
+        reaches (audio_extracted, transcribed, analysed), possibly from
+        another thread.
+        """
+        progress = progress or (lambda stage: None)
         result = {
             "transcript": "",
             "feedback": "",
@@ -152,52 +260,45 @@ Please analyze this interview response and provide detailed feedback."""
             "success": False
         }
         
+        workdir = make_scratch_dir()
         try:
-            # Step 1: Extract audio from video
-            audio_path = self.extract_audio_from_video(video_path)
-            if not audio_path:
-                return {
-                    **result,
-                    "error": "Failed to extract audio from video"
-                }
-            
-            # Step 2: Transcribe audio
-            transcription_result = self.transcribe_audio(audio_path)
-            if not transcription_result.get("success"):
-                return {
-                    **result,
-                    "error": transcription_result.get("error", "Transcription failed")
-                }
-            
-            transcript = transcription_result["transcript"]
-            result["transcript"] = transcript
-            
-            # Step 3: Analyze the response
-            analysis_result = self.analyze_interview_response(
-                transcript=transcript,
-                question=question,
-                position=position
+            media = self.extract_media(
+                video_path, workdir, with_frames=VIDEO_VISUAL_SCORING, max_images=VISION_MAX_IMAGES
             )
+            if not media or not media["audio_path"]:
+                return {**result, "error": "Failed to extract audio from video"}
+            progress("audio_extracted")
+            
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                speech_future = executor.submit(self._analyze_speech, media["audio_path"], question, position, progress)
+                visual_future = (
+                    executor.submit(self.score_visual_professionalism, media)
+                    if VIDEO_VISUAL_SCORING else None
+                )
+                speech = speech_future.result()
+                visual = visual_future.result() if visual_future else None
             
-            if not analysis_result.get("success"):
+            result["transcript"] = speech.get("transcript", "")
+            if not speech.get("success"):
                 return {
                     **result,
-                    "error": analysis_result.get("error", "Analysis failed")
+                    "error": speech.get("error", "Analysis failed")
                 }
             
-            analysis = analysis_result["analysis"]
+            analysis = dict(speech["analysis"])
+            scores = dict(analysis.get("scores", {}))
+            if visual and visual.get("success"):
+                analysis["visual"] = visual["details"]
+                analysis["visual_frames"] = visual["frames"]
+                scores["visual_professionalism"] = visual["score"]
+            elif visual:
+                analysis["visual_error"] = visual.get("error")
+            
             result["analysis"] = analysis
             result["feedback"] = analysis.get("overall_feedback", "")
-            result["scores"] = analysis.get("scores", {})
+            result["scores"] = scores
             result["success"] = True
             
-            # Cleanup audio file
-            try:
-                if os.path.exists(audio_path):
-                    os.remove(audio_path)
-            except:
-                pass
-            
             return result
             
         except Exception as e:
@@ -205,6 +306,9 @@ Please analyze this interview response and provide detailed feedback."""
                 **result,
                 "error": f"Video analysis failed: {str(e)}"
             }
+        finally:
+            # Cleanup scratch audio and frames, whether or not the analysis succeeded
+            shutil.rmtree(workdir, ignore_errors=True)
 
 
 class FakeVideoAnalysisService:
@@ -214,9 +318,13 @@ class FakeVideoAnalysisService:
         self,
         video_path: str,
         question: str,
-        position: str
+        position: str,
+        progress: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """Return fake analysis results"""
+        if progress:
+            for stage in ("audio_extracted", "transcribed", "analysed"):
+                progress(stage)
         return {
             "transcript": "This is a sample transcript of the video interview response. The candidate discussed their experience with relevant technologies and demonstrated good communication skills.",
             "feedback": f"""Great job on your video interview response! Here's my detailed feedback:
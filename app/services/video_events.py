@@ -0,0 +1,164 @@
+"""
+Push updates for video interview processing.
+
+Clients subscribe to a set of sessions (over SSE or WebSocket) instead of
+polling the status endpoints. Workers run in other processes and record
+their stage and progress on the video job, so each web process runs a
+single watcher that checks all currently subscribed sessions with one
+query per VIDEO_EVENTS_INTERVAL and fans changes out to the subscribers.
+Database load no longer grows with the number of waiting clients or how
+often they poll, and the watcher stops when nobody is subscribed.
+"""
+import os
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.video_interview import DBVideoInterview, DBVideoJob
+from app.services.video_jobs import STAGE_PROGRESS
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+VIDEO_EVENTS_INTERVAL = float(os.getenv("VIDEO_EVENTS_INTERVAL", "1"))
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+def interview_result(video_interview: DBVideoInterview) -> Dict[str, Any]:
+    """Results of a video interview as returned to clients."""
+    return {
+        "session_id": video_interview.session_id,
+        "question": video_interview.question_text,
+        "position": video_interview.position,
+        "status": video_interview.status,
+        "transcript": video_interview.transcript or "",
+        "feedback": video_interview.feedback or "",
+        "scores": video_interview.scores or {},
+        "analysis": video_interview.analysis or {},
+        "created_at": video_interview.created_at
+    }
+
+
+def session_event(video_interview: DBVideoInterview, job: Optional[DBVideoJob]) -> Dict[str, Any]:
+    """
+    Current state of a session as a push event.
+
+    Completed sessions carry their results, so clients don't need a
+    follow-up request.
+    """
+    status = video_interview.status
+    if status in TERMINAL_STATUSES:
+        stage = status
+    elif job is not None:
+        stage = job.stage
+    else:
+        stage = "pending" if status == "pending" else "uploaded"
+    event = {
+        "session_id": video_interview.session_id,
+        "status": status,
+        "stage": stage,
+        "progress": STAGE_PROGRESS.get(stage, 0),
+    }
+    if status == "completed":
+        event["result"] = interview_result(video_interview)
+    elif status == "failed":
+        event["error"] = video_interview.feedback
+    return event
+
+
+def load_session_events(db: Session, session_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Current events for the given sessions, with one query; unknown sessions are left out."""
+    rows = db.query(DBVideoInterview, DBVideoJob).outerjoin(
+        DBVideoJob, DBVideoJob.session_id == DBVideoInterview.session_id
+    ).filter(DBVideoInterview.session_id.in_(list(session_ids))).all()
+    return {interview.session_id: session_event(interview, job) for interview, job in rows}
+
+
+def _fingerprint(event: Dict[str, Any]):
+    return event["status"], event["stage"], event["progress"]
+
+
+class VideoEventBroker:
+    """Per-process fan-out of session events to asyncio subscribers."""
+
+    def __init__(self, interval: float = VIDEO_EVENTS_INTERVAL):
+        self.interval = interval
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._last: Dict[str, tuple] = {}
+        # Fingerprints new subscribers were given, checked on their first tick
+        self._fresh: Dict[asyncio.Queue, Dict[str, tuple]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, session_ids: Iterable[str], initial: Dict[str, Dict[str, Any]]) -> asyncio.Queue:
+        """
+        Register a subscriber for sessions.
+
+        Args:
+            session_ids: Sessions to follow
+            initial: Events the subscriber already has (from load_session_events),
+                so only later changes are queued; a session that changed
+                between loading them and subscribing is queued on the next tick
+
+        Returns:
+            Queue receiving event dictionaries
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._fresh[queue] = {
+            session_id: _fingerprint(event) for session_id, event in initial.items()
+        }
+        for session_id in session_ids:
+            self._subscribers.setdefault(session_id, set()).add(queue)
+            if session_id in initial and session_id not in self._last:
+                self._last[session_id] = _fingerprint(initial[session_id])
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._watch())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue, session_ids: Iterable[str]) -> None:
+        self._fresh.pop(queue, None)
+        for session_id in session_ids:
+            queues = self._subscribers.get(session_id)
+            if queues is None:
+                continue
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[session_id]
+                self._last.pop(session_id, None)
+
+    def _load(self, session_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        db = SessionLocal()
+        try:
+            return load_session_events(db, session_ids)
+        finally:
+            db.close()
+
+    async def _watch(self) -> None:
+        while self._subscribers:
+            await asyncio.sleep(self.interval)
+            session_ids = list(self._subscribers)
+            if not session_ids:
+                break
+            # Taken before loading, so these subscribers' events are older than the load
+            fresh = dict(self._fresh)
+            try:
+                events = await asyncio.to_thread(self._load, session_ids)
+            except Exception as e:
+                logger.warning(f"Video event watcher query failed: {e}")
+                continue
+            for queue in fresh:
+                self._fresh.pop(queue, None)
+            for session_id, event in events.items():
+                fingerprint = _fingerprint(event)
+                changed = self._last.get(session_id) != fingerprint
+                self._last[session_id] = fingerprint
+                for queue in list(self._subscribers.get(session_id, ())):
+                    if changed or (queue in fresh and fresh[queue].get(session_id) != fingerprint):
+                        queue.put_nowait(event)
+
+
+video_event_broker = VideoEventBroker()
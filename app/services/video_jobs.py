@@ -0,0 +1,436 @@
+"""
+Video interview processing jobs.
+
+Uploads enqueue a ``DBVideoJob`` and return immediately; a bounded pool of
+worker processes claims jobs (highest priority first, then oldest) with
+their own DB sessions and runs the ffmpeg/Whisper/GPT analysis outside the
+web process. A claimed job holds a lease that its worker keeps extending;
+if the worker dies the lease expires and another worker retries the job,
+up to ``VIDEO_JOB_MAX_ATTEMPTS`` times.
+
+The pool starts with the web app unless VIDEO_WORKERS_EMBEDDED is off, in
+which case run it as a separate service:
+
+    python -m app.services.video_jobs --workers 2
+"""
+import os
+import sys
+import uuid
+import time
+import signal
+import logging
+import argparse
+import threading
+import multiprocessing
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.database import Base, SessionLocal, engine
+from app.models.video_interview import DBVideoInterview, DBVideoJob
+from app.services.video_analysis_service import video_analysis_service
+from app.services.video_storage import VIDEO_ARCHIVE, archive_video, maybe_collect_garbage
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+VIDEO_WORKERS = int(os.getenv("VIDEO_WORKERS", "2"))
+VIDEO_WORKERS_EMBEDDED = os.getenv("VIDEO_WORKERS_EMBEDDED", "true").lower() in ("1", "true", "yes", "on")
+
+# Seconds a claimed job stays invisible to other workers without a heartbeat
+VIDEO_JOB_VISIBILITY_TIMEOUT = int(os.getenv("VIDEO_JOB_VISIBILITY_TIMEOUT", "600"))
+VIDEO_JOB_POLL_INTERVAL = float(os.getenv("VIDEO_JOB_POLL_INTERVAL", "2"))
+VIDEO_JOB_MAX_ATTEMPTS = int(os.getenv("VIDEO_JOB_MAX_ATTEMPTS", "3"))
+
+# Candidates fetched per claim attempt; another worker may win some of them
+CLAIM_BATCH = 5
+
+# Pipeline stages pushed to clients, with the progress (percent) each one
+# marks. Speech and visual branches run concurrently, so progress only ever
+# moves forward.
+STAGE_PROGRESS = {
+    "uploaded": 0,
+    "started": 5,
+    "audio_extracted": 20,
+    "transcribed": 60,
+    "analysed": 90,
+    "completed": 100,
+    "failed": 100,
+}
+
+
+def _claimable(now: datetime):
+    return or_(
+        DBVideoJob.status == "queued",
+        and_(DBVideoJob.status == "running", DBVideoJob.lease_expires_at < now)
+    )
+
+
+def enqueue_video_job(db: Session, session_id: str, priority: int = 0) -> DBVideoJob:
+    """
+    Queue (or re-queue) processing for a video interview.
+
+    A job re-queued while a worker is still running it is simply claimed
+    again; the old run no longer owns the job and its result is dropped
+    (see process_video_job).
+
+    Args:
+        db: Database session
+        session_id: Video interview session id
+        priority: Higher priorities are claimed first
+
+    Returns:
+        The queued job
+    """
+    now = datetime.utcnow()
+    job = db.query(DBVideoJob).filter(DBVideoJob.session_id == session_id).first()
+    if job is None:
+        job = DBVideoJob(session_id=session_id, created_at=now)
+        db.add(job)
+    job.priority = priority
+    job.status = "queued"
+    job.stage = "uploaded"
+    job.progress = STAGE_PROGRESS["uploaded"]
+    job.attempts = 0
+    job.worker_id = None
+    job.lease_expires_at = None
+    job.last_error = None
+    job.updated_at = now
+    db.commit()
+    return job
+
+
+def enqueue_orphaned_interviews(db: Session) -> int:
+    """
+    Queue interviews left in "processing" without a job.
+
+    These were uploaded before the job queue existed or lost their job, and
+    would otherwise stay in processing forever.
+
+    Returns:
+        Number of interviews queued
+    """
+    queued = db.query(DBVideoJob.session_id)
+    orphans = db.query(DBVideoInterview.session_id).filter(
+        DBVideoInterview.status == "processing",
+        ~DBVideoInterview.session_id.in_(queued)
+    ).all()
+    for (session_id,) in orphans:
+        enqueue_video_job(db, session_id)
+    return len(orphans)
+
+
+def _fail(db: Session, job: DBVideoJob, error: str) -> None:
+    job.status = "failed"
+    job.stage = "failed"
+    job.progress = STAGE_PROGRESS["failed"]
+    job.last_error = error
+    job.lease_expires_at = None
+    job.updated_at = datetime.utcnow()
+    interview = db.query(DBVideoInterview).filter(DBVideoInterview.session_id == job.session_id).first()
+    if interview:
+        interview.status = "failed"
+        interview.feedback = error
+    db.commit()
+
+
+def claim_video_job(db: Session, worker_id: str) -> Optional[DBVideoJob]:
+    """
+    Claim the next job for a worker.
+
+    Claiming is a conditional UPDATE, so when several workers race for the
+    same job only one of them gets it. Expired jobs that already used all
+    their attempts are marked failed instead of being retried.
+
+    Returns:
+        The claimed job, or None if nothing is waiting
+    """
+    while True:
+        now = datetime.utcnow()
+        candidates = db.query(DBVideoJob.id).filter(_claimable(now)).order_by(
+            DBVideoJob.priority.desc(), DBVideoJob.created_at
+        ).limit(CLAIM_BATCH).all()
+        if not candidates:
+            return None
+
+        for (job_id,) in candidates:
+            claimed = db.query(DBVideoJob).filter(DBVideoJob.id == job_id, _claimable(now)).update({
+                DBVideoJob.status: "running",
+                DBVideoJob.stage: "started",
+                DBVideoJob.progress: STAGE_PROGRESS["started"],
+                DBVideoJob.worker_id: worker_id,
+                DBVideoJob.lease_expires_at: now + timedelta(seconds=VIDEO_JOB_VISIBILITY_TIMEOUT),
+                DBVideoJob.attempts: DBVideoJob.attempts + 1,
+                DBVideoJob.updated_at: now,
+            }, synchronize_session=False)
+            db.commit()
+            if not claimed:
+                continue
+
+            job = db.query(DBVideoJob).filter(DBVideoJob.id == job_id).first()
+            if job.attempts > VIDEO_JOB_MAX_ATTEMPTS:
+                logger.warning(f"Video job {job.session_id} exceeded {VIDEO_JOB_MAX_ATTEMPTS} attempts")
+                _fail(db, job, f"Processing failed after {VIDEO_JOB_MAX_ATTEMPTS} attempts: {job.last_error or 'worker lost'}")
+                break
+            return job
+
+
+def _extend_lease(job_id: int, worker_id: str) -> bool:
+    db = SessionLocal()
+    try:
+        extended = db.query(DBVideoJob).filter(
+            DBVideoJob.id == job_id,
+            DBVideoJob.worker_id == worker_id,
+            DBVideoJob.status == "running"
+        ).update({
+            DBVideoJob.lease_expires_at: datetime.utcnow() + timedelta(seconds=VIDEO_JOB_VISIBILITY_TIMEOUT)
+        }, synchronize_session=False)
+        db.commit()
+        return bool(extended)
+    finally:
+        db.close()
+
+
+def report_progress(job_id: int, worker_id: str, stage: str) -> None:
+    """
+    Record a pipeline stage reached by a running job.
+
+    Called from the analysis pipeline's threads, so it uses its own session.
+    Stages that would move progress backwards are ignored.
+    """
+    progress = STAGE_PROGRESS.get(stage)
+    if progress is None:
+        return
+    db = SessionLocal()
+    try:
+        db.query(DBVideoJob).filter(
+            DBVideoJob.id == job_id,
+            DBVideoJob.worker_id == worker_id,
+            DBVideoJob.status == "running",
+            DBVideoJob.progress < progress
+        ).update({
+            DBVideoJob.stage: stage,
+            DBVideoJob.progress: progress,
+            DBVideoJob.updated_at: datetime.utcnow()
+        }, synchronize_session=False)
+        db.commit()
+    except Exception as e:
+        logger.warning(f"Failed to report stage {stage} of video job {job_id}: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+@contextmanager
+def _lease_heartbeat(job_id: int, worker_id: str) -> Iterator[None]:
+    """Keep extending a job's lease while it is being processed."""
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(VIDEO_JOB_VISIBILITY_TIMEOUT / 3):
+            try:
+                if not _extend_lease(job_id, worker_id):
+                    return
+            except Exception as e:
+                logger.warning(f"Failed to extend lease of video job {job_id}: {e}")
+
+    thread = threading.Thread(target=beat, daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _keep_result(db: Session, job_id: int, worker_id: str) -> bool:
+    """
+    Start the transaction storing a run's outcome, if the run still owns its job.
+
+    The conditional UPDATE takes the write lock, so the outcome committed
+    with it can't race a re-queue of the job.
+    """
+    return bool(db.query(DBVideoJob).filter(
+        DBVideoJob.id == job_id,
+        DBVideoJob.worker_id == worker_id,
+        DBVideoJob.status == "running"
+    ).update({DBVideoJob.updated_at: datetime.utcnow()}, synchronize_session=False))
+
+
+def process_video_job(db: Session, job: DBVideoJob) -> None:
+    """
+    Analyze the job's video and store the results on its interview.
+
+    Failures are retried until the job runs out of attempts; only then is
+    the interview marked failed. If the job was re-queued (e.g. a new video
+    was uploaded) while this run was going, its outcome is discarded.
+    """
+    interview = db.query(DBVideoInterview).filter(DBVideoInterview.session_id == job.session_id).first()
+    if not interview or not interview.video_path:
+        _fail(db, job, "Video interview or uploaded video not found")
+        return
+
+    # Captured up front: the callback runs on pipeline threads, which must not touch this session
+    job_id, worker_id = job.id, job.worker_id
+    try:
+        result = video_analysis_service.analyze_video_interview(
+            video_path=interview.video_path,
+            question=interview.question_text,
+            position=interview.position,
+            progress=lambda stage: report_progress(job_id, worker_id, stage)
+        )
+        error = None if result.get("success") else result.get("error", "Analysis failed")
+    except Exception as e:
+        logger.error(f"Video job {job.session_id} raised: {e}")
+        result, error = {}, f"Processing error: {str(e)}"
+
+    if not _keep_result(db, job_id, worker_id):
+        db.rollback()
+        logger.info(f"Video job {job.session_id} was re-queued during this run; discarding its outcome")
+        return
+
+    if error is None:
+        interview.transcript = result.get("transcript", "")
+        interview.feedback = result.get("feedback", "")
+        interview.scores = result.get("scores", {})
+        interview.analysis = result.get("analysis", {})
+        interview.status = "completed"
+        job.status = "done"
+        job.stage = "completed"
+        job.progress = STAGE_PROGRESS["completed"]
+        job.lease_expires_at = None
+        job.updated_at = datetime.utcnow()
+        db.commit()
+        if VIDEO_ARCHIVE:
+            # Results are already visible; shrink the stored video afterwards
+            archive_video(db, job.session_id)
+    elif job.attempts >= VIDEO_JOB_MAX_ATTEMPTS:
+        _fail(db, job, error)
+    else:
+        logger.warning(f"Video job {job.session_id} attempt {job.attempts} failed, will retry: {error}")
+        job.status = "queued"
+        job.stage = "uploaded"
+        job.progress = STAGE_PROGRESS["uploaded"]
+        job.last_error = error
+        job.worker_id = None
+        job.lease_expires_at = None
+        job.updated_at = datetime.utcnow()
+        db.commit()
+
+
+def run_worker(worker_id: str, stop_event) -> None:
+    """Claim and process jobs until stop_event is set."""
+    logger.info(f"Video worker {worker_id} started")
+    while not stop_event.is_set():
+        db = SessionLocal()
+        try:
+            job = claim_video_job(db, worker_id)
+            if job is None:
+                # Idle: apply the storage retention policy if it is due
+                maybe_collect_garbage()
+                stop_event.wait(VIDEO_JOB_POLL_INTERVAL)
+                continue
+            logger.info(f"Video worker {worker_id} processing {job.session_id} (attempt {job.attempts})")
+            with _lease_heartbeat(job.id, worker_id):
+                process_video_job(db, job)
+        except Exception as e:
+            # Leave the job to expire and be retried; keep the worker alive
+            logger.error(f"Video worker {worker_id} error: {e}")
+            db.rollback()
+            stop_event.wait(VIDEO_JOB_POLL_INTERVAL)
+        finally:
+            db.close()
+    logger.info(f"Video worker {worker_id} stopped")
+
+
+def _worker_main(worker_id: str, stop_event) -> None:
+    # The parent handles Ctrl+C and stops workers through stop_event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    run_worker(worker_id, stop_event)
+
+
+class VideoWorkerPool:
+    """A fixed number of worker processes, restarted if they die."""
+
+    def __init__(self, workers: int = VIDEO_WORKERS):
+        self.workers = max(1, workers)
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = None
+        self._processes: List[multiprocessing.Process] = []
+        self._monitor: Optional[threading.Thread] = None
+
+    def _spawn(self) -> multiprocessing.Process:
+        worker_id = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        process = self._context.Process(
+            target=_worker_main, args=(worker_id, self._stop_event), name=f"video-worker-{worker_id}", daemon=True
+        )
+        process.start()
+        return process
+
+    def _watch(self) -> None:
+        while not self._stop_event.wait(VIDEO_JOB_POLL_INTERVAL):
+            for i, process in enumerate(self._processes):
+                if not process.is_alive():
+                    logger.warning(f"{process.name} exited with code {process.exitcode}, restarting")
+                    self._processes[i] = self._spawn()
+
+    def start(self) -> None:
+        if self._processes:
+            return
+        Base.metadata.create_all(bind=engine, tables=[DBVideoInterview.__table__, DBVideoJob.__table__])
+        db = SessionLocal()
+        try:
+            orphans = enqueue_orphaned_interviews(db)
+            if orphans:
+                logger.info(f"Queued {orphans} video interviews left in processing")
+        finally:
+            db.close()
+
+        self._stop_event = self._context.Event()
+        self._processes = [self._spawn() for _ in range(self.workers)]
+        self._monitor = threading.Thread(target=self._watch, daemon=True)
+        self._monitor.start()
+        logger.info(f"Started {self.workers} video workers")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Ask workers to stop after their current job; terminate any still running after timeout."""
+        if not self._processes:
+            return
+        self._stop_event.set()
+        self._monitor.join()
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                # Its job's lease will expire and another worker retries it
+                process.terminate()
+        self._processes = []
+
+
+video_worker_pool = VideoWorkerPool()
+
+
+def main(argv: List[str] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Run video interview processing workers.")
+    arg_parser.add_argument("-w", "--workers", type=int, default=VIDEO_WORKERS, help="Worker processes")
+    args = arg_parser.parse_args(argv)
+
+    pool = VideoWorkerPool(args.workers)
+    pool.start()
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        while not stop.wait(1):
+            pass
+    except KeyboardInterrupt:
+        pass
+    pool.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
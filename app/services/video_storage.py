@@ -0,0 +1,372 @@
+"""
+Content-addressed storage for interview videos.
+
+Videos are stored under the SHA-256 of their bytes in sharded directories
+(``<store>/ab/cd/<hash>.<ext>``), so identical re-uploads are kept once and
+any number of sessions can point at the same file. Once every session
+sharing a video has been analysed, the worker replaces it with a smaller
+archival rendition (also content-addressed, under ``<store>/archive``).
+Files are only ever deleted by the retention job, which removes media no
+session refers to once untouched for ORPHAN_GRACE_SECONDS (an identical
+upload reusing a file refreshes it), videos past the retention period,
+stale partial uploads, the MP3 sidecars of the old pipeline and the job
+rows of finished or deleted sessions:
+
+    python -m app.services.video_storage gc
+"""
+import os
+import sys
+import time
+import hashlib
+import logging
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime, timedelta
+from typing import BinaryIO, Dict, Iterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.video_interview import DBVideoInterview, DBVideoJob, DBVideoUpload
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Legacy uploads (<session_id>.<ext>, .mp3 sidecars) live directly in here
+VIDEO_ROOT = "static/video_interviews"
+VIDEO_STORE_DIR = os.getenv("VIDEO_STORE_DIR", os.path.join(VIDEO_ROOT, "objects"))
+ARCHIVE_DIR = os.path.join(VIDEO_STORE_DIR, "archive")
+
+# Transcode analysed videos to the archival rendition
+VIDEO_ARCHIVE = os.getenv("VIDEO_ARCHIVE", "true").lower() in ("1", "true", "yes", "on")
+ARCHIVE_MAX_HEIGHT = int(os.getenv("VIDEO_ARCHIVE_MAX_HEIGHT", "480"))
+ARCHIVE_CRF = os.getenv("VIDEO_ARCHIVE_CRF", "30")
+ARCHIVE_AUDIO_BITRATE = os.getenv("VIDEO_ARCHIVE_AUDIO_BITRATE", "48k")
+
+# Retention policy
+VIDEO_RETENTION_DAYS = int(os.getenv("VIDEO_RETENTION_DAYS", "90"))  # 0 keeps videos forever
+UPLOAD_EXPIRY_HOURS = int(os.getenv("VIDEO_UPLOAD_EXPIRY_HOURS", "48"))
+# Unreferenced files younger than this may belong to an upload in progress
+ORPHAN_GRACE_SECONDS = int(os.getenv("VIDEO_ORPHAN_GRACE_SECONDS", "3600"))
+JOB_RETENTION_DAYS = int(os.getenv("VIDEO_JOB_RETENTION_DAYS", "30"))  # 0 keeps finished job rows forever
+VIDEO_GC_INTERVAL_HOURS = float(os.getenv("VIDEO_GC_INTERVAL_HOURS", "6"))
+
+# Session statuses after which a video is no longer read
+FINISHED_STATUSES = ("completed", "failed")
+FINISHED_JOB_STATUSES = ("done", "failed")
+
+GC_STAMP = ".last_gc"
+# Files checked against the database per query
+GC_BATCH = 200
+READ_SIZE = 1024 * 1024
+
+
+def _object_path(digest: str, extension: str, root: str = VIDEO_STORE_DIR) -> str:
+    return os.path.join(root, digest[:2], digest[2:4], f"{digest}.{extension.lstrip('.').lower()}")
+
+
+def _commit_object(tmp_path: str, digest: str, extension: str, root: str = VIDEO_STORE_DIR) -> str:
+    """Move a hashed temp file into the store, or drop it if the content is already there."""
+    path = _object_path(digest, extension, root)
+    if os.path.exists(path):
+        os.remove(tmp_path)
+        # Refresh the mtime so a concurrent GC doesn't take it for an old orphan
+        os.utime(path)
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+    return path
+
+
+def store_stream(stream: BinaryIO, extension: str) -> str:
+    """
+    Store a video from a file object, hashing it while it is written.
+
+    Args:
+        stream: Readable binary file object
+        extension: File extension to keep (e.g. "mp4")
+
+    Returns:
+        Path of the stored video
+    """
+    os.makedirs(VIDEO_STORE_DIR, exist_ok=True)
+    digest = hashlib.sha256()
+    fd, tmp_path = tempfile.mkstemp(dir=VIDEO_STORE_DIR, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            for block in iter(lambda: stream.read(READ_SIZE), b""):
+                digest.update(block)
+                out.write(block)
+        return _commit_object(tmp_path, digest.hexdigest(), extension)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def store_file(path: str, extension: str, root: str = VIDEO_STORE_DIR) -> str:
+    """
+    Move a file on the same filesystem into the store.
+
+    Returns:
+        Path of the stored video (path itself is gone afterwards)
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(READ_SIZE), b""):
+            digest.update(block)
+    return _commit_object(path, digest.hexdigest(), extension, root)
+
+
+def is_archived(path: Optional[str]) -> bool:
+    return bool(path) and os.path.abspath(path).startswith(os.path.abspath(ARCHIVE_DIR) + os.sep)
+
+
+def _has_unfinished_sessions(db: Session, path: str) -> bool:
+    return db.query(DBVideoInterview.id).filter(
+        DBVideoInterview.video_path == path,
+        DBVideoInterview.status.notin_(FINISHED_STATUSES)
+    ).first() is not None
+
+
+def archive_video(db: Session, session_id: str) -> Optional[str]:
+    """
+    Replace a session's video with its archival rendition.
+
+    The video is transcoded to H.264 (at most ARCHIVE_MAX_HEIGHT lines, CRF
+    ARCHIVE_CRF) with low-bitrate AAC audio. Stored videos are shared, so
+    nothing is done while another session on the same file is still queued
+    or being analysed (the last one to finish archives it); then every
+    finished session sharing the original is moved to the rendition and the
+    original is left for collect_garbage. If the rendition isn't smaller,
+    the original is kept.
+
+    Returns:
+        Path of the video now used by the session, or None if there is none
+    """
+    interview = db.query(DBVideoInterview).filter(DBVideoInterview.session_id == session_id).first()
+    source = interview.video_path if interview else None
+    if not source or not os.path.exists(source) or is_archived(source):
+        return source
+    if _has_unfinished_sessions(db, source):
+        logger.info(f"{source} is still used by unfinished sessions; not archiving it yet")
+        return source
+
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=ARCHIVE_DIR, prefix=".tmp-", suffix=".mp4")
+    os.close(fd)
+    command = [
+        "ffmpeg", "-y", "-v", "error", "-i", source,
+        "-vf", f"scale=-2:'min({ARCHIVE_MAX_HEIGHT},ih)'",
+        "-c:v", "libx264", "-preset", "veryfast", "-crf", ARCHIVE_CRF,
+        "-c:a", "aac", "-b:a", ARCHIVE_AUDIO_BITRATE, "-ac", "1",
+        "-movflags", "+faststart", tmp_path
+    ]
+    try:
+        subprocess.run(command, check=True, capture_output=True)
+        if os.path.getsize(tmp_path) >= os.path.getsize(source):
+            logger.info(f"Archival rendition of {source} is not smaller; keeping the original")
+            os.remove(tmp_path)
+            return source
+        archived = store_file(tmp_path, "mp4", ARCHIVE_DIR)
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning(f"Archiving {source} failed, keeping the original: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return source
+
+    # Sessions that started on the original meanwhile keep it
+    db.query(DBVideoInterview).filter(
+        DBVideoInterview.video_path == source,
+        DBVideoInterview.status.in_(FINISHED_STATUSES)
+    ).update({DBVideoInterview.video_path: archived}, synchronize_session=False)
+    db.commit()
+    logger.info(f"Archived {source} -> {archived}")
+    return archived
+
+
+def _media_files(root: str, recursive: bool = True) -> Iterator[str]:
+    if not recursive:
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False) and entry.name != GC_STAMP:
+                        yield entry.path
+        except FileNotFoundError:
+            pass
+        return
+    for directory, _, filenames in os.walk(root):
+        for filename in filenames:
+            if filename != GC_STAMP:
+                yield os.path.join(directory, filename)
+
+
+def _orphan_candidates(grace_cutoff: float) -> Iterator[str]:
+    """Media files older than grace_cutoff, from the directories the app writes to."""
+    from app.services.video_uploads import PARTIAL_UPLOAD_DIR
+
+    # Legacy uploads sit directly in VIDEO_ROOT; its other subdirectories
+    # are the store and partial upload dirs, walked on their own
+    roots = ((VIDEO_ROOT, False), (VIDEO_STORE_DIR, True), (PARTIAL_UPLOAD_DIR, True))
+    seen = set()
+    for root, recursive in roots:
+        for path in _media_files(root, recursive):
+            key = os.path.abspath(path)
+            if key in seen:
+                continue
+            seen.add(key)
+            try:
+                if os.path.getmtime(path) < grace_cutoff:
+                    yield path
+            except FileNotFoundError:
+                continue
+
+
+def _referenced(db: Session, paths: List[str]) -> set:
+    """Absolute paths among paths that a session or an active upload refers to."""
+    from app.services.video_uploads import ACTIVE_STATUSES, partial_path
+
+    # Stored paths are relative or absolute depending on how they were written
+    variants = {v for path in paths for v in (path, os.path.normpath(path), os.path.abspath(path))}
+    referenced = {
+        os.path.abspath(video_path) for (video_path,) in
+        db.query(DBVideoInterview.video_path).filter(DBVideoInterview.video_path.in_(variants))
+    }
+    referenced.update(
+        os.path.abspath(partial_path(upload)) for upload in
+        db.query(DBVideoUpload).filter(
+            DBVideoUpload.upload_id.in_({os.path.basename(path) for path in paths}),
+            DBVideoUpload.status.in_(ACTIVE_STATUSES)
+        )
+    )
+    return referenced
+
+
+def _remove_orphans(db: Session, paths: List[str]) -> int:
+    referenced = _referenced(db, paths)
+    count = 0
+    for path in paths:
+        if os.path.abspath(path) in referenced:
+            continue
+        try:
+            os.remove(path)
+            count += 1
+        except FileNotFoundError:
+            continue
+    return count
+
+
+def collect_garbage(db: Session, now: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Apply the retention policy to stored media.
+
+    - Videos of sessions older than VIDEO_RETENTION_DAYS are deleted
+      (transcripts, feedback and scores are kept).
+    - Resumable uploads untouched for UPLOAD_EXPIRY_HOURS are dropped.
+    - Job rows of deleted sessions, and finished ones untouched for
+      JOB_RETENTION_DAYS, are deleted.
+    - Files in the store, the partial upload dir and directly under
+      static/video_interviews that no session or upload refers to
+      (replaced videos, deleted sessions, old .mp3 sidecars, leftover temp
+      files) are deleted once older than ORPHAN_GRACE_SECONDS. They are
+      checked against the database GC_BATCH at a time.
+
+    Safe to run from several processes at once.
+
+    Returns:
+        Counts of what was removed
+    """
+    # Imported here because video_uploads stores completed uploads through this module
+    from app.services.video_uploads import ACTIVE_STATUSES
+
+    now = now or datetime.utcnow()
+    removed = {"expired_videos": 0, "expired_uploads": 0, "expired_jobs": 0, "orphaned_files": 0}
+
+    if VIDEO_RETENTION_DAYS > 0:
+        cutoff = now - timedelta(days=VIDEO_RETENTION_DAYS)
+        expired = db.query(DBVideoInterview).filter(
+            DBVideoInterview.created_at < cutoff,
+            DBVideoInterview.video_path.isnot(None),
+            DBVideoInterview.status.in_(FINISHED_STATUSES)
+        ).all()
+        for interview in expired:
+            interview.video_path = None
+            removed["expired_videos"] += 1
+        db.commit()
+
+    upload_cutoff = now - timedelta(hours=UPLOAD_EXPIRY_HOURS)
+    stale = db.query(DBVideoUpload).filter(DBVideoUpload.updated_at < upload_cutoff).all()
+    for upload in stale:
+        if upload.status in ACTIVE_STATUSES:
+            removed["expired_uploads"] += 1
+        db.delete(upload)
+    db.commit()
+
+    # Jobs of deleted sessions could only fail; running ones are left to their worker
+    session_exists = db.query(DBVideoInterview.id).filter(
+        DBVideoInterview.session_id == DBVideoJob.session_id
+    ).exists()
+    removed["expired_jobs"] += db.query(DBVideoJob).filter(
+        ~session_exists, DBVideoJob.status != "running"
+    ).delete(synchronize_session=False)
+    if JOB_RETENTION_DAYS > 0:
+        removed["expired_jobs"] += db.query(DBVideoJob).filter(
+            DBVideoJob.status.in_(FINISHED_JOB_STATUSES),
+            DBVideoJob.updated_at < now - timedelta(days=JOB_RETENTION_DAYS)
+        ).delete(synchronize_session=False)
+    db.commit()
+
+    batch = []
+    for path in _orphan_candidates(time.time() - ORPHAN_GRACE_SECONDS):
+        batch.append(path)
+        if len(batch) >= GC_BATCH:
+            removed["orphaned_files"] += _remove_orphans(db, batch)
+            batch = []
+    if batch:
+        removed["orphaned_files"] += _remove_orphans(db, batch)
+
+    logger.info(f"Video storage GC: {removed}")
+    return removed
+
+
+def maybe_collect_garbage() -> None:
+    """Run collect_garbage if it hasn't run (by any process) within VIDEO_GC_INTERVAL_HOURS."""
+    if VIDEO_GC_INTERVAL_HOURS <= 0:
+        return
+    stamp = os.path.join(VIDEO_STORE_DIR, GC_STAMP)
+    try:
+        if time.time() - os.path.getmtime(stamp) < VIDEO_GC_INTERVAL_HOURS * 3600:
+            return
+    except FileNotFoundError:
+        pass
+    os.makedirs(VIDEO_STORE_DIR, exist_ok=True)
+    with open(stamp, "a"):
+        os.utime(stamp)
+
+    db = SessionLocal()
+    try:
+        collect_garbage(db)
+    except Exception as e:
+        logger.error(f"Video storage GC failed: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def main(argv: List[str] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Maintain stored interview videos.")
+    arg_parser.add_argument("command", choices=["gc"], help="gc: apply the retention policy now")
+    arg_parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        print(collect_garbage(db))
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Resumable, chunked video uploads.
+
+A tus-like protocol for large recordings on unreliable connections: the
+client creates an upload with its total length, sends the bytes in PATCH
+requests that each state the offset they start at (optionally with a
+checksum of the chunk), and after a dropped connection asks for the current
+offset with HEAD and continues from there. Chunks are written straight into
+a partial file; once the last byte lands the file is moved into video
+storage and the interview is queued for processing.
+"""
+import os
+import uuid
+import asyncio
+import base64
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.models.video_interview import DBVideoUpload
+from app.services.video_storage import store_file
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ALLOWED_VIDEO_TYPES = ["video/mp4", "video/webm", "video/quicktime", "video/x-msvideo"]
+
+PARTIAL_UPLOAD_DIR = os.getenv("VIDEO_PARTIAL_UPLOAD_DIR", "static/video_interviews/.partial")
+MAX_VIDEO_BYTES = int(os.getenv("MAX_VIDEO_BYTES", str(1024 * 1024 * 1024)))
+MAX_CHUNK_BYTES = int(os.getenv("MAX_VIDEO_CHUNK_BYTES", str(32 * 1024 * 1024)))
+
+CHECKSUM_ALGORITHMS = ("sha256", "sha1", "md5")
+
+# Status code tus uses for a chunk whose checksum doesn't match
+CHECKSUM_MISMATCH = 460
+
+# Bytes buffered before handing a write to a thread
+WRITE_BUFFER_BYTES = 1024 * 1024
+
+# A chunk claim older than this is from a request that died mid-write
+STALE_WRITE_SECONDS = int(os.getenv("VIDEO_UPLOAD_STALE_WRITE_SECONDS", "300"))
+
+# Statuses during which the partial file is still needed
+ACTIVE_STATUSES = ("uploading", "writing")
+
+
+def partial_path(upload: DBVideoUpload) -> str:
+    return os.path.join(PARTIAL_UPLOAD_DIR, upload.upload_id)
+
+
+def create_upload(db: Session, session_id: str, filename: str, content_type: str, length: int) -> DBVideoUpload:
+    """
+    Start a resumable upload for a video interview session.
+
+    Args:
+        db: Database session
+        session_id: Video interview session the video belongs to
+        filename: Original file name (its extension is kept)
+        content_type: Video MIME type
+        length: Total size of the video in bytes
+
+    Returns:
+        The new upload, at offset 0
+
+    Raises:
+        HTTPException: 400 for an unsupported type or invalid length, 413 if too large
+    """
+    if content_type not in ALLOWED_VIDEO_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type. Allowed types: {', '.join(ALLOWED_VIDEO_TYPES)}"
+        )
+    if length <= 0:
+        raise HTTPException(status_code=400, detail="Upload-Length must be positive")
+    if length > MAX_VIDEO_BYTES:
+        raise HTTPException(status_code=413, detail=f"Video exceeds {MAX_VIDEO_BYTES} bytes")
+
+    now = datetime.utcnow()
+    upload = DBVideoUpload(
+        upload_id=str(uuid.uuid4()),
+        session_id=session_id,
+        filename=filename,
+        content_type=content_type,
+        length=length,
+        offset=0,
+        status="uploading",
+        created_at=now,
+        updated_at=now
+    )
+    os.makedirs(PARTIAL_UPLOAD_DIR, exist_ok=True)
+    open(partial_path(upload), "wb").close()
+    db.add(upload)
+    db.commit()
+    db.refresh(upload)
+    return upload
+
+
+def parse_checksum(header: Optional[str]) -> Optional[Tuple[str, bytes]]:
+    """
+    Parse an ``Upload-Checksum`` header ("<algorithm> <base64 digest>").
+
+    Raises:
+        HTTPException: 400 if the header is malformed or the algorithm unsupported
+    """
+    if not header:
+        return None
+    try:
+        algorithm, encoded = header.strip().split(" ", 1)
+        digest = base64.b64decode(encoded.strip(), validate=True)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Upload-Checksum must be '<algorithm> <base64 digest>'")
+    algorithm = algorithm.lower()
+    if algorithm not in CHECKSUM_ALGORITHMS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported checksum algorithm. Supported: {', '.join(CHECKSUM_ALGORITHMS)}"
+        )
+    return algorithm, digest
+
+
+def _claim_offset(db: Session, upload: DBVideoUpload, offset: int) -> bool:
+    """
+    Mark the upload as being written from offset, unless another request is writing it.
+
+    The claim is a conditional UPDATE, so of two concurrent requests for the
+    same offset only one gets to touch the partial file. A claim left behind
+    by a request that died is taken over after STALE_WRITE_SECONDS.
+    """
+    now = datetime.utcnow()
+    claimed = db.query(DBVideoUpload).filter(
+        DBVideoUpload.id == upload.id,
+        DBVideoUpload.offset == offset,
+        (DBVideoUpload.status == "uploading") | (
+            (DBVideoUpload.status == "writing")
+            & (DBVideoUpload.updated_at < now - timedelta(seconds=STALE_WRITE_SECONDS))
+        )
+    ).update({
+        DBVideoUpload.status: "writing",
+        DBVideoUpload.updated_at: now
+    }, synchronize_session=False)
+    db.commit()
+    return bool(claimed)
+
+
+def _write_at(path: str, offset: int, data: bytes) -> None:
+    with open(path, "r+b") as f:
+        f.seek(offset)
+        f.write(data)
+
+
+def _truncate(path: str, size: int) -> None:
+    with open(path, "r+b") as f:
+        f.truncate(size)
+
+
+async def write_chunk(
+    db: Session,
+    upload: DBVideoUpload,
+    offset: int,
+    chunk: AsyncIterator[bytes],
+    checksum: Optional[str] = None
+) -> DBVideoUpload:
+    """
+    Append a chunk to an upload.
+
+    The request first claims the offset, then writes the chunk at ``offset``
+    in the partial file while it streams in (file I/O runs in a thread).
+    Anything written is discarded again if the chunk turns out to be too
+    large or its checksum doesn't match, so the client can simply resend it.
+
+    Args:
+        db: Database session
+        upload: Upload being continued
+        offset: Offset the client says the chunk starts at
+        chunk: Chunk bytes, as an async stream
+        checksum: Optional ``Upload-Checksum`` header value
+
+    Returns:
+        The upload with its new offset
+
+    Raises:
+        HTTPException: 409 if the offset doesn't match the server's or
+            another chunk is being written, 413 if the chunk is too large,
+            460 on a checksum mismatch
+    """
+    expected = parse_checksum(checksum)
+    if upload.status == "complete":
+        raise HTTPException(status_code=409, detail="Upload is already complete")
+    if offset != upload.offset:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Upload-Offset {offset} does not match the current offset {upload.offset}"
+        )
+    if not _claim_offset(db, upload, offset):
+        db.refresh(upload)
+        raise HTTPException(
+            status_code=409,
+            detail=f"Another chunk is being written or the offset moved on, now {upload.offset}"
+        )
+
+    limit = min(MAX_CHUNK_BYTES, upload.length - offset)
+    digest = hashlib.new(expected[0]) if expected else None
+    written = 0
+    buffer = bytearray()
+    path = partial_path(upload)
+    try:
+        async for piece in chunk:
+            if written + len(buffer) + len(piece) > limit:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Chunk exceeds {limit} bytes (chunk limit or remaining length)"
+                )
+            if digest:
+                digest.update(piece)
+            buffer += piece
+            if len(buffer) >= WRITE_BUFFER_BYTES:
+                await asyncio.to_thread(_write_at, path, offset + written, bytes(buffer))
+                written += len(buffer)
+                buffer.clear()
+        if buffer:
+            await asyncio.to_thread(_write_at, path, offset + written, bytes(buffer))
+            written += len(buffer)
+        if digest and digest.digest() != expected[1]:
+            raise HTTPException(status_code=CHECKSUM_MISMATCH, detail="Chunk checksum mismatch")
+        # A previously interrupted attempt may have left bytes past this chunk
+        await asyncio.to_thread(_truncate, path, offset + written)
+    except BaseException:
+        # Drop the partial chunk (also when the client disconnects) and release the claim
+        await asyncio.shield(asyncio.to_thread(_truncate, path, offset))
+        db.query(DBVideoUpload).filter(DBVideoUpload.id == upload.id).update({
+            DBVideoUpload.status: "uploading",
+            DBVideoUpload.updated_at: datetime.utcnow()
+        }, synchronize_session=False)
+        db.commit()
+        raise
+
+    db.query(DBVideoUpload).filter(DBVideoUpload.id == upload.id).update({
+        DBVideoUpload.offset: offset + written,
+        DBVideoUpload.status: "uploading",
+        DBVideoUpload.updated_at: datetime.utcnow()
+    }, synchronize_session=False)
+    db.commit()
+    db.refresh(upload)
+    return upload
+
+
+async def complete_upload(db: Session, upload: DBVideoUpload) -> str:
+    """
+    Move a fully received upload into video storage.
+
+    Hashing the file (up to MAX_VIDEO_BYTES) runs in a thread, off the event loop.
+
+    Args:
+        db: Database session
+        upload: Upload whose offset has reached its length
+
+    Returns:
+        Path of the stored video
+    """
+    path = await asyncio.to_thread(store_file, partial_path(upload), upload.filename.split('.')[-1])
+    upload.status = "complete"
+    upload.updated_at = datetime.utcnow()
+    db.commit()
+    logger.info(f"Video upload {upload.upload_id} for session {upload.session_id} complete ({upload.length} bytes)")
+    return path
@@ -0,0 +1,152 @@
+"""
+Speech-optimized audio for transcription.
+
+Whisper only needs 16 kHz mono speech, so instead of a high-quality stereo
+MP3 the audio is encoded as low-bitrate Opus (or FLAC) with leading
+silence trimmed, which makes the upload several times smaller.
+Sources whose audio is already compact mono Opus/FLAC are stream-copied
+instead of re-encoded. Output goes to a scratch directory, not static/.
+"""
+import os
+import json
+import shutil
+import logging
+import tempfile
+import subprocess
+from typing import Any, Dict, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+SPEECH_SAMPLE_RATE = 16000
+SPEECH_AUDIO_FORMAT = os.getenv("SPEECH_AUDIO_FORMAT", "opus").lower()  # opus or flac
+SPEECH_OPUS_BITRATE = os.getenv("SPEECH_OPUS_BITRATE", "24k")
+
+# Leading audio quieter than this is trimmed, keeping a short pad
+SILENCE_THRESHOLD = os.getenv("SPEECH_SILENCE_THRESHOLD", "-45dB")
+SILENCE_PAD_SECONDS = 0.25
+
+# Source audio at or below this bitrate is small enough to send as is
+MAX_COPY_BITRATE = 64000
+
+AUDIO_SCRATCH_DIR = os.getenv("AUDIO_SCRATCH_DIR", os.path.join(tempfile.gettempdir(), "interviewbot-audio"))
+
+# Trim leading silence only: trimming the end as well (areverse on both
+# sides of silenceremove) makes ffmpeg hold the whole decoded track in memory
+TRIM_SILENCE_FILTER = (
+    f"silenceremove=start_periods=1:start_threshold={SILENCE_THRESHOLD}:start_silence={SILENCE_PAD_SECONDS}"
+)
+
+COPY_CODECS = {"opus": ".ogg", "flac": ".flac"}
+
+
+def make_scratch_dir() -> str:
+    """Create a private working directory for one file's audio and frames."""
+    os.makedirs(AUDIO_SCRATCH_DIR, exist_ok=True)
+    return tempfile.mkdtemp(dir=AUDIO_SCRATCH_DIR)
+
+
+def discard_scratch(path: Optional[str]) -> None:
+    """Remove the scratch directory containing path (never anything outside the scratch root)."""
+    if not path:
+        return
+    directory = os.path.dirname(os.path.abspath(path))
+    root = os.path.abspath(AUDIO_SCRATCH_DIR)
+    if os.path.dirname(directory) == root:
+        shutil.rmtree(directory, ignore_errors=True)
+    elif os.path.exists(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def probe_audio(source_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Describe the first audio stream of a file with ffprobe.
+
+    Returns:
+        Dictionary with codec_name, channels, sample_rate and bit_rate, or
+        None if there is no audio stream or ffprobe is unavailable
+    """
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-select_streams", "a:0",
+             "-show_entries", "stream=codec_name,channels,sample_rate,bit_rate",
+             "-of", "json", source_path],
+            check=True, capture_output=True, text=True
+        )
+        streams = json.loads(result.stdout).get("streams") or []
+    except (OSError, subprocess.CalledProcessError, ValueError) as e:
+        logger.warning(f"Could not probe audio of {source_path}: {e}")
+        return None
+    if not streams:
+        return None
+    stream = streams[0]
+    return {
+        "codec_name": stream.get("codec_name"),
+        "channels": int(stream.get("channels") or 0),
+        "sample_rate": int(stream.get("sample_rate") or 0),
+        "bit_rate": int(stream["bit_rate"]) if str(stream.get("bit_rate", "")).isdigit() else None,
+    }
+
+
+def can_stream_copy(stream: Optional[Dict[str, Any]]) -> bool:
+    """Whether a source audio stream is already compact speech audio Whisper accepts."""
+    if not stream or stream["codec_name"] not in COPY_CODECS or stream["channels"] != 1:
+        return False
+    if stream["codec_name"] == "flac":
+        return stream["sample_rate"] <= SPEECH_SAMPLE_RATE
+    return stream["bit_rate"] is None or stream["bit_rate"] <= MAX_COPY_BITRATE
+
+
+def plan_speech_audio(source_path: str, output_dir: str) -> Tuple[str, List[str]]:
+    """
+    Choose the output file and ffmpeg output options for a source's speech audio.
+
+    Args:
+        source_path: Video or audio file
+        output_dir: Directory for the output (usually from make_scratch_dir)
+
+    Returns:
+        (output path, ffmpeg output options to put before it)
+    """
+    name = os.path.splitext(os.path.basename(source_path))[0] or "audio"
+    stream = probe_audio(source_path)
+    if can_stream_copy(stream):
+        extension = COPY_CODECS[stream["codec_name"]]
+        return os.path.join(output_dir, name + extension), ["-vn", "-c:a", "copy"]
+
+    args = ["-vn", "-af", TRIM_SILENCE_FILTER, "-ac", "1", "-ar", str(SPEECH_SAMPLE_RATE)]
+    if SPEECH_AUDIO_FORMAT == "flac":
+        return os.path.join(output_dir, name + ".flac"), args + ["-c:a", "flac", "-sample_fmt", "s16"]
+    return os.path.join(output_dir, name + ".ogg"), args + [
+        "-c:a", "libopus", "-b:a", SPEECH_OPUS_BITRATE, "-application", "voip"
+    ]
+
+
+def prepare_speech_audio(source_path: str, output_dir: Optional[str] = None) -> str:
+    """
+    Write a source's speech-optimized audio track.
+
+    Args:
+        source_path: Video or audio file
+        output_dir: Output directory; a new scratch directory by default
+
+    Returns:
+        Path of the prepared audio file
+
+    Raises:
+        RuntimeError: If ffmpeg fails or is not installed
+    """
+    output_dir = output_dir or make_scratch_dir()
+    audio_path, args = plan_speech_audio(source_path, output_dir)
+    command = ["ffmpeg", "-y", "-i", source_path, "-map", "0:a:0"] + args + [audio_path]
+    try:
+        subprocess.run(command, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"FFmpeg error: {e.stderr if e.stderr else str(e)}")
+    except FileNotFoundError:
+        raise RuntimeError("FFmpeg is not installed. Please install ffmpeg to prepare audio.")
+    return audio_path
@@ -26,10 +26,15 @@ def transcribe_audio(file_path):
     NOTE: Requires openai-whisper package. Use /transcribe_api for cloud-based transcription.
     Model is loaded on first use to avoid startup delays.
     """
-    model = get_model()
-    # ✅ FORCE ENGLISH LANGUAGE
-    result = model.transcribe(file_path, language='en')
-    return result['text']
+    from app.stt.transcript_cache import cached_transcript
+
+    def transcribe(path):
+        model = get_model()
+        # ✅ FORCE ENGLISH LANGUAGE
+        return model.transcribe(path, language='en')['text']
+
+    # The model is only loaded on a cache miss
+    return cached_transcript(file_path, "whisper-small", transcribe, language='en')
 
 
 # print(transcribe_audio("C:/Users/User/PycharmProjects/interviewbot/app/stt/test.wav"))
\ No newline at end of file
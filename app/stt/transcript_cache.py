@@ -0,0 +1,96 @@
+"""
+Transcript cache keyed by an audio fingerprint.
+
+The fingerprint hashes the audio stream itself instead of the file bytes,
+so the same recording re-uploaded, retried or remuxed into a different
+container maps to the same transcript. Transcripts are kept in a
+size-bounded DiskCache shared by every transcription path (video analysis,
+the /api/stt endpoints and the local Whisper model).
+"""
+import os
+import re
+import logging
+import tempfile
+import subprocess
+from functools import lru_cache
+from typing import Callable, Optional
+
+from app.utils.disk_cache import DiskCache, hash_bytes, hash_file
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TRANSCRIPT_CACHE_DIR = os.getenv(
+    "TRANSCRIPT_CACHE_DIR", os.path.join(tempfile.gettempdir(), "interviewbot_transcript_cache")
+)
+TRANSCRIPT_CACHE_MAX_MB = int(os.getenv("TRANSCRIPT_CACHE_MAX_MB", "50"))
+
+# Bump when the fingerprint changes so old entries are no longer matched
+FINGERPRINT_VERSION = "1"
+
+STREAMHASH_PATTERN = re.compile(r"SHA256=([0-9a-f]+)")
+
+
+@lru_cache(maxsize=1)
+def get_transcript_cache() -> DiskCache:
+    """Return the per-process transcript cache."""
+    return DiskCache(TRANSCRIPT_CACHE_DIR, TRANSCRIPT_CACHE_MAX_MB * 1024 * 1024)
+
+
+def audio_fingerprint(path: str) -> str:
+    """
+    Fingerprint the first audio stream of a file.
+
+    ffmpeg's streamhash muxer hashes the audio stream's coded packets
+    without decoding them, so the fingerprint doesn't depend on the
+    container (or on container-level trimming such as AAC priming in MP4
+    edit lists), only on the audio itself. If ffmpeg is unavailable or the
+    file has no audio stream, the raw file bytes are hashed instead (which
+    still matches exact re-uploads).
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-v", "error", "-i", path, "-map", "0:a:0", "-c", "copy",
+             "-f", "streamhash", "-hash", "sha256", "-"],
+            check=True, capture_output=True, text=True
+        )
+        match = STREAMHASH_PATTERN.search(result.stdout)
+        if match:
+            return f"audio-{match.group(1)}"
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning(f"Could not fingerprint the audio of {path}: {e}")
+    return f"file-{hash_file(path)}"
+
+
+def cached_transcript(
+    audio_path: str,
+    engine: str,
+    transcribe: Callable[[str], str],
+    language: Optional[str] = None
+) -> str:
+    """
+    Return the transcript of an audio file, transcribing it only on a cache miss.
+
+    Args:
+        audio_path: Audio or video file
+        engine: Transcription model/engine (part of the cache key)
+        transcribe: Function transcribing the file to text on a miss
+        language: Forced language, if any (part of the cache key)
+
+    Returns:
+        The transcript
+    """
+    cache = get_transcript_cache()
+    if not cache.enabled:
+        return transcribe(audio_path)
+    key = hash_bytes(f"{FINGERPRINT_VERSION}:{engine}:{language or ''}:".encode(), audio_fingerprint(audio_path).encode())
+    cached = cache.get(key)
+    if cached is not None:
+        logger.info(f"Transcript cache hit for {os.path.basename(audio_path)} ({engine})")
+        return cached.decode("utf-8")
+
+    transcript = transcribe(audio_path)
+    if transcript:
+        cache.set(key, transcript.encode("utf-8"))
+    return transcript
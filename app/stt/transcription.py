@@ -0,0 +1,239 @@
+"""
+Chunked, parallel transcription of long recordings.
+
+Audio longer than a chunk (or larger than the API's upload limit) is split
+at silences into slightly overlapping chunks, the chunks are transcribed
+concurrently under the shared OpenAI rate limiter, and the texts are
+stitched back together with the words repeated in the overlaps removed.
+Wall-clock time is then roughly that of the slowest chunk instead of the
+whole recording.
+"""
+import os
+import re
+import logging
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from app.stt.audio_prep import make_scratch_dir
+from app.utils.rate_limiter import get_rate_limiter
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Whisper API upload limit is 25 MB; stay under it
+MAX_UPLOAD_BYTES = int(os.getenv("TRANSCRIBE_MAX_UPLOAD_BYTES", str(24 * 1024 * 1024)))
+
+# Target chunk length; each cut moves to the silence nearest the target
+# within MIN/MAX_CHUNK_RATIO of it
+CHUNK_SECONDS = float(os.getenv("TRANSCRIBE_CHUNK_SECONDS", "120"))
+MIN_CHUNK_RATIO = 0.5
+MAX_CHUNK_RATIO = 1.25
+
+# Audio shared by neighbouring chunks, so words at a cut aren't lost
+OVERLAP_SECONDS = 1.0
+
+# Longest run of words the stitcher looks for at the start of a chunk
+MAX_OVERLAP_WORDS = 20
+
+TRANSCRIBE_WORKERS = int(os.getenv("TRANSCRIBE_WORKERS", "4"))
+
+SILENCE_THRESHOLD = "-35dB"
+SILENCE_MIN_SECONDS = 0.3
+
+DURATION_PATTERN = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+SILENCE_START_PATTERN = re.compile(r"silence_start:\s*(-?\d+(?:\.\d+)?)")
+SILENCE_END_PATTERN = re.compile(r"silence_end:\s*(\d+(?:\.\d+)?)")
+WORD_PATTERN = re.compile(r"[^\w']+")
+
+
+def _run(cmd: List[str]) -> subprocess.CompletedProcess:
+    try:
+        return subprocess.run(cmd, check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"FFmpeg error: {e.stderr if e.stderr else str(e)}")
+    except FileNotFoundError:
+        raise RuntimeError("FFmpeg is not installed. Please install ffmpeg to transcribe long recordings.")
+
+
+def probe_duration(audio_path: str) -> Optional[float]:
+    """
+    Read an audio file's duration from its container with ffprobe (no decoding).
+
+    Returns:
+        Duration in seconds, or None if ffprobe is unavailable or can't tell
+    """
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", audio_path],
+            check=True, capture_output=True, text=True
+        )
+        return float(result.stdout.strip())
+    except (OSError, subprocess.CalledProcessError, ValueError) as e:
+        logger.warning(f"Could not probe the duration of {audio_path}: {e}")
+        return None
+
+
+def analyze_silences(audio_path: str) -> Tuple[float, List[Tuple[float, float]]]:
+    """
+    Find the duration of an audio file and its silent stretches.
+
+    Returns:
+        (duration in seconds, list of (silence start, silence end))
+    """
+    stderr = _run([
+        "ffmpeg", "-i", audio_path, "-af",
+        f"silencedetect=noise={SILENCE_THRESHOLD}:d={SILENCE_MIN_SECONDS}",
+        "-f", "null", "-"
+    ]).stderr
+    match = DURATION_PATTERN.search(stderr)
+    duration = int(match.group(1)) * 3600 + int(match.group(2)) * 60 + float(match.group(3)) if match else 0.0
+
+    starts = [max(0.0, float(s)) for s in SILENCE_START_PATTERN.findall(stderr)]
+    ends = [float(e) for e in SILENCE_END_PATTERN.findall(stderr)]
+    # A silence running to the end of the file has no silence_end
+    ends += [duration] * (len(starts) - len(ends))
+    return duration, list(zip(starts, ends))
+
+
+def plan_chunks(
+    duration: float,
+    silences: List[Tuple[float, float]],
+    chunk_seconds: float = CHUNK_SECONDS
+) -> List[Tuple[float, float]]:
+    """
+    Choose chunk boundaries, cutting in silences where possible.
+
+    Each cut goes at the middle of the silence closest to the target chunk
+    length (within MIN/MAX_CHUNK_RATIO of it); without one the chunk is cut
+    at the maximum length. Chunks extend OVERLAP_SECONDS past each cut on
+    both sides.
+
+    Returns:
+        List of (start, end) in seconds covering the whole duration
+    """
+    min_length = chunk_seconds * MIN_CHUNK_RATIO
+    max_length = chunk_seconds * MAX_CHUNK_RATIO
+    midpoints = [(start + end) / 2 for start, end in silences]
+
+    cuts, position = [], 0.0
+    while duration - position > max_length:
+        window = [m for m in midpoints if position + min_length <= m <= position + max_length]
+        target = position + chunk_seconds
+        cut = min(window, key=lambda m: abs(m - target)) if window else position + max_length
+        cuts.append(cut)
+        position = cut
+
+    bounds = [0.0] + cuts + [duration]
+    return [
+        (max(0.0, start - OVERLAP_SECONDS), min(duration, end + OVERLAP_SECONDS))
+        for start, end in zip(bounds, bounds[1:])
+    ]
+
+
+def _words(text: str) -> List[str]:
+    return [w for w in WORD_PATTERN.split(text.lower()) if w]
+
+
+def merge_transcripts(texts: List[str]) -> str:
+    """
+    Join chunk transcripts, dropping words repeated across a chunk overlap.
+
+    The longest run of (case- and punctuation-insensitive) words that ends
+    the text so far and starts the next chunk is removed from the next chunk.
+    """
+    merged = ""
+    for text in texts:
+        text = (text or "").strip()
+        if not text:
+            continue
+        if not merged:
+            merged = text
+            continue
+        tail = _words(merged)[-MAX_OVERLAP_WORDS:]
+        head_tokens = text.split()
+        head = [_words(t) for t in head_tokens[:MAX_OVERLAP_WORDS]]
+        overlap = 0
+        for k in range(min(len(tail), len(head)), 0, -1):
+            candidate = [w for token in head[:k] for w in token]
+            if candidate and candidate == tail[-len(candidate):]:
+                overlap = k
+                break
+        # A single repeated short word is more likely a coincidence
+        if overlap == 1 and len(head[0]) == 1 and len(head[0][0]) <= 3:
+            overlap = 0
+        rest = " ".join(head_tokens[overlap:])
+        if rest:
+            merged = f"{merged} {rest}"
+    return merged
+
+
+def _cut(audio_path: str, start: float, end: float, output_dir: str, index: int) -> str:
+    extension = os.path.splitext(audio_path)[1]
+    chunk_path = os.path.join(output_dir, f"chunk_{index:04d}{extension}")
+    _run(["ffmpeg", "-y", "-ss", f"{start:.3f}", "-to", f"{end:.3f}", "-i", audio_path,
+          "-c", "copy", chunk_path])
+    return chunk_path
+
+
+def transcribe_long_audio(
+    audio_path: str,
+    transcribe_file: Callable[[str], str],
+    chunk_seconds: float = CHUNK_SECONDS,
+    workers: int = TRANSCRIBE_WORKERS
+) -> str:
+    """
+    Transcribe audio of any length.
+
+    Short files go to transcribe_file as is. Longer ones (or ones over the
+    upload limit) are cut into overlapping chunks that are transcribed in
+    parallel, each call holding a slot of the shared OpenAI rate limiter.
+    Silences are only detected (a full decode) for files that need chunking.
+
+    Args:
+        audio_path: Audio file (stream-copyable container, e.g. from audio_prep)
+        transcribe_file: Function transcribing one audio file to text
+        chunk_seconds: Target chunk length
+        workers: Chunks transcribed concurrently
+
+    Returns:
+        Full transcript
+
+    Raises:
+        RuntimeError: If ffmpeg fails; errors from transcribe_file propagate
+    """
+    limiter = get_rate_limiter("openai")
+    size = os.path.getsize(audio_path)
+    max_single = chunk_seconds * MAX_CHUNK_RATIO
+
+    duration = probe_duration(audio_path) if size <= MAX_UPLOAD_BYTES else None
+    if duration is None or duration > max_single:
+        # Unknown durations are measured by the decode as well
+        duration, silences = analyze_silences(audio_path)
+    if duration <= max_single and size <= MAX_UPLOAD_BYTES:
+        with limiter.acquire():
+            return transcribe_file(audio_path)
+    if not duration:
+        raise RuntimeError(f"Could not determine the duration of {audio_path}")
+
+    if size > MAX_UPLOAD_BYTES:
+        # Shrink chunks so even the longest one fits the upload limit
+        chunk_seconds = min(chunk_seconds, duration * MAX_UPLOAD_BYTES / size / MAX_CHUNK_RATIO * 0.9)
+    chunks = plan_chunks(duration, silences, chunk_seconds)
+    logger.info(f"Transcribing {audio_path} ({duration:.0f}s) in {len(chunks)} chunks")
+
+    scratch = make_scratch_dir()
+    try:
+        paths = [_cut(audio_path, start, end, scratch, i) for i, (start, end) in enumerate(chunks)]
+
+        def transcribe_chunk(path: str) -> str:
+            with limiter.acquire():
+                return transcribe_file(path)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(paths)))) as executor:
+            texts = list(executor.map(transcribe_chunk, paths))
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return merge_transcripts(texts)
@@ -0,0 +1,147 @@
+import os
+import hashlib
+import logging
+import tempfile
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+READ_SIZE = 1024 * 1024
+
+# Other processes may write to the same directory; rescan it this often
+# even while this process's running total is under the limit
+RESCAN_WRITES = 100
+
+
+def hash_bytes(*parts: bytes) -> str:
+    """Return a hex SHA-256 digest over the given byte strings."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def hash_file(path: str) -> str:
+    """Return a hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(READ_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    Size-bounded on-disk key/value cache with LRU eviction.
+
+    Each entry is a file named after its key. Reads refresh the file's
+    modification time, and writes evict the least recently used entries once
+    the directory exceeds ``max_bytes``. The directory size is tracked as a
+    running total (rescanned every RESCAN_WRITES writes to pick up other
+    processes' entries), so writes don't list the directory. Writes go
+    through a temp file and ``os.replace`` so concurrent processes never see
+    partial entries.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the cache entries (created if missing)
+            max_bytes: Maximum total size of the entries; 0 disables the cache
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None
+        self._writes = 0
+        if self.enabled:
+            os.makedirs(self.directory, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached value for the key, or None on a miss."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+            os.utime(path)
+            return value
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Cache read failed for {key}: {str(e)}")
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        """Store a value and evict old entries if the cache is over its size limit."""
+        if not self.enabled or len(value) > self.max_bytes:
+            return
+        path = self._path(key)
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            try:
+                replaced = os.path.getsize(path)
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except OSError as e:
+            logger.warning(f"Cache write failed for {key}: {str(e)}")
+            return
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+        self._writes += 1
+        if self._size is None or self._writes % RESCAN_WRITES == 0:
+            self._size = None
+        else:
+            self._size += len(value) - replaced
+        if self._size is None or self._size > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.startswith(".tmp-") or not entry.is_file():
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError as e:
+            logger.warning(f"Cache scan failed for {self.directory}: {str(e)}")
+            return
+
+        if total > self.max_bytes:
+            # Oldest access first
+            entries.sort()
+            for _, size, path in entries:
+                try:
+                    os.remove(path)
+                    total -= size
+                except FileNotFoundError:
+                    pass
+                if total <= self.max_bytes:
+                    break
+        self._size = total
@@ -1,17 +1,109 @@
+import os
+import hashlib
 import tempfile
+import zipfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional, Union
 from fastapi import UploadFile, File, HTTPException
-from PyPDF2 import PdfReader
-from docx import Document
+from app.utils.text_extraction import extract_pdf_pages, extract_text
 
-def parse_pdf(file_path: str) -> str:
+# Uploads are streamed in chunks into a spooled temp file: small files stay in
+# memory, larger ones roll over to disk, and nothing outlives the request
+UPLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_SPOOL_MAX_MEMORY = 1024 * 1024
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_MB", "10")) * 1024 * 1024
+
+# Extracted text of recent uploads by SHA-256, so the same resume uploaded
+# again (retries, several analyses of one file) isn't extracted twice
+PARSED_TEXT_CACHE_SIZE = int(os.getenv("PARSED_TEXT_CACHE_SIZE", "64"))
+_parsed_texts: "OrderedDict[str, str]" = OrderedDict()
+_parsed_texts_lock = threading.Lock()
+
+PDF_MAGIC = b"%PDF-"
+ZIP_MAGIC = b"PK\x03\x04"
+
+
+class SpooledUpload:
+    """An uploaded file streamed into a spooled temp file."""
+
+    def __init__(self, file: BinaryIO, size: int, sha256: str, file_type: Optional[str]):
+        self.file = file
+        self.size = size
+        self.sha256 = sha256
+        self.file_type = file_type
+
+
+def sniff_file_type(file: BinaryIO) -> Optional[str]:
+    """
+    Detect the real document type from its magic bytes.
+
+    Args:
+        file: Seekable binary file, rewound to the start afterwards
+
+    Returns:
+        "pdf", "docx" or None if the content is neither
+    """
+    file.seek(0)
+    head = file.read(8)
+    file.seek(0)
+
+    if head.startswith(PDF_MAGIC):
+        return "pdf"
+    if head.startswith(ZIP_MAGIC):
+        # DOCX is a zip archive; make sure it actually holds a Word document
+        try:
+            with zipfile.ZipFile(file) as archive:
+                if "word/document.xml" in archive.namelist():
+                    return "docx"
+        except zipfile.BadZipFile:
+            pass
+        finally:
+            file.seek(0)
+    return None
+
+
+@contextmanager
+def spooled_upload(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> Iterator[SpooledUpload]:
+    """
+    Stream an upload into a spooled temp file, hashing it on the way.
+
+    The upload is rejected with 413 as soon as it exceeds max_bytes, and the
+    temp file is always removed when the context exits.
+
+    Args:
+        file: The uploaded file
+        max_bytes: Maximum accepted upload size
+
+    Yields:
+        SpooledUpload with the rewound file, its size, SHA-256 and sniffed type
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_MEMORY)
     try:
-        text = ""
-        with open(file_path, 'rb') as f:
-            reader = PdfReader(f)
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text
+        digest = hashlib.sha256()
+        size = 0
+        while True:
+            chunk = file.file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large. Maximum size is {max_bytes // (1024 * 1024)}MB."
+                )
+            digest.update(chunk)
+            spool.write(chunk)
+
+        yield SpooledUpload(spool, size, digest.hexdigest(), sniff_file_type(spool))
+    finally:
+        spool.close()
+
+
+def parse_pdf(source: Union[str, BinaryIO]) -> str:
+    try:
+        text = extract_pdf_pages(source).text
         if not text:
             raise ValueError("No text could be extracted from the PDF.")
         return text
@@ -19,42 +111,50 @@ def parse_pdf(file_path: str) -> str:
         raise Exception(f"PDF parsing failed: {str(e)}")
 
 
-def parse_docx(file_path: str) -> str:
+def parse_docx(source: Union[str, BinaryIO]) -> str:
     try:
-        doc = Document(file_path)
-        text = "\n".join([para.text for para in doc.paragraphs if para.text.strip()])
+        text = extract_text(source, "docx")
         if not text:
             raise ValueError("No text found in the DOCX file.")
         return text
     except Exception as e:
         raise Exception(f"DOCX parsing failed: {str(e)}")
 
-def parser(file: UploadFile = File(...)):
-    # Ensure file has valid content
-    if file.content_type not in ["application/pdf",
-                                 "application/vnd.openxmlformats-officedocument.wordprocessingml.document"]:
-        raise HTTPException(status_code=400, detail="Unsupported file type. Upload a .pdf or .docx file.")
+def _cached_text(sha256: str) -> Optional[str]:
+    with _parsed_texts_lock:
+        text = _parsed_texts.get(sha256)
+        if text is not None:
+            _parsed_texts.move_to_end(sha256)
+        return text
 
-    # Save uploaded file temporarily
-    try:
-        suffix = ".pdf" if file.filename.endswith(".pdf") else ".docx"
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-            contents = file.file.read()
-            temp_file.write(contents)
-            temp_file_path = temp_file.name
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to save uploaded file: {str(e)}")
 
-    try:
-        # Determine file type and parse accordingly
-        if suffix == ".pdf":
-            return parse_pdf(temp_file_path)
-        elif suffix == ".docx":
-            return parse_docx(temp_file_path)
-        else:
-            raise HTTPException(status_code=400, detail="Unsupported file type.")
+def _cache_text(sha256: str, text: str) -> None:
+    if PARSED_TEXT_CACHE_SIZE <= 0:
+        return
+    with _parsed_texts_lock:
+        _parsed_texts[sha256] = text
+        _parsed_texts.move_to_end(sha256)
+        while len(_parsed_texts) > PARSED_TEXT_CACHE_SIZE:
+            _parsed_texts.popitem(last=False)
 
 
+def parser(file: UploadFile = File(...)):
+    try:
+        with spooled_upload(file) as upload:
+            # Trust the file's magic bytes rather than the client's content type
+            if upload.file_type not in ("pdf", "docx"):
+                raise HTTPException(status_code=400, detail="Unsupported file type. Upload a .pdf or .docx file.")
+            text = _cached_text(upload.sha256)
+            if text is None:
+                if upload.file_type == "pdf":
+                    text = parse_pdf(upload.file)
+                else:
+                    text = parse_docx(upload.file)
+                _cache_text(upload.sha256, text)
+            return text
+
+    except HTTPException:
+        raise
     except Exception as e:
 
         raise HTTPException(status_code=500, detail=f"Error during file processing: {str(e)}")
@@ -40,5 +40,6 @@ AVAILABLE_PROMPTS = [
     "interview_questions", 
     "mock_interview_scoring",
     "resume_improvement",
-    "resume_parsing"
+    "resume_parsing",
+    "resume_section_review"
 ]
@@ -0,0 +1,66 @@
+import os
+import time
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator
+
+
+class RateLimiter:
+    """
+    Thread-safe limit on concurrent and per-minute calls to an external API.
+
+    Callers wrap each request in ``with limiter.acquire():``. At most
+    ``max_concurrent`` requests run at once, and request starts are spaced
+    so no more than ``requests_per_minute`` begin in any minute.
+    """
+
+    def __init__(self, max_concurrent: int, requests_per_minute: int = 0):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrent: Maximum requests in flight at once
+            requests_per_minute: Maximum request starts per minute; 0 for no limit
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.requests_per_minute = requests_per_minute
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def _wait_for_turn(self) -> None:
+        if self.requests_per_minute <= 0:
+            return
+        interval = 60.0 / self.requests_per_minute
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + interval
+        if start > now:
+            time.sleep(start - now)
+
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        """Block until a request may start; release its slot when the block exits."""
+        self._slots.acquire()
+        try:
+            self._wait_for_turn()
+            yield
+        finally:
+            self._slots.release()
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter(name: str = "openai") -> RateLimiter:
+    """
+    Return the process-wide limiter for an API.
+
+    Limits are read from ``<NAME>_MAX_CONCURRENCY`` and
+    ``<NAME>_REQUESTS_PER_MINUTE`` (e.g. OPENAI_MAX_CONCURRENCY).
+    """
+    prefix = name.upper()
+    return RateLimiter(
+        max_concurrent=int(os.getenv(f"{prefix}_MAX_CONCURRENCY", "4")),
+        requests_per_minute=int(os.getenv(f"{prefix}_REQUESTS_PER_MINUTE", "0"))
+    )
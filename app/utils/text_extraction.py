@@ -0,0 +1,193 @@
+import os
+import logging
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+Source = Union[str, BinaryIO]
+
+# Fast backend tried first, and the layout-aware backend used when its output
+# looks broken (glued words, undecoded glyphs, control characters)
+DEFAULT_PDF_BACKEND = os.getenv("PDF_TEXT_BACKEND", "pypdf2")
+FALLBACK_PDF_BACKEND = os.getenv("PDF_FALLBACK_BACKEND", "pdfplumber")
+MIN_TEXT_QUALITY = float(os.getenv("PDF_MIN_TEXT_QUALITY", "0.8"))
+
+
+def _rewind(source: Source) -> Source:
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+class PdfBackend(ABC):
+    """Base class for PDF text extraction backends."""
+
+    name = ""
+
+    @abstractmethod
+    def page_count(self, source: Source) -> int:
+        """Return the number of pages in the PDF."""
+
+    @abstractmethod
+    def extract_pages(self, source: Source, page_numbers: Optional[List[int]] = None) -> List[str]:
+        """
+        Extract the text of the given pages (all pages by default).
+
+        Returns:
+            One string per requested page, empty for pages without a text layer
+        """
+
+
+class PyPDF2Backend(PdfBackend):
+    """Fast extraction from the PDF text layer with PyPDF2."""
+
+    name = "pypdf2"
+
+    def page_count(self, source: Source) -> int:
+        from PyPDF2 import PdfReader
+        return len(PdfReader(_rewind(source)).pages)
+
+    def extract_pages(self, source: Source, page_numbers: Optional[List[int]] = None) -> List[str]:
+        from PyPDF2 import PdfReader
+        reader = PdfReader(_rewind(source))
+        if page_numbers is None:
+            page_numbers = range(len(reader.pages))
+        return [reader.pages[n].extract_text() or "" for n in page_numbers]
+
+
+class PdfplumberBackend(PdfBackend):
+    """Slower, layout-aware extraction with pdfplumber."""
+
+    name = "pdfplumber"
+
+    def page_count(self, source: Source) -> int:
+        import pdfplumber
+        with pdfplumber.open(_rewind(source)) as pdf:
+            return len(pdf.pages)
+
+    def extract_pages(self, source: Source, page_numbers: Optional[List[int]] = None) -> List[str]:
+        import pdfplumber
+        with pdfplumber.open(_rewind(source)) as pdf:
+            if page_numbers is None:
+                page_numbers = range(len(pdf.pages))
+            return [pdf.pages[n].extract_text() or "" for n in page_numbers]
+
+
+PDF_BACKENDS: Dict[str, PdfBackend] = {
+    backend.name: backend for backend in (PyPDF2Backend(), PdfplumberBackend())
+}
+
+
+def get_backend(name: str) -> PdfBackend:
+    """Return a registered PDF backend by name."""
+    try:
+        return PDF_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown PDF text backend: {name}. Available: {', '.join(PDF_BACKENDS)}")
+
+
+def text_quality(pages: List[str]) -> float:
+    """
+    Score extracted text between 0 and 1.
+
+    Pages without text are ignored (they need OCR, not another backend). The
+    score drops for undecoded glyphs like "(cid:12)", non-printable
+    characters and words glued together by a lost layout.
+    """
+    text = "".join(page for page in pages if page.strip())
+    if not text:
+        return 1.0
+
+    printable = sum(1 for ch in text if ch.isprintable() or ch in "\n\t")
+    score = printable / len(text)
+
+    cid_count = text.count("(cid:")
+    if cid_count:
+        score *= max(0.0, 1 - 10 * cid_count / max(1, len(text.split())))
+
+    words = text.split()
+    avg_word_len = sum(len(word) for word in words) / len(words) if words else 0
+    if avg_word_len > 12:
+        score *= 12 / avg_word_len
+
+    return round(score, 3)
+
+
+class ExtractionResult:
+    """Pages extracted from a document and the backend that produced them."""
+
+    def __init__(self, pages: List[str], backend: str, quality: float):
+        self.pages = pages
+        self.backend = backend
+        self.quality = quality
+
+    @property
+    def text(self) -> str:
+        return "\n".join(page for page in self.pages if page)
+
+
+def extract_pdf_pages(source: Source, backend: Optional[str] = None) -> ExtractionResult:
+    """
+    Extract the pages of a PDF, choosing the backend per document.
+
+    The fast default backend runs first. If its text scores below
+    MIN_TEXT_QUALITY, the layout-aware fallback is tried and the better
+    result is kept.
+
+    Args:
+        source: Path or binary file object
+        backend: Force a specific backend instead of selecting one
+
+    Returns:
+        ExtractionResult with one text entry per page
+    """
+    if backend:
+        pages = get_backend(backend).extract_pages(source)
+        return ExtractionResult(pages, backend, text_quality(pages))
+
+    pages = get_backend(DEFAULT_PDF_BACKEND).extract_pages(source)
+    result = ExtractionResult(pages, DEFAULT_PDF_BACKEND, text_quality(pages))
+    if result.quality >= MIN_TEXT_QUALITY or FALLBACK_PDF_BACKEND == DEFAULT_PDF_BACKEND:
+        return result
+
+    try:
+        fallback_pages = get_backend(FALLBACK_PDF_BACKEND).extract_pages(source)
+    except Exception as e:
+        logger.warning(f"Fallback PDF backend {FALLBACK_PDF_BACKEND} failed: {str(e)}")
+        return result
+    fallback = ExtractionResult(fallback_pages, FALLBACK_PDF_BACKEND, text_quality(fallback_pages))
+    return fallback if fallback.quality > result.quality else result
+
+
+def extract_text(source: Source, file_type: str) -> str:
+    """
+    Extract plain text from a document.
+
+    Args:
+        source: Path or binary file object
+        file_type: "pdf", "docx" or "txt"
+
+    Returns:
+        The document text
+    """
+    if file_type == "pdf":
+        return extract_pdf_pages(source).text
+    if file_type == "docx":
+        from docx import Document
+        doc = Document(_rewind(source))
+        return "\n".join(para.text for para in doc.paragraphs if para.text.strip())
+    if file_type == "txt":
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                content = f.read()
+        else:
+            content = _rewind(source).read()
+        try:
+            return content.decode("utf-8")
+        except UnicodeDecodeError:
+            import chardet
+            encoding = chardet.detect(content)["encoding"] or "latin-1"
+            return content.decode(encoding, errors="replace")
+    raise ValueError(f"Unsupported file type: {file_type}")
+
@@ -0,0 +1,180 @@
+"""
+Synthetic resume corpus for parser benchmarks.
+
+Generates PDF and DOCX resumes of varying length and layout with the same
+exporters the resume builder uses (app/utils/resume_export.py), plus
+image-only "scanned" PDFs that exercise the OCR path.
+
+Usage:
+    python -m benchmarks.corpus <output_dir> [--count 60] [--seed 0]
+"""
+import io
+import os
+import sys
+import json
+import random
+import argparse
+from typing import Any, Dict, List
+
+from app.utils.resume_export import generate_resume_pdf, generate_resume_docx
+
+LENGTHS = {"short": (1, 2), "medium": (3, 4), "long": (8, 6)}  # (jobs, bullets per job)
+LAYOUTS = ("classic", "titled", "reordered")
+FORMATS = ("pdf", "docx", "scanned_pdf")
+
+FIRST_NAMES = ["Alex", "Jordan", "Priya", "Wei", "Maria", "Samuel", "Aisha", "Kenji", "Lucia", "Omar"]
+LAST_NAMES = ["Tan", "Garcia", "Nguyen", "Smith", "Okafor", "Kumar", "Lee", "Silva", "Cohen", "Park"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Tech", "Hooli"]
+TITLES = ["Software Engineer", "Data Analyst", "Backend Developer", "ML Engineer", "Product Intern"]
+SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "React", "Node.js", "Django", "FastAPI", "SQL",
+    "PostgreSQL", "MongoDB", "Docker", "Kubernetes", "AWS", "GCP", "Terraform", "Git", "Pandas",
+    "NumPy", "TensorFlow", "PyTorch", "Spark", "Kafka", "Redis", "GraphQL", "CI/CD"
+]
+VERBS = ["Built", "Designed", "Led", "Optimised", "Migrated", "Automated", "Shipped", "Scaled"]
+OBJECTS = [
+    "a REST API serving 2M requests/day", "the data pipeline on {skill}", "a {skill} service",
+    "internal dashboards with {skill}", "CI/CD for 12 microservices", "a recommendation model in {skill}"
+]
+
+HEADERS = {
+    "classic": {"summary": "PROFESSIONAL SUMMARY", "education": "EDUCATION", "experience": "EXPERIENCE",
+                "skills": "SKILLS", "projects": "PROJECTS"},
+    "titled": {"summary": "Summary", "education": "Education", "experience": "Work Experience",
+               "skills": "Technical Skills", "projects": "Projects"},
+    "reordered": {"summary": "Profile", "education": "Academic Background", "experience": "Professional Experience",
+                  "skills": "Core Competencies", "projects": "Personal Projects"},
+}
+
+
+def generate_resume_text(rng: random.Random, length: str, layout: str) -> Dict[str, Any]:
+    """Generate resume text plus the ground truth it was built from."""
+    jobs, bullets = LENGTHS[length]
+    headers = HEADERS[layout]
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    skills = rng.sample(SKILLS, k=rng.randint(5, 12))
+
+    sections = {
+        "summary": [
+            f"{rng.choice(TITLES)} with {rng.randint(1, 10)} years of experience building reliable "
+            f"software with {skills[0]} and {skills[1]}, focused on measurable impact and clean design."
+        ],
+        "education": [
+            "Bachelor of Science in Computer Science",
+            f"National University, {rng.randint(2010, 2020)} - {rng.randint(2021, 2024)}",
+            f"GPA: {rng.uniform(3.0, 4.0):.2f}",
+        ],
+        "skills": [", ".join(skills)],
+        "experience": [],
+        "projects": [
+            f"- {rng.choice(VERBS)} {rng.choice(OBJECTS).format(skill=rng.choice(skills))}"
+            for _ in range(max(1, jobs // 2))
+        ],
+    }
+    for _ in range(jobs):
+        start = rng.randint(2012, 2022)
+        sections["experience"] += [
+            rng.choice(TITLES),
+            f"{rng.choice(COMPANIES)}, Singapore Jan {start} - Dec {start + rng.randint(1, 2)}",
+        ]
+        sections["experience"] += [
+            f"- {rng.choice(VERBS)} {rng.choice(OBJECTS).format(skill=rng.choice(skills))}"
+            for _ in range(bullets)
+        ]
+        sections["experience"].append("")
+
+    order = ["summary", "education", "experience", "skills", "projects"]
+    if layout == "reordered":
+        rng.shuffle(order)
+
+    lines = [name.upper(), f"{name.split()[0].lower()}@example.com | +65 9123 4567", ""]
+    for key in order:
+        lines.append(headers[key])
+        lines.extend(sections[key])
+        lines.append("")
+
+    return {"name": name, "skills": skills, "text": "\n".join(lines)}
+
+
+def render_scanned_pdf(text: str) -> bytes:
+    """Render text to images and wrap them in an image-only PDF."""
+    from PIL import Image, ImageDraw
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.utils import ImageReader
+    from reportlab.pdfgen import canvas
+
+    width, height, line_height, margin = 1275, 1650, 28, 80
+    lines_per_page = (height - 2 * margin) // line_height
+    lines = text.split("\n")
+
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=letter)
+    for start in range(0, len(lines), lines_per_page):
+        image = Image.new("L", (width, height), 255)
+        draw = ImageDraw.Draw(image)
+        for i, line in enumerate(lines[start:start + lines_per_page]):
+            draw.text((margin, margin + i * line_height), line, fill=0)
+        pdf.drawImage(ImageReader(image), 0, 0, width=letter[0], height=letter[1])
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def generate_corpus(output_dir: str, count: int = 60, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Write a synthetic resume corpus and its manifest.
+
+    Resumes cycle through every length, layout and format combination.
+
+    Args:
+        output_dir: Directory to write the resumes and manifest.json to
+        count: Number of resumes to generate
+        seed: Random seed, so corpora are reproducible
+
+    Returns:
+        The manifest entries (file, format, length, layout, name, skills)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    rng = random.Random(seed)
+    combos = [(f, l, y) for f in FORMATS for l in LENGTHS for y in LAYOUTS]
+    manifest = []
+
+    for i in range(count):
+        file_format, length, layout = combos[i % len(combos)]
+        resume = generate_resume_text(rng, length, layout)
+        extension = "docx" if file_format == "docx" else "pdf"
+        file_name = f"resume_{i:04d}_{file_format}_{length}_{layout}.{extension}"
+
+        if file_format == "pdf":
+            content = generate_resume_pdf(resume["text"], resume["name"])
+        elif file_format == "docx":
+            content = generate_resume_docx(resume["text"], resume["name"])
+        else:
+            content = render_scanned_pdf(resume["text"])
+
+        with open(os.path.join(output_dir, file_name), "wb") as f:
+            f.write(content)
+        manifest.append({
+            "file": file_name,
+            "format": file_format,
+            "length": length,
+            "layout": layout,
+            "name": resume["name"],
+            "skills": resume["skills"],
+        })
+
+    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Generate a synthetic resume corpus.")
+    arg_parser.add_argument("output_dir")
+    arg_parser.add_argument("--count", type=int, default=60)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    entries = generate_corpus(args.output_dir, args.count, args.seed)
+    print(f"Wrote {len(entries)} resumes to {args.output_dir}")
+    sys.exit(0)
@@ -0,0 +1,92 @@
+"""
+PDF text extraction backend benchmark.
+
+Times every backend registered in app.utils.text_extraction on the given
+PDFs and reports pages/sec, the text_quality score and, when a
+``<name>.txt`` reference sits next to ``<name>.pdf``, word recall against it.
+
+Usage:
+    python -m benchmarks.pdf_backends resume1.pdf resume2.pdf --repeat 5
+"""
+import io
+import os
+import sys
+import time
+import logging
+import argparse
+from collections import Counter
+from typing import Dict, List
+
+from app.utils.text_extraction import PDF_BACKENDS, text_quality
+
+logger = logging.getLogger(__name__)
+
+
+def reference_recall(pages: List[str], reference: str) -> float:
+    """Fraction of reference words (by count) found in the extracted text."""
+    expected = Counter(reference.lower().split())
+    if not expected:
+        return 1.0
+    found = Counter(" ".join(pages).lower().split())
+    hits = sum(min(count, found[word]) for word, count in expected.items())
+    return hits / sum(expected.values())
+
+
+def benchmark_backends(paths: List[str], repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmark every PDF backend on the given files.
+
+    Args:
+        paths: PDF files to extract
+        repeat: Number of timed runs per file and backend
+
+    Returns:
+        Dictionary of backend name -> pages_per_sec, quality, recall
+    """
+    report: Dict[str, Dict[str, float]] = {}
+    for name, backend in PDF_BACKENDS.items():
+        pages_total = 0
+        seconds = 0.0
+        qualities: List[float] = []
+        recalls: List[float] = []
+        for path in paths:
+            with open(path, "rb") as f:
+                data = f.read()
+            try:
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    pages = backend.extract_pages(io.BytesIO(data))
+                    seconds += time.perf_counter() - start
+                    pages_total += len(pages)
+            except Exception as e:
+                logger.warning(f"{name} failed on {path}: {str(e)}")
+                continue
+            qualities.append(text_quality(pages))
+            reference_path = os.path.splitext(path)[0] + ".txt"
+            if os.path.exists(reference_path):
+                with open(reference_path, "r", encoding="utf-8") as f:
+                    recalls.append(reference_recall(pages, f.read()))
+
+        report[name] = {
+            "pages_per_sec": pages_total / seconds if seconds else 0.0,
+            "quality": sum(qualities) / len(qualities) if qualities else 0.0,
+            "recall": sum(recalls) / len(recalls) if recalls else float("nan"),
+        }
+    return report
+
+
+def main(argv: List[str] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Benchmark PDF text extraction backends.")
+    arg_parser.add_argument("pdfs", nargs="+", help="PDF files to extract")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Timed runs per file and backend")
+    args = arg_parser.parse_args(argv)
+
+    results = benchmark_backends(args.pdfs, args.repeat)
+    print(f"{'backend':<12} {'pages/sec':>10} {'quality':>8} {'recall':>8}")
+    for backend_name, stats in results.items():
+        print(f"{backend_name:<12} {stats['pages_per_sec']:>10.1f} {stats['quality']:>8.3f} {stats['recall']:>8.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
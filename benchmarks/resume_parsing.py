@@ -0,0 +1,202 @@
+"""
+Resume parsing benchmark harness.
+
+Runs ResumeParser and file_utils.parser over a synthetic corpus (see
+benchmarks/corpus.py) and reports p50/p95 per stage (extract, segment,
+skills, nlp, upload) plus peak memory. Results can be saved as a baseline,
+and later runs fail when a stage's p95 or peak memory regresses past the
+threshold.
+
+Usage:
+    python -m benchmarks.resume_parsing --corpus /tmp/resume_corpus --generate 60
+    python -m benchmarks.resume_parsing --corpus /tmp/resume_corpus --save-baseline baseline.json
+    python -m benchmarks.resume_parsing --corpus /tmp/resume_corpus --baseline baseline.json
+"""
+import io
+import os
+import sys
+import json
+import time
+import resource
+import argparse
+import tracemalloc
+from typing import Any, Dict, List
+
+from fastapi import HTTPException, UploadFile
+
+from app.services import resume_parser
+from app.services.resume_parser import ResumeParser
+from app.services.skill_matcher import get_skill_matcher
+from app.utils import file_utils
+from benchmarks.corpus import generate_corpus
+
+STAGES = ("extract", "segment", "skills", "nlp", "upload", "total")
+
+# Ignore p95 differences below this many seconds; they are timer noise
+MIN_REGRESSION_SECONDS = 0.001
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def run_one(path: str) -> Dict[str, float]:
+    """Run every parsing stage on one resume and return seconds per stage."""
+    parser = ResumeParser(path)
+
+    start = time.perf_counter()
+    parser._extract_skills()
+    skills_seconds = time.perf_counter() - start
+
+    parser.doc
+
+    with open(path, "rb") as f:
+        upload = UploadFile(file=io.BytesIO(f.read()), filename=os.path.basename(path))
+    start = time.perf_counter()
+    try:
+        file_utils.parser(upload)
+    except HTTPException:
+        # Scanned PDFs have no text layer for the upload path; still timed
+        pass
+    upload_seconds = time.perf_counter() - start
+
+    timings = {
+        "extract": parser.timings.get("extract", 0.0),
+        "segment": parser.timings.get("segment", 0.0),
+        "skills": skills_seconds,
+        "nlp": parser.timings.get("nlp", 0.0),
+        "upload": upload_seconds,
+    }
+    timings["total"] = sum(timings.values())
+    return timings
+
+
+def run_benchmark(corpus_dir: str, repeat: int = 1) -> Dict[str, Any]:
+    """
+    Benchmark the corpus described by corpus_dir/manifest.json.
+
+    Args:
+        corpus_dir: Directory produced by benchmarks.corpus
+        repeat: Timed passes over the corpus
+
+    Returns:
+        Report with p50/p95 seconds per stage, per-format totals and memory
+    """
+    with open(os.path.join(corpus_dir, "manifest.json"), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    paths = [(os.path.join(corpus_dir, entry["file"]), entry["format"]) for entry in manifest]
+
+    # Warm the per-process handles so first-use costs don't skew the numbers
+    get_skill_matcher()
+    resume_parser.warm_nlp()
+
+    samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+    by_format: Dict[str, List[float]] = {}
+    for _ in range(repeat):
+        for path, file_format in paths:
+            timings = run_one(path)
+            for stage in STAGES:
+                samples[stage].append(timings[stage])
+            by_format.setdefault(file_format, []).append(timings["total"])
+
+    # Separate pass for memory, since tracing slows everything down
+    tracemalloc.start()
+    peak_python = 0
+    for path, _ in paths:
+        tracemalloc.reset_peak()
+        run_one(path)
+        peak_python = max(peak_python, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    return {
+        "resumes": len(paths),
+        "repeat": repeat,
+        "stages": {
+            stage: {"p50": percentile(values, 50), "p95": percentile(values, 95)}
+            for stage, values in samples.items()
+        },
+        "formats": {
+            file_format: {"p50": percentile(values, 50), "p95": percentile(values, 95)}
+            for file_format, values in by_format.items()
+        },
+        "peak_python_mb": peak_python / (1024 * 1024),
+        # ru_maxrss is reported in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def find_regressions(report: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Return a message for every stage p95 or memory figure worse than baseline by more than threshold."""
+    regressions = []
+    for stage, stats in report["stages"].items():
+        base = baseline.get("stages", {}).get(stage)
+        if not base:
+            continue
+        current, previous = stats["p95"], base["p95"]
+        if current > previous * (1 + threshold) and current - previous > MIN_REGRESSION_SECONDS:
+            regressions.append(f"{stage}: p95 {1000 * current:.1f}ms vs baseline {1000 * previous:.1f}ms")
+
+    previous_memory = baseline.get("peak_python_mb")
+    if previous_memory and report["peak_python_mb"] > previous_memory * (1 + threshold):
+        regressions.append(
+            f"peak python memory: {report['peak_python_mb']:.1f}MB vs baseline {previous_memory:.1f}MB"
+        )
+    return regressions
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"{report['resumes']} resumes x {report['repeat']} passes")
+    print(f"{'stage':<10} {'p50 ms':>10} {'p95 ms':>10}")
+    for stage, stats in report["stages"].items():
+        print(f"{stage:<10} {1000 * stats['p50']:>10.2f} {1000 * stats['p95']:>10.2f}")
+    print(f"{'format':<12} {'p50 ms':>8} {'p95 ms':>10}")
+    for file_format, stats in report["formats"].items():
+        print(f"{file_format:<12} {1000 * stats['p50']:>8.2f} {1000 * stats['p95']:>10.2f}")
+    print(f"peak python memory: {report['peak_python_mb']:.1f}MB, peak RSS: {report['peak_rss_mb']:.1f}MB")
+
+
+def main(argv: List[str] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Benchmark resume parsing.")
+    arg_parser.add_argument("--corpus", required=True, help="Corpus directory (with manifest.json)")
+    arg_parser.add_argument("--generate", type=int, default=0, help="Generate a corpus of N resumes first")
+    arg_parser.add_argument("--seed", type=int, default=0, help="Seed for corpus generation")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Timed passes over the corpus")
+    arg_parser.add_argument("--pdf-workers", type=int, default=1,
+                            help="PDF page pool size (1 keeps all work in-process for stable numbers)")
+    arg_parser.add_argument("--baseline", help="Baseline report to compare against")
+    arg_parser.add_argument("--save-baseline", help="Write this run's report as a baseline")
+    arg_parser.add_argument("--threshold", type=float, default=0.2, help="Allowed regression ratio (0.2 = 20%%)")
+    args = arg_parser.parse_args(argv)
+
+    if args.generate:
+        generate_corpus(args.corpus, args.generate, args.seed)
+    resume_parser.PDF_WORKERS = args.pdf_workers
+
+    report = run_benchmark(args.corpus, args.repeat)
+    print_report(report)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(report, baseline, args.threshold)
+        if regressions:
+            print("\nREGRESSIONS:")
+            for message in regressions:
+                print(f"  - {message}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""
+Unit tests for the compact resume context used in interview prompts.
+"""
+from app.services.resume_context import CHARS_PER_TOKEN, encode_resume_context
+
+RESUME = """Jane Doe
+jane@example.com | 555-0100
+
+Summary
+Backend engineer focused on payments. Enjoys mentoring.
+
+Skills
+Python, SQL, Kubernetes
+
+Internships
+Acme Corp - Software Intern
+Built a billing reconciliation service
+
+Leadership
+President of the robotics club
+"""
+
+
+def test_known_sections_are_encoded():
+    context = encode_resume_context(RESUME)
+    assert "Name: Jane Doe" in context
+    assert "Headline: Backend engineer focused on payments." in context
+    assert "Skills: Python, SQL, Kubernetes" in context
+    assert "jane@example.com" not in context
+
+
+def test_experience_like_headers_count_as_experience():
+    context = encode_resume_context(RESUME)
+    assert "Experience:\n- Acme Corp - Software Intern" in context
+
+
+def test_unclassified_sections_are_kept():
+    assert "Leadership:\n- President of the robotics club" in encode_resume_context(RESUME)
+
+
+def test_context_fits_the_token_budget():
+    long_resume = RESUME + "\nExperience\n" + "\n".join(f"Shipped feature number {i}" for i in range(500))
+    assert len(encode_resume_context(long_resume, max_tokens=100)) <= 100 * CHARS_PER_TOKEN
+
+
+def test_structured_resume_is_flattened():
+    context = encode_resume_context({"name": "Jane Doe", "skills": ["Python"]})
+    assert "Jane Doe" in context and "Python" in context
+
+
+def test_empty_resume_has_no_context():
+    assert encode_resume_context(None) == ""
+    assert encode_resume_context("") == ""
@@ -0,0 +1,63 @@
+"""
+Unit tests for the resume parser's single-pass section index.
+"""
+import pytest
+
+from app.services.resume_parser import EXPERIENCE_HEADERS, SKILL_HEADERS, ResumeParser
+
+RESUME = """Jane Doe
+jane@example.com
+
+Summary
+Backend engineer.
+
+Work Experience
+Acme Corp - Engineer
+Built billing APIs.
+
+Technical Skills
+Python, SQL
+
+Hobbies
+Chess
+
+Skills
+Go, Rust
+
+Skills
+Java, Scala
+"""
+
+
+@pytest.fixture
+def parser(tmp_path):
+    path = tmp_path / "resume.txt"
+    path.write_text(RESUME)
+    return ResumeParser(str(path))
+
+
+def test_index_maps_known_headers_to_their_span(parser):
+    header_idx, start_idx, end_idx = parser._section_index["work experience"]
+    assert parser.lines[header_idx] == "Work Experience"
+    assert parser.lines[start_idx] == "Acme Corp - Engineer"
+    assert parser.lines[end_idx] == "Technical Skills"
+
+
+def test_unknown_header_ends_the_open_section(parser):
+    assert parser._find_section(SKILL_HEADERS) == "Python, SQL"
+
+
+def test_find_section_returns_the_section_text(parser):
+    assert parser._find_section(EXPERIENCE_HEADERS) == "Acme Corp - Engineer\nBuilt billing APIs."
+
+
+def test_earliest_matching_header_wins(parser):
+    assert parser._find_section(["skills", "technical skills"]) == "Python, SQL"
+
+
+def test_first_occurrence_of_a_header_wins(parser):
+    assert parser._find_section(["skills"]) == "Go, Rust"
+
+
+def test_missing_section_is_none(parser):
+    assert parser._find_section(["projects"]) is None
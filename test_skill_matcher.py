@@ -0,0 +1,47 @@
+"""
+Unit tests for the Aho-Corasick skill matcher.
+"""
+from app.services.skill_matcher import SkillMatcher, get_skill_matcher, load_skill_taxonomy
+
+
+def test_terms_match_on_word_boundaries():
+    matcher = SkillMatcher({"java": "java", "javascript": "javascript", "go": "go"})
+    assert matcher.find_skills("JavaScript and Java, no Golang") == {"java", "javascript"}
+
+
+def test_aliases_map_to_the_canonical_skill():
+    matcher = SkillMatcher({"postgres": "postgresql", "postgresql": "postgresql"})
+    assert matcher.find_skills("Tuned Postgres queries") == {"postgresql"}
+
+
+def test_punctuated_terms_match_next_to_punctuation():
+    matcher = SkillMatcher({"c++": "c++", ".net": ".net", "c#": "c#"})
+    assert matcher.find_skills("Wrote C++/.NET services.") == {"c++", ".net"}
+
+
+def test_overlapping_terms_are_all_found():
+    matcher = SkillMatcher({"machine learning": "machine learning", "learning": "learning"})
+    assert matcher.find_skills("applied machine learning") == {"machine learning", "learning"}
+
+
+def test_empty_text_has_no_skills():
+    assert SkillMatcher({"python": "python"}).find_skills("") == set()
+
+
+def test_default_taxonomy_is_built_once():
+    assert get_skill_matcher() is get_skill_matcher()
+    assert "python" in get_skill_matcher().find_skills("Python developer")
+
+
+def test_case_sensitive_terms_only_match_in_their_case():
+    matcher = SkillMatcher({"Go": "go", "golang": "go", "python": "python"})
+    assert matcher.find_skills("Ready to go to market in PYTHON") == {"python"}
+    assert matcher.find_skills("Services in Go and golang") == {"go"}
+
+
+def test_taxonomy_skips_english_words_in_prose(tmp_path):
+    path = tmp_path / "skills.txt"
+    path.write_text("=Go: golang\n=Spring: spring framework\nless\n")
+    terms = load_skill_taxonomy([str(path)])
+    assert terms == {"Go": "go", "golang": "go", "Spring": "spring", "spring framework": "spring", "less": "less"}
+    assert SkillMatcher(terms).find_skills("go in spring with Spring") == {"spring"}
@@ -0,0 +1,67 @@
+"""
+Unit tests for chunked transcription planning and transcript merging.
+"""
+from unittest import mock
+
+from app.stt import transcription
+from app.stt.transcription import OVERLAP_SECONDS, merge_transcripts, plan_chunks, transcribe_long_audio
+
+
+def _assert_covers(chunks, duration):
+    assert chunks[0][0] == 0.0
+    assert chunks[-1][1] == duration
+    for (_, end), (start, _) in zip(chunks, chunks[1:]):
+        # Neighbouring chunks overlap, so no audio falls between them
+        assert start < end
+
+
+def test_short_audio_is_one_chunk():
+    assert plan_chunks(90.0, [], chunk_seconds=120) == [(0.0, 90.0)]
+
+
+def test_chunks_cover_the_whole_duration_without_silences():
+    chunks = plan_chunks(600.0, [], chunk_seconds=120)
+    _assert_covers(chunks, 600.0)
+    assert all(end - start <= 120 * 1.25 + 2 * OVERLAP_SECONDS for start, end in chunks)
+
+
+def test_chunks_are_cut_in_the_silence_closest_to_the_target():
+    silences = [(70.0, 71.0), (118.0, 122.0), (140.0, 141.0)]
+    chunks = plan_chunks(200.0, silences, chunk_seconds=120)
+    _assert_covers(chunks, 200.0)
+    assert chunks[0] == (0.0, 120.0 + OVERLAP_SECONDS)
+    assert chunks[1][0] == 120.0 - OVERLAP_SECONDS
+
+
+def test_merge_drops_words_repeated_across_the_overlap():
+    merged = merge_transcripts([
+        "I led the migration to the new billing system.",
+        "Billing system, and then I trained the support team.",
+    ])
+    assert merged == "I led the migration to the new billing system. and then I trained the support team."
+
+
+def test_merge_keeps_a_single_repeated_short_word():
+    assert merge_transcripts(["We shipped it", "it was late"]) == "We shipped it it was late"
+
+
+def test_merge_skips_empty_chunks():
+    assert merge_transcripts(["", "Hello there", None, "there friend"]) == "Hello there friend"
+
+
+def test_short_audio_skips_silence_detection(tmp_path):
+    audio = tmp_path / "answer.ogg"
+    audio.write_bytes(b"x" * 1000)
+    with mock.patch.object(transcription, "probe_duration", return_value=30.0), \
+            mock.patch.object(transcription, "analyze_silences") as analyze:
+        assert transcribe_long_audio(str(audio), lambda path: "hello", chunk_seconds=120) == "hello"
+    analyze.assert_not_called()
+
+
+def test_unknown_duration_falls_back_to_silence_detection(tmp_path):
+    audio = tmp_path / "answer.ogg"
+    audio.write_bytes(b"x" * 1000)
+    with mock.patch.object(transcription, "probe_duration", return_value=None), \
+            mock.patch.object(transcription, "analyze_silences", return_value=(30.0, [])) as analyze:
+        assert transcribe_long_audio(str(audio), lambda path: "hello", chunk_seconds=120) == "hello"
+    analyze.assert_called_once()
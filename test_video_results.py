@@ -0,0 +1,94 @@
+"""
+Tests for the ETag / 304 path of the video interview batch results endpoint.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base, get_db
+from app.models.video_interview import DBVideoInterview, DBVideoJob
+from app.routers import video_interview
+from app.routers.auth import get_current_active_user
+from app.schemas.auth import User
+
+URL = "/api/video-interview/results/batch"
+
+
+@pytest.fixture
+def client_and_db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine, tables=[DBVideoInterview.__table__, DBVideoJob.__table__])
+    TestSession = sessionmaker(bind=engine)
+
+    def override_get_db():
+        db = TestSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(video_interview.router, prefix="/api/video-interview")
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_active_user] = lambda: User(username="jane")
+
+    db = TestSession()
+    db.add(DBVideoInterview(session_id="s1", user_id="jane", status="processing", question_text="Q1"))
+    db.add(DBVideoJob(session_id="s1", status="running", stage="extracting_audio", progress=10))
+    db.commit()
+    yield TestClient(app), db
+    db.close()
+
+
+def test_unchanged_batch_returns_304(client_and_db):
+    client, _ = client_and_db
+    first = client.post(URL, json=["s1"])
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    second = client.post(URL, json=["s1"], headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+
+def test_unchanged_batch_skips_loading_results(client_and_db, monkeypatch):
+    client, _ = client_and_db
+    etag = client.post(URL, json=["s1"]).headers["etag"]
+
+    def fail(*args):
+        raise AssertionError("full results loaded for an unchanged batch")
+
+    monkeypatch.setattr(video_interview, "_load_batch_results", fail)
+    assert client.post(URL, json=["s1"], headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_job_progress_changes_etag(client_and_db):
+    client, db = client_and_db
+    etag = client.post(URL, json=["s1"]).headers["etag"]
+
+    db.query(DBVideoJob).filter(DBVideoJob.session_id == "s1").update({"stage": "transcribing", "progress": 40})
+    db.commit()
+
+    response = client.post(URL, json=["s1"], headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_changed_batch_returns_new_body(client_and_db):
+    client, db = client_and_db
+    etag = client.post(URL, json=["s1"]).headers["etag"]
+
+    db.query(DBVideoInterview).filter(DBVideoInterview.session_id == "s1").update(
+        {"status": "completed", "transcript": "Hello"}
+    )
+    db.commit()
+
+    response = client.post(URL, json=["s1"], headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["completed"] == 1